@@ -0,0 +1,113 @@
+"""
+Benchmark the polarity-aware encoding against fully defined subformulas.
+
+The three scenarios of test_complex_fol are scaled up to n existing
+constants with sparse truth tables, leaving most atoms to the solver.
+"full" defines every reified subformula in both directions, as solution
+enumeration does; "polarity" only in the direction it is used in, as
+every other solve does. Both are solved single-threaded.
+
+    python3 benchmarks/bench_encoding.py [max_n]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ortools.sat.python import cp_model  # noqa: E402
+
+from fol_csp_solver import FOLCSPSolver  # noqa: E402
+
+SCENARIOS = {
+    "family": (
+        {"God": 1, "Parent": 2, "Sibling": 2},
+        [
+            "forall(x) forall(y) Sibling(x,y) -> God(x) && God(y)",
+            "forall(x) forall(y) Parent(x,y) -> God(x) && God(y)",
+            "Parent(C0,NewConstant1) && Parent(C1,NewConstant1)",
+        ],
+    ),
+    "hierarchy": (
+        {"Reports": 2, "HasAuthority": 2},
+        [
+            "forall(x) forall(y) Reports(x,y) -> HasAuthority(y,x)",
+            "forall(x) forall(y) forall(z)"
+            " (Reports(x,y) && Reports(y,z)) -> HasAuthority(z,x)",
+            "Reports(NewConstant1,C1) && !Reports(NewConstant1,C0)",
+        ],
+    ),
+    "types": (
+        {"IsHuman": 1, "IsTool": 1, "IsLocation": 1, "Uses": 2, "At": 2},
+        [
+            "forall(x) forall(y) Uses(x,y) -> IsHuman(x) && IsTool(y)",
+            "forall(x) forall(y) At(x,y) -> (IsHuman(x) || IsTool(x))"
+            " && IsLocation(y)",
+            "IsHuman(NewConstant1) && Uses(NewConstant1,C1) && At(NewConstant1,C2)",
+        ],
+    ),
+}
+
+
+def solver_for(scenario, n, rng):
+    arities, codes = SCENARIOS[scenario]
+    names = [f"C{i}" for i in range(n)]
+    predicates = []
+    for name, arity in arities.items():
+        keys = [",".join(rng.choice(names) for _ in range(arity)) for _ in range(n)]
+        predicates.append(
+            {
+                "name": name,
+                "data": {"paramCount": arity, "truthTable": {k: True for k in keys}},
+                "negated": False,
+            }
+        )
+    constants = [{"id": i, "name": name} for i, name in enumerate(names)]
+    constraints = [{"code": code, "enabled": True} for code in codes]
+    return FOLCSPSolver(constants, predicates, [], constraints, grounding_cache=None)
+
+
+def run(solver, polarity_aware):
+    start = time.perf_counter()
+    model = solver.create_model(2, polarity_aware=polarity_aware)[0]
+    build = time.perf_counter() - start
+    cp_solver = cp_model.CpSolver()
+    cp_solver.parameters.num_workers = 1
+    start = time.perf_counter()
+    status = cp_solver.Solve(model)
+    solve = time.perf_counter() - start
+    proto = model.Proto()
+    return {
+        "status": cp_solver.StatusName(status),
+        "variables": len(proto.variables),
+        "constraints": len(proto.constraints),
+        "build": build,
+        "solve": solve,
+    }
+
+
+def main(max_n):
+    print(
+        f"{'scenario':>10} {'n':>4} {'encoding':>9} {'variables':>10} {'constraints':>12}"
+        f" {'build':>8} {'solve':>8}"
+    )
+    n = 10
+    while n <= max_n:
+        for scenario in SCENARIOS:
+            for polarity_aware in (False, True):
+                solver = solver_for(scenario, n, random.Random(n))
+                result = run(solver, polarity_aware)
+                encoding = "polarity" if polarity_aware else "full"
+                print(
+                    f"{scenario:>10} {n:>4} {encoding:>9}"
+                    f" {result['variables']:>10} {result['constraints']:>12}"
+                    f" {result['build']:>7.3f}s {result['solve']:>7.3f}s"
+                    f" {result['status']}"
+                )
+        n *= 2
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 40)
@@ -0,0 +1,78 @@
+"""
+Benchmark building models with and without the grounding cache.
+
+The hierarchy rules of test_complex_fol are built over n employees, then
+built again after one truth-table cell changes, as a user tweaking data
+and re-running would. "direct" grounds from scratch every time; "cached"
+replays the circuits compiled on the first build.
+
+    python3 benchmarks/bench_grounding_cache.py [max_n]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fol_csp_solver import FOLCSPSolver, GroundingCache  # noqa: E402
+
+RULES = [
+    {"code": "forall(x) forall(y) Reports(x,y) -> HasAuthority(y,x)", "enabled": True},
+    {
+        "code": "forall(x) forall(y) forall(z)"
+        " (Reports(x,y) && Reports(y,z)) -> HasAuthority(z,x)",
+        "enabled": True,
+    },
+]
+
+
+def context(n, rng):
+    constants = [{"id": i, "name": f"E{i}"} for i in range(n)]
+    pairs = [f"E{i},E{j}" for i in range(n) for j in range(n)]
+    predicates = [
+        {
+            "name": "Reports",
+            "data": {
+                "paramCount": 2,
+                "truthTable": {p: rng.random() < 0.1 for p in pairs},
+            },
+            "negated": False,
+        },
+        {
+            "name": "HasAuthority",
+            "data": {
+                "paramCount": 2,
+                "truthTable": {p: True for p in pairs if rng.random() < 0.2},
+            },
+            "negated": False,
+        },
+    ]
+    return constants, predicates
+
+
+def build(constants, predicates, cache):
+    solver = FOLCSPSolver(constants, predicates, [], RULES, grounding_cache=cache)
+    start = time.perf_counter()
+    solver.create_model(2)
+    return time.perf_counter() - start
+
+
+def main(max_n):
+    print(f"{'n':>6} {'direct':>10} {'compile':>10} {'cached':>10}")
+    rng = random.Random(0)
+    n = 10
+    while n <= max_n:
+        constants, predicates = context(n, rng)
+        cache = GroundingCache(background=False)
+        compile_ = build(constants, predicates, cache)
+        predicates[0]["data"]["truthTable"]["E0,E1"] ^= True
+        direct = build(constants, predicates, None)
+        cached = build(constants, predicates, cache)
+        print(f"{n:>6} {direct:>10.3f} {compile_:>10.3f} {cached:>10.3f}")
+        n *= 2
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 40)
@@ -0,0 +1,119 @@
+"""
+Benchmark declared predicate properties against the same axioms as rules.
+
+Each scenario has one predicate with declared properties over n existing
+constants with a sparse truth table, and a few rules using it. "declared"
+compiles the properties (see FOLCSPSolver.add_predicate_properties),
+"ranks" also with rank variables for orders; "axioms" drops them and
+adds property_axioms() as ordinary rules. All are solved
+single-threaded. "cycle" is infeasible.
+
+    python3 benchmarks/bench_properties.py [max_n]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ortools.sat.python import cp_model  # noqa: E402
+
+from fol_csp_solver import FOLCSPSolver, property_axioms  # noqa: E402
+
+SCENARIOS = {
+    "order": (
+        ("Above", ["transitive", "irreflexive"]),
+        [
+            "forall(x) exists(y) Above(x,y) || Above(y,x)",
+            "Above(NewConstant1,C0) && Above(C1,NewConstant1)",
+        ],
+    ),
+    "cycle": (
+        ("Above", ["transitive", "irreflexive"]),
+        ["forall(x) exists(y) Above(x,y)"],
+    ),
+    "symmetric": (
+        ("Knows", ["symmetric", "irreflexive"]),
+        [
+            "forall(x) exists(y) Knows(x,y)",
+            "forall(x) forall(y) Knows(x,y) -> !Knows(NewConstant1,x) || x == C0",
+        ],
+    ),
+    "functional": (
+        ("BossOf", ["functional", "irreflexive"]),
+        [
+            "forall(x) exists(y) BossOf(x,y) || x == C0",
+            "exists(x) BossOf(x,NewConstant1) && BossOf(NewConstant1,C0)",
+        ],
+    ),
+}
+
+
+def solver_for(scenario, n, rng, encoding):
+    (name, properties), codes = SCENARIOS[scenario]
+    names = [f"C{i}" for i in range(n)]
+    keys = {f"{rng.choice(names)},{rng.choice(names)}" for _ in range(n // 2)}
+    table = {key: False for key in keys if len(set(key.split(","))) == 2}
+    pred = {
+        "name": name,
+        "data": {"paramCount": 2, "truthTable": table, "properties": properties},
+        "negated": False,
+    }
+    if encoding == "axioms":
+        codes = codes + list(property_axioms(pred).values())
+        pred = {**pred, "data": {"paramCount": 2, "truthTable": table}}
+    constants = [{"id": i, "name": name} for i, name in enumerate(names)]
+    constraints = [{"code": code, "enabled": True} for code in codes]
+    return FOLCSPSolver(
+        constants,
+        [pred],
+        [],
+        constraints,
+        grounding_cache=None,
+        order_ranks=encoding == "ranks",
+    )
+
+
+def run(solver):
+    start = time.perf_counter()
+    model = solver.create_model(2)[0]
+    build = time.perf_counter() - start
+    cp_solver = cp_model.CpSolver()
+    cp_solver.parameters.num_workers = 1
+    start = time.perf_counter()
+    status = cp_solver.Solve(model)
+    solve = time.perf_counter() - start
+    proto = model.Proto()
+    return {
+        "status": cp_solver.StatusName(status),
+        "variables": len(proto.variables),
+        "constraints": len(proto.constraints),
+        "build": build,
+        "solve": solve,
+    }
+
+
+def main(max_n):
+    print(
+        f"{'scenario':>10} {'n':>4} {'encoding':>9} {'variables':>10} {'constraints':>12}"
+        f" {'build':>8} {'solve':>8}"
+    )
+    n = 10
+    while n <= max_n:
+        for scenario in SCENARIOS:
+            for encoding in ("axioms", "declared", "ranks"):
+                solver = solver_for(scenario, n, random.Random(n), encoding)
+                result = run(solver)
+                print(
+                    f"{scenario:>10} {n:>4} {encoding:>9}"
+                    f" {result['variables']:>10} {result['constraints']:>12}"
+                    f" {result['build']:>7.3f}s {result['solve']:>7.3f}s"
+                    f" {result['status']}"
+                )
+        n *= 2
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 40)
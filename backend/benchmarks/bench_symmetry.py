@@ -0,0 +1,51 @@
+"""
+Benchmark symmetry breaking between generated new constants.
+
+Asks for k new constants that must each sit in one of k - 1 slots with no
+two constants sharing a slot. The instance is unsatisfiable, and without
+symmetry breaking CP-SAT has to refute every renaming of the constants.
+
+    python3 benchmarks/bench_symmetry.py [max_k]
+"""
+
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fol_csp_solver import FOLCSPSolver  # noqa: E402
+
+
+def pigeonhole(k, symmetry_breaking):
+    slots = [f"Slot{i}" for i in range(1, k)]
+    predicates = [
+        {"name": slot, "data": {"paramCount": 1, "truthTable": {}}, "negated": False}
+        for slot in slots
+    ]
+    constraints = [
+        {"code": "forall(x) " + " || ".join(f"{s}(x)" for s in slots), "enabled": True}
+    ]
+    constraints += [
+        {"code": f"forall(x) forall(y) {s}(x) && {s}(y) -> x == y", "enabled": True}
+        for s in slots
+    ]
+    return FOLCSPSolver([], predicates, [], constraints, symmetry_breaking)
+
+
+def main(max_k):
+    logging.getLogger("fol_csp_solver").setLevel(logging.WARNING)
+    print(f"{'k':>3} {'no symmetry breaking':>22} {'lex-leader':>12}")
+    for k in range(3, max_k + 1):
+        timings = []
+        for symmetry_breaking in (False, True):
+            start = time.perf_counter()
+            solution = pigeonhole(k, symmetry_breaking).solve(k)
+            timings.append(time.perf_counter() - start)
+            assert solution is None
+        print(f"{k:>3} {timings[0]:>21.3f}s {timings[1]:>11.3f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 9)
@@ -0,0 +1,62 @@
+"""
+Benchmark the scalar and tensor rule evaluators on a growing domain.
+
+Every constant is a god, and each one is the parent of the next, so
+`forall(x) forall(y) Parent(x,y) -> God(x)` holds and both engines have
+to visit all n**2 bindings.
+
+    python3 benchmarks/bench_tensor.py [max_n]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fol_evaluator import evaluate_rules  # noqa: E402
+
+RULES = [
+    {"code": "forall(x) forall(y) Parent(x,y) -> God(x)", "enabled": True},
+    {"code": "forall(x) exists(y) Parent(x,y) || Parent(y,x)", "enabled": True},
+]
+
+
+def context(n):
+    constants = [{"id": i, "name": f"C{i}"} for i in range(n)]
+    predicates = [
+        {
+            "name": "God",
+            "data": {"paramCount": 1, "truthTable": {f"C{i}": True for i in range(n)}},
+            "negated": False,
+        },
+        {
+            "name": "Parent",
+            "data": {
+                "paramCount": 2,
+                "truthTable": {f"C{i},C{i + 1}": True for i in range(n - 1)},
+            },
+            "negated": False,
+        },
+    ]
+    return constants, predicates
+
+
+def main(max_n):
+    print(f"{'n':>6} {'scalar':>10} {'tensor':>10}")
+    n = 250
+    while n <= max_n:
+        constants, predicates = context(n)
+        timings, verdicts = [], []
+        for engine in ("scalar", "tensor"):
+            start = time.perf_counter()
+            results = evaluate_rules(constants, predicates, RULES, engine=engine)
+            timings.append(time.perf_counter() - start)
+            verdicts.append([r["satisfied"] for r in results.values()])
+        assert verdicts[0] == verdicts[1] == [True, True]
+        print(f"{n:>6} {timings[0]:>9.3f}s {timings[1]:>9.3f}s")
+        n *= 2
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 4000)
@@ -1,370 +1,2567 @@
+from array import array
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, wait
 from ortools.sat.python import cp_model
+import bisect
+import contextlib
+import functools
+import hashlib
 import itertools
 import json
 import logging
+import numpy as np
+import queue
+import os
+import re
+import tempfile
+import threading
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+from fol_estimator import (
+    atom_capacity,
+    combine,
+    estimate_formula,
+    estimate_properties,
+    estimate_symmetry,
+)
+from fol_evaluator import (
+    FOLEvaluationError,
+    _is_true,
+    function_caller,
+    load_functions,
+)
+from fol_parser import (
+    And,
+    Constant,
+    Count,
+    Equal,
+    Exists,
+    Forall,
+    FOLSyntaxError,
+    FunctionTerm,
+    Iff,
+    Implies,
+    Not,
+    Or,
+    Predicate,
+    Variable,
+    constant_names,
+    free_variables,
+    iter_nodes,
+    parse_formula,
+)
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 
+_NEW_CONSTANT_RE = re.compile(r"NewConstant(\d+)")
+
+ASSIGNMENT_MODES = ("all", "new", "changed")
+
+# Properties a predicate may declare in data["properties"]; all but
+# "functional" (the last argument is determined by the others) are
+# properties of binary relations
+PREDICATE_PROPERTIES = (
+    "symmetric",
+    "antisymmetric",
+    "reflexive",
+    "irreflexive",
+    "transitive",
+    "functional",
+)
+
+# Upper bounds on the estimated size of a grounded model (see
+# fol_estimator); None disables a bound. On "reject" an oversized request
+# raises GroundingLimitError, on "downgrade" it is first retried with
+# fewer new constants.
+DEFAULT_GROUNDING_LIMITS = {
+    "max_variables": 2_000_000,
+    "max_constraints": 4_000_000,
+    "max_literals": 40_000_000,
+    "on_exceed": "reject",
+}
+
+
+# Memory budget of the shared GroundingCache
+DEFAULT_GROUNDING_CACHE_BYTES = 256 * 1024 * 1024
+
+# Recent distinct solutions iter_solutions() remembers to drop repeats of
+# the reported atoms; 16 bytes of digest each
+DEFAULT_DEDUP_WINDOW = 1 << 16
+
+# Most constants a solver session's counting quantifiers can count beyond
+# the current domain
+_MAX_COUNT_TAIL = 1 << 20
+
+
+class FOLCompileError(ValueError):
+    """Raised when a rule cannot be compiled into the CP-SAT model."""
+
+
+class GroundingLimitError(ValueError):
+    """
+    Raised before grounding when the model is estimated to exceed a limit.
+
+    Attributes:
+        details: {"rule": number of the rule contributing most to the
+            exceeded measure, "formula", "measure", "estimate", "limit",
+            "num_new_constants"}
+    """
+
+    def __init__(self, details):
+        self.details = details
+        super().__init__(
+            f"Rule {details['rule']} ({details['formula']}) would ground to up to "
+            f"{details['estimate']} {details['measure']} with "
+            f"{details['num_new_constants']} new constants "
+            f"(limit {details['limit']})"
+        )
+
+
+class FormulaGrounder:
+    """
+    Grounds formula ASTs into CP-SAT literals.
+
+    Every ground subformula is reified into exactly one literal, so a
+    subformula that does not depend on a quantified variable is encoded once
+    and shared by all bindings of that variable.
+
+    Literals are defined with clauses (AddBoolAnd/AddBoolOr enforced by
+    the literal), and only in the polarities they are used in: a
+    subformula that only occurs positively just implies its operands,
+    as in the Plaisted-Greenbaum encoding, which halves the definitions
+    and leaves no reified linear constraints for the presolve to
+    rediscover as clauses. A definition is emitted when its literal is
+    first required or demanded, not when it is created. The top of a rule
+    needs no literal at all: negations are pushed inwards, conjunctions
+    and universal quantifiers are required operand by operand, and
+    disjunctions, implications and existential quantifiers become a
+    single clause, so `forall(x) exists(y) Parent(y,x)` is n clauses of
+    width n over the atoms alone. A counting quantifier is one constraint
+    on the sum of its instances' literals: at the top of a rule an
+    AtMostOne, ExactlyOne or linear constraint per binding of the outer
+    variables, elsewhere a linear constraint enforced by its literal (and
+    one on the complement of its bounds enforced by the negation). With
+    `polarity_aware=False` every literal is fully defined, so auxiliary
+    variables are functions of the atoms, as solution enumeration needs.
+
+    Grounding doubles as partial evaluation: atoms with a known truth-table
+    value and equalities between constants are Python booleans, and they
+    are propagated through the connectives, so ground clauses that the data
+    already satisfies are dropped and the rest are shortened. Only the
+    residual formula over unknown atoms reaches the model.
+
+    An extensible grounder leaves every quantifier instance open to a
+    growing domain: the quantifier's literal also covers a "tail" literal
+    standing for the instances over constants that do not exist yet; for
+    a counting quantifier the tail is an integer, the number of those
+    instances that hold. `open_assumptions()` closes the open tails for a
+    solve, and `extend()` defines them in terms of the new instances (and
+    a fresh tail).
+    """
+
+    def __init__(
+        self, model, atoms, all_constants, extensible=False, polarity_aware=True
+    ):
+        self.model = model
+        self.atoms = atoms
+        # Variables are bound to constant ids from the atom table
+        self.all_constants = [atoms.constant_ids[name] for name in all_constants]
+        self.extensible = extensible
+        self.polarity_aware = polarity_aware
+        # variable index -> (variable, kind, operand literals) of each
+        # reified subformula
+        self._definitions = {}
+        # (variable index, polarity) of the definitions added to the model
+        self._encoded = set()
+        # (quantifier node, env, tail literal) for each open quantifier instance
+        self.open_quantifiers = []
+        self._free_vars = {}
+        # id(node) -> its free variables, sorted
+        self._free_order = {}
+        self._literals = {}
+
+    def require(self, node, env, positive=True):
+        """
+        Ground `node` under variable bindings `env` and require it to hold
+        (or, with `positive` False, to fail).
+
+        Negations are pushed inwards, so `!exists(x) P(x)` is required as
+        `!P(c)` for every constant c.
+        """
+        if isinstance(node, Not):
+            self.require(node.operand, env, not positive)
+            return
+        quantifier = isinstance(node, (Forall, Exists)) and not self.extensible
+        if isinstance(node, (And, Or)) or quantifier:
+            if quantifier:
+                operands = (
+                    (node.body, {**env, node.variable: const})
+                    for const in self.all_constants
+                )
+            else:
+                operands = ((o, env) for o in node.operands)
+            if isinstance(node, (And, Forall)) == positive:
+                # A conjunction: each operand is required on its own
+                for operand, operand_env in operands:
+                    self.require(operand, operand_env, positive)
+                return
+            # A disjunction: one clause, unless an operand already holds
+            literals = self._ground_operands(operands, positive)
+            if literals is not positive:
+                self.require_clause(
+                    literals if positive else [_negate(lit) for lit in literals]
+                )
+        elif isinstance(node, Count) and positive and not self.extensible:
+            bodies = [
+                self.ground(node.body, {**env, node.variable: const})
+                for const in self.all_constants
+            ]
+            self.require_count(bodies, *node.bounds())
+        elif isinstance(node, Implies):
+            if positive:
+                right = self.ground(node.right, env)
+                if right is not True:
+                    left = self.ground(node.left, env)
+                    self.require_clause([_negate(left), right])
+            else:
+                self.require(node.right, env, False)
+                self.require(node.left, env, True)
+        else:
+            literal = self.ground(node, env)
+            self.require_literal(literal if positive else _negate(literal))
+
+    def require_literal(self, literal):
+        """Require a grounded literal (or folded bool) to hold in the model."""
+        if literal is False:
+            # The rule is false in every world over these constants
+            self.model.AddBoolOr([])
+        elif literal is not True:
+            self.model.AddBoolAnd([literal])
+            self.demand(literal, True)
+
+    def require_clause(self, literals):
+        """Require one of the grounded literals (or folded bools) to hold."""
+        if literals is True or any(lit is True for lit in literals):
+            return
+        literals = [lit for lit in literals if lit is not False]
+        if len(literals) == 1:
+            self.require_literal(literals[0])
+            return
+        self.model.AddBoolOr(literals)
+        for literal in literals:
+            self.demand(literal, True)
+
+    def require_count(self, literals, low, high):
+        """
+        Require between `low` and `high` (None: no bound) of the grounded
+        literals (or folded bools) to hold, as a single constraint.
+        """
+        folded = _fold_count(literals, low, high)
+        if isinstance(folded, bool):
+            self.require_literal(folded)
+            return
+        literals, low, high = folded
+        if high == 0 or low == len(literals):
+            positive = high != 0
+            self.model.AddBoolAnd(
+                literals if positive else [_negate(lit) for lit in literals]
+            )
+            for literal in literals:
+                self.demand(literal, positive)
+            return
+        if low == 1 and high is None:
+            self.require_clause(literals)
+            return
+        if (low, high) == (0, 1):
+            self.model.AddAtMostOne(literals)
+        elif (low, high) == (1, 1):
+            self.model.AddExactlyOne(literals)
+        else:
+            upper = len(literals) if high is None else high
+            self.model.AddLinearConstraint(sum(literals), low, upper)
+        for literal in literals:
+            if low > 0:
+                self.demand(literal, True)
+            if high is not None:
+                self.demand(literal, False)
+
+    def demand(self, literal, positive=True):
+        """
+        Add the definition of a literal in the polarity it is used in.
+
+        A positive use needs the literal to imply its subformula, a
+        negative use needs the converse. Operands are demanded in turn,
+        each in the polarity it has in the subformula.
+        """
+        if isinstance(literal, bool):
+            return
+        index = literal.Index()
+        if index < 0:
+            index, positive = -index - 1, not positive
+        definition = self._definitions.get(index)
+        if definition is None:
+            # An atom or a quantifier tail
+            return
+        for polarity in (positive,) if self.polarity_aware else (True, False):
+            if (index, polarity) not in self._encoded:
+                self._encoded.add((index, polarity))
+                self._define(definition, polarity)
+
+    def _define(self, definition, positive):
+        if definition[1] == "count":
+            self._define_count(definition, positive)
+            return
+        var, kind, literals = definition
+        if not positive:
+            var = var.Not()
+        model = self.model
+        if kind == "iff":
+            left, right = literals
+            if positive:
+                model.AddBoolOr([left.Not(), right]).OnlyEnforceIf(var)
+                model.AddBoolOr([left, right.Not()]).OnlyEnforceIf(var)
+            else:
+                model.AddBoolOr([left, right]).OnlyEnforceIf(var)
+                model.AddBoolOr([left.Not(), right.Not()]).OnlyEnforceIf(var)
+            for literal in literals:
+                self.demand(literal, True)
+                self.demand(literal, False)
+            return
+        # The negation of a conjunction is a disjunction of negations
+        if (kind == "and") == positive:
+            model.AddBoolAnd(
+                literals if positive else [lit.Not() for lit in literals]
+            ).OnlyEnforceIf(var)
+        else:
+            model.AddBoolOr(
+                literals if positive else [lit.Not() for lit in literals]
+            ).OnlyEnforceIf(var)
+        for literal in literals:
+            self.demand(literal, positive)
+
+    def _define_count(self, definition, positive):
+        var, _, literals, low, high, tail = definition
+        total = sum(literals)
+        upper = len(literals)
+        if tail is not None:
+            total += tail
+            upper += _MAX_COUNT_TAIL
+        if positive:
+            self.model.AddLinearConstraint(
+                total, low, upper if high is None else high
+            ).OnlyEnforceIf(var)
+        else:
+            outside = [[0, low - 1]]
+            if high is not None:
+                outside.append([high + 1, upper])
+            self.model.AddLinearExpressionInDomain(
+                total,
+                cp_model.Domain.FromIntervals([i for i in outside if i[0] <= i[1]]),
+            ).OnlyEnforceIf(var.Not())
+        # The lower bound uses the literals positively, the upper negatively
+        for literal in literals:
+            if low > 0:
+                self.demand(literal, positive)
+            if high is not None:
+                self.demand(literal, not positive)
+
+    def ground(self, node, env):
+        """Return the literal (or bool) for `node` under variable bindings `env`."""
+        order = self._free_order.get(id(node))
+        if order is None:
+            free = free_variables(node, self._free_vars)
+            order = self._free_order[id(node)] = tuple(sorted(free))
+        try:
+            key = (id(node), tuple([env[v] for v in order]))
+        except KeyError:
+            missing = sorted(set(order) - env.keys())
+            raise FOLCompileError(
+                f"Free variable(s) {', '.join(missing)} in {node}"
+            ) from None
+        literal = self._literals.get(key)
+        if literal is None:
+            literal = self._literals[key] = self._ground(node, env)
+        return literal
+
+    def _ground(self, node, env):
+        if isinstance(node, Predicate):
+            return self._atom(node, env)
+        if isinstance(node, Equal):
+            left = self._term(node.left, env)
+            right = self._term(node.right, env)
+            if isinstance(left, int) and isinstance(right, int):
+                return left == right
+            return self.atoms.functions.equal(left, right)
+        if isinstance(node, Not):
+            return _negate(self.ground(node.operand, env))
+        if isinstance(node, And):
+            operands = ((o, env) for o in node.operands)
+            return self._reify_and(self._ground_operands(operands, False))
+        if isinstance(node, Or):
+            operands = ((o, env) for o in node.operands)
+            return self._reify_or(self._ground_operands(operands, True))
+        if isinstance(node, Implies):
+            # The consequent is often decided by the data, in which case
+            # the antecedent never needs grounding
+            right = self.ground(node.right, env)
+            if right is True:
+                return True
+            left = self.ground(node.left, env)
+            return self._reify_or([_negate(left), right])
+        if isinstance(node, Iff):
+            return self._reify_iff(
+                self.ground(node.left, env), self.ground(node.right, env)
+            )
+        if isinstance(node, (Forall, Exists)):
+            return self._ground_quantifier(node, env, self.all_constants)
+        if isinstance(node, Count):
+            return self._ground_count(node, env)
+        raise FOLCompileError(f"Unsupported formula {node}")
+
+    def _ground_count(self, node, env):
+        low, high = node.bounds()
+        literals = [
+            self.ground(node.body, {**env, node.variable: const})
+            for const in self.all_constants
+        ]
+        if not self.extensible:
+            return self._reify_count(literals, low, high)
+        # Decided already, whatever the constants to come
+        folded = _fold_count(literals, low, high, closed=False)
+        if isinstance(folded, bool):
+            return folded
+        return self._reify_count(literals, low, high, self._count_tail(node, env))
+
+    def _count_tail(self, node, env):
+        tail = self.model.NewIntVar(0, _MAX_COUNT_TAIL, "count_tail")
+        closed = self.model.NewBoolVar("count_closed")
+        self.model.Add(tail == 0).OnlyEnforceIf(closed)
+        self.open_quantifiers.append((node, env, (tail, closed)))
+        return tail
+
+    def _ground_quantifier(self, node, env, constants):
+        is_forall = isinstance(node, Forall)
+        bodies = ((node.body, {**env, node.variable: const}) for const in constants)
+        literals = self._ground_operands(bodies, not is_forall)
+        if self.extensible and literals is not (not is_forall):
+            tail = self.model.NewBoolVar("quantifier_tail")
+            self.open_quantifiers.append((node, env, tail))
+            literals.append(tail)
+        if is_forall:
+            return self._reify_and(literals)
+        return self._reify_or(literals)
+
+    def _ground_operands(self, operands, dominant):
+        """
+        Ground `(node, env)` pairs into a list of literals, returning
+        `dominant` itself as soon as one of them folds to it (False for
+        conjunctions, True for disjunctions).
+        """
+        literals = []
+        for node, env in operands:
+            literal = self.ground(node, env)
+            if literal is dominant:
+                return dominant
+            literals.append(literal)
+        return literals
+
+    def open_assumptions(self):
+        """Literals that close every open quantifier over the current domain."""
+        assumptions = []
+        for node, _, tail in self.open_quantifiers:
+            if isinstance(node, Count):
+                assumptions.append(tail[1])
+            else:
+                assumptions.append(tail if isinstance(node, Forall) else tail.Not())
+        return assumptions
+
+    def extend(self, new_constants):
+        """
+        Add constants to the domain of an extensible grounder.
+
+        Only the instances of open quantifiers that bind one of the new
+        constants are grounded; each old tail is defined as the quantifier
+        over those instances plus a new tail.
+        """
+        new_ids = [self.atoms.constant_ids[name] for name in new_constants]
+        self.all_constants += new_ids
+        open_quantifiers, self.open_quantifiers = self.open_quantifiers, []
+        for node, env, tail in open_quantifiers:
+            if isinstance(node, Count):
+                # The old tail counts the new instances and the new tail
+                literals = [
+                    self.ground(node.body, {**env, node.variable: const})
+                    for const in new_ids
+                ]
+                rest = self._count_tail(node, env)
+                self.model.Add(tail[0] == sum(literals) + rest)
+                for literal in literals:
+                    self.demand(literal, True)
+                    self.demand(literal, False)
+                continue
+            literal = self._ground_quantifier(node, env, new_ids)
+            if isinstance(literal, bool):
+                self.model.AddBoolAnd([tail if literal else tail.Not()])
+            else:
+                # The tail may be used in either polarity
+                self.model.AddImplication(tail, literal)
+                self.model.AddImplication(literal, tail)
+                self.demand(literal, True)
+                self.demand(literal, False)
+
+    def _term(self, term, env):
+        if isinstance(term, Variable):
+            return env[term.name]
+        if isinstance(term, Constant):
+            constant_id = self.atoms.constant_ids.get(term.name)
+            if constant_id is None:
+                raise FOLCompileError(f"Unknown constant {term.name}")
+            return constant_id
+        if isinstance(term, FunctionTerm):
+            if self.extensible:
+                # Function values range over a fixed domain
+                raise FOLCompileError(
+                    f"Function terms are not supported in solver sessions: {term}"
+                )
+            args = [self._term(arg, env) for arg in term.args]
+            return self.atoms.functions.apply(term.name, args)
+        raise FOLCompileError(f"Unsupported term {term}")
+
+    def _atom(self, node, env):
+        pred_id = self._predicate_id(node)
+        args = [self._term(arg, env) for arg in node.args]
+        if all(isinstance(arg, int) for arg in args):
+            return self.atoms.atom(pred_id, args)
+        # Some argument is a function value left to the solver: the atom
+        # is picked out of the predicate's atoms by an element constraint
+        index, grid = element_grid(args, len(self.atoms.constants))
+        values = [self.atoms.atom(pred_id, ids) for ids in grid]
+        if all(value is values[0] for value in values):
+            return values[0]
+        atom_var = self.model.NewBoolVar("element_condition")
+        self.model.AddElement(
+            index, [int(v) if isinstance(v, bool) else v for v in values], atom_var
+        )
+        return atom_var
+
+    def _atom_index(self, node, env):
+        pred_id = self._predicate_id(node)
+        return self.atoms.index(pred_id, [self._term(arg, env) for arg in node.args])
+
+    def _predicate_id(self, node):
+        pred_id = self.atoms.predicate_ids.get(node.name)
+        if pred_id is None:
+            raise FOLCompileError(f"Unknown predicate {node.name}")
+        arity = self.atoms.arities[pred_id]
+        if len(node.args) != arity:
+            raise FOLCompileError(
+                f"{node.name} expects {arity} argument(s), got {len(node.args)}"
+            )
+        return pred_id
+
+    def replay(self, circuit):
+        """
+        Require a compiled rule to hold, see GroundCircuit.
+
+        The circuit is walked from its root in the order `require()` walks
+        the rule, with the same short-circuits against the truth tables,
+        so it adds exactly the variables and constraints that grounding
+        the rule would.
+        """
+        values = [None] * circuit.num_gates
+        self._replay_require(circuit, circuit.root, values)
+
+    def _replay_require(self, circuit, ref, values, positive=True):
+        op = circuit.ops[ref] if ref >= 0 else None
+        if op == _COUNT and positive:
+            args = circuit.args[circuit.starts[ref] : circuit.starts[ref + 1]]
+            literals = [self._replay(circuit, arg, values) for arg in args[2:]]
+            self.require_count(literals, args[0], None if args[1] < 0 else args[1])
+            return
+        if op not in (_NOT, _AND, _OR, _IMPLIES):
+            literal = self._replay(circuit, ref, values)
+            self.require_literal(literal if positive else _negate(literal))
+            return
+        args = circuit.args[circuit.starts[ref] : circuit.starts[ref + 1]]
+        if op == _NOT:
+            self._replay_require(circuit, args[0], values, not positive)
+        elif op == _IMPLIES:
+            if positive:
+                right = self._replay(circuit, args[1], values)
+                if right is not True:
+                    left = self._replay(circuit, args[0], values)
+                    self.require_clause([_negate(left), right])
+            else:
+                self._replay_require(circuit, args[1], values, False)
+                self._replay_require(circuit, args[0], values, True)
+        elif (op == _AND) == positive:
+            for arg in args:
+                self._replay_require(circuit, arg, values, positive)
+        else:
+            literals = []
+            for arg in args:
+                literal = self._replay(circuit, arg, values)
+                if literal is positive:
+                    return
+                literals.append(literal if positive else _negate(literal))
+            self.require_clause(literals)
+
+    def _replay(self, circuit, ref, values):
+        if ref < 0:
+            return ref == _TRUE_REF
+        value = values[ref]
+        if value is None:
+            value = values[ref] = self._replay_gate(circuit, ref, values)
+        return value
+
+    def _replay_gate(self, circuit, gate, values):
+        op = circuit.ops[gate]
+        args = circuit.args[circuit.starts[gate] : circuit.starts[gate + 1]]
+        if op == _ATOM:
+            return self.atoms.literal(args[0])
+        if op == _NOT:
+            return _negate(self._replay(circuit, args[0], values))
+        if op in (_AND, _OR):
+            dominant = op == _OR
+            literals = []
+            for ref in args:
+                literal = self._replay(circuit, ref, values)
+                if literal is dominant:
+                    return dominant
+                literals.append(literal)
+            return self._reify_or(literals) if dominant else self._reify_and(literals)
+        if op == _IMPLIES:
+            right = self._replay(circuit, args[1], values)
+            if right is True:
+                return True
+            left = self._replay(circuit, args[0], values)
+            return self._reify_or([_negate(left), right])
+        if op == _COUNT:
+            literals = [self._replay(circuit, ref, values) for ref in args[2:]]
+            return self._reify_count(
+                literals, args[0], None if args[1] < 0 else args[1]
+            )
+        return self._reify_iff(
+            self._replay(circuit, args[0], values),
+            self._replay(circuit, args[1], values),
+        )
+
+    def _reify_and(self, literals):
+        if literals is False or any(lit is False for lit in literals):
+            return False
+        literals = [lit for lit in literals if lit is not True]
+        if not literals:
+            return True
+        if len(literals) == 1:
+            return literals[0]
+        and_var = self.model.NewBoolVar("and_condition")
+        self._definitions[and_var.Index()] = (and_var, "and", literals)
+        return and_var
+
+    def _reify_or(self, literals):
+        if literals is True or any(lit is True for lit in literals):
+            return True
+        literals = [lit for lit in literals if lit is not False]
+        if not literals:
+            return False
+        if len(literals) == 1:
+            return literals[0]
+        or_var = self.model.NewBoolVar("or_condition")
+        self._definitions[or_var.Index()] = (or_var, "or", literals)
+        return or_var
+
+    def _reify_count(self, literals, low, high, tail=None):
+        # A count over a closed domain that amounts to a connective is
+        # reified as one
+        folded = _fold_count(literals, low, high, closed=tail is None)
+        if isinstance(folded, bool):
+            return folded
+        literals, low, high = folded
+        if tail is None:
+            if high == 0:
+                return _negate(self._reify_or(literals))
+            if low == len(literals):
+                return self._reify_and(literals)
+            if low == 1 and high is None:
+                return self._reify_or(literals)
+        count_var = self.model.NewBoolVar("count_condition")
+        self._definitions[count_var.Index()] = (
+            count_var,
+            "count",
+            literals,
+            low,
+            high,
+            tail,
+        )
+        return count_var
+
+    def _reify_iff(self, left, right):
+        if isinstance(left, bool):
+            return right if left else _negate(right)
+        if isinstance(right, bool):
+            return left if right else _negate(left)
+        iff_var = self.model.NewBoolVar("iff_condition")
+        self._definitions[iff_var.Index()] = (iff_var, "iff", (left, right))
+        return iff_var
+
+
+# Gate kinds of a GroundCircuit, and the references to constant gates
+_ATOM, _NOT, _AND, _OR, _IMPLIES, _IFF, _COUNT = range(7)
+_FALSE_REF, _TRUE_REF = -1, -2
+
+
+class GroundCircuit:
+    """
+    A rule grounded over a domain, independently of the truth tables.
+
+    Gates are stored in flat integer arrays: gate g has kind `ops[g]` and
+    arguments `args[starts[g]:starts[g + 1]]`. An atom gate's argument is
+    its atom index (see AtomTable); the other gates refer to their
+    operands by gate number, or by _FALSE_REF/_TRUE_REF for operands that
+    fold to a constant whatever the data (equalities). Quantifiers become
+    conjunctions or disjunctions over their instances, counting
+    quantifiers count gates whose arguments are their low and high bounds
+    (-1 for none) and then their instances, shared subformulas are shared
+    gates, and `root` refers to the rule itself.
+
+    A circuit only depends on the rule, the ordered constants and the
+    predicate signature, so it stays valid when the truth tables change;
+    FormulaGrounder.replay() turns it into model constraints for the data
+    at hand.
+    """
+
+    def __init__(self, ops, starts, args, root):
+        self.ops = ops
+        self.starts = starts
+        self.args = args
+        self.root = root
+
+    @property
+    def num_gates(self):
+        return len(self.ops)
+
+    @property
+    def nbytes(self):
+        return sum(a.itemsize * len(a) for a in (self.ops, self.starts, self.args))
+
+
+class _CircuitCompiler(FormulaGrounder):
+    """Grounds a rule into a GroundCircuit instead of model literals."""
+
+    def __init__(self, atoms, all_constants):
+        super().__init__(None, atoms, all_constants)
+        self.ops = array("b")
+        self.starts = array("q", [0])
+        self.args = array("q")
+        self._atom_gates = {}
+
+    def compile(self, formula):
+        root = self.ground(formula, {})
+        return GroundCircuit(self.ops, self.starts, self.args, root)
+
+    def _gate(self, op, args):
+        self.ops.append(op)
+        self.args.extend(args)
+        self.starts.append(len(self.args))
+        return len(self.ops) - 1
+
+    def _ground(self, node, env):
+        if isinstance(node, Predicate):
+            index = self._atom_index(node, env)
+            gate = self._atom_gates.get(index)
+            if gate is None:
+                gate = self._atom_gates[index] = self._gate(_ATOM, [index])
+            return gate
+        if isinstance(node, Equal):
+            equal = self._term(node.left, env) == self._term(node.right, env)
+            return _TRUE_REF if equal else _FALSE_REF
+        if isinstance(node, Not):
+            operand = self.ground(node.operand, env)
+            if operand < 0:
+                return _FALSE_REF if operand == _TRUE_REF else _TRUE_REF
+            return self._gate(_NOT, [operand])
+        if isinstance(node, (And, Or)):
+            operands = [self.ground(o, env) for o in node.operands]
+            return self._gate(_AND if isinstance(node, And) else _OR, operands)
+        if isinstance(node, (Implies, Iff)):
+            op = _IMPLIES if isinstance(node, Implies) else _IFF
+            return self._gate(
+                op, [self.ground(node.left, env), self.ground(node.right, env)]
+            )
+        if isinstance(node, (Forall, Exists)):
+            bodies = [
+                self.ground(node.body, {**env, node.variable: const})
+                for const in self.all_constants
+            ]
+            return self._gate(_AND if isinstance(node, Forall) else _OR, bodies)
+        if isinstance(node, Count):
+            low, high = node.bounds()
+            bodies = [
+                self.ground(node.body, {**env, node.variable: const})
+                for const in self.all_constants
+            ]
+            return self._gate(_COUNT, [low, -1 if high is None else high, *bodies])
+        raise FOLCompileError(f"Unsupported formula {node}")
+
+
+class GroundingCache:
+    """
+    Ground rules shared across solves, keyed by rule and domain.
+
+    Entries are GroundCircuits keyed by (rule AST, ordered constant names,
+    predicate signature), so re-solving after a change to the truth tables
+    only replays the circuits. The memory tier keeps the most recently
+    used circuits within `max_bytes`; with a `directory`, every circuit
+    is also written there as an .npz file and read back on a memory miss,
+    which lets circuits outlive the process and be shared between
+    workers. The directory is not pruned.
+
+    Compiling a circuit cannot skip the instances the truth tables decide,
+    so it costs several times a direct grounding. By default a miss is
+    compiled on a background thread while the caller grounds directly,
+    and only later solves of the same rule and domain use the circuit.
+    The cache is thread-safe.
+    """
+
+    def __init__(
+        self, max_bytes=DEFAULT_GROUNDING_CACHE_BYTES, directory=None, background=True
+    ):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.background = background
+        self.hits = self.disk_hits = self.misses = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        # key -> future of a background compilation
+        self._pending = {}
+        self._executor = None
+
+    def circuit(self, formula, atoms):
+        """
+        Return the circuit of `formula` over the constants of `atoms`.
+
+        Args:
+            formula: The parsed rule
+            atoms: The AtomTable the circuit will be replayed into
+
+        Returns:
+            GroundCircuit: The circuit, or None on a miss while the cache
+            compiles in the background (or when it has no room at all)
+
+        Raises:
+            FOLCompileError: If the rule cannot be grounded, when compiling
+                in the foreground.
+        """
+        if self.max_bytes <= 0 and self.directory is None:
+            return None
+        signature = tuple(
+            zip((p["name"] for p in atoms.predicates), atoms.arities, atoms.symmetric)
+        )
+        key = (formula, tuple(atoms.constants), signature)
+        with self._lock:
+            circuit = self._entries.get(key)
+            if circuit is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return circuit
+            if key in self._pending:
+                return None
+        circuit = self._load(key)
+        if circuit is not None:
+            with self._lock:
+                self.disk_hits += 1
+            self._store(key, circuit)
+            return circuit
+        with self._lock:
+            self.misses += 1
+            if self.background:
+                if key not in self._pending:
+                    if self._executor is None:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=1, thread_name_prefix="grounding-cache"
+                        )
+                    self._pending[key] = self._executor.submit(
+                        self._compile, key, atoms
+                    )
+                return None
+        return self._compile(key, atoms)
+
+    def wait(self):
+        """Wait for the background compilations started so far."""
+        with self._lock:
+            pending = list(self._pending.values())
+        wait(pending)
+
+    def _compile(self, key, atoms):
+        try:
+            circuit = _CircuitCompiler(atoms, key[1]).compile(key[0])
+            self._save(key, circuit)
+            self._store(key, circuit)
+            return circuit
+        except FOLCompileError:
+            if not self.background:
+                raise
+            # The direct grounding reports the error to the caller
+            logger.debug("Cannot compile %s", key[0], exc_info=True)
+            return None
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+    def info(self):
+        """Return hit and miss counts and the size of the memory tier."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def clear(self):
+        """Drop the memory tier; files in `directory` are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _store(self, key, circuit):
+        if circuit.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = circuit
+            self._bytes += circuit.nbytes
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+
+    def _path(self, key):
+        formula, constants, signature = key
+        text = json.dumps([str(formula), constants, signature])
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.npz"), text
+
+    def _load(self, key):
+        if self.directory is None:
+            return None
+        path, text = self._path(key)
+        try:
+            with np.load(path) as data:
+                if str(data["key"]) != text:
+                    return None
+                return GroundCircuit(
+                    array("b", data["ops"].tobytes()),
+                    array("q", data["starts"].tobytes()),
+                    array("q", data["args"].tobytes()),
+                    int(data["root"]),
+                )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("Ignoring unreadable grounding cache file %s: %s", path, e)
+            return None
+
+    def _save(self, key, circuit):
+        if self.directory is None:
+            return
+        path, text = self._path(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=self.directory, suffix=".npz", delete=False
+            ) as file:
+                np.savez(
+                    file,
+                    key=np.array(text),
+                    ops=np.frombuffer(circuit.ops, dtype=np.int8),
+                    starts=np.frombuffer(circuit.starts, dtype=np.int64),
+                    args=np.frombuffer(circuit.args, dtype=np.int64),
+                    root=np.array(circuit.root),
+                )
+            # Readers never see a partly written file
+            os.replace(file.name, path)
+        except OSError as e:
+            logger.warning("Cannot write grounding cache file %s: %s", path, e)
+
+
+# Circuits of the rules seen by this process; see FOLCSPSolver
+SHARED_GROUNDING_CACHE = GroundingCache()
+
+
+class AtomTable(Mapping):
+    """
+    Integer-indexed table of predicate atoms.
+
+    Constants get dense ids and each predicate a base offset, so the atom
+    `P(c1, ..., ck)` is the integer `base[P] + mixed_radix(id(c1), ...,
+    id(ck))`. Grounding only ever handles these integers: known truth-table
+    values live in a dict keyed by atom index, and the variables of the
+    atoms grounding reaches live in a slot-indexed list (created lazily,
+    so the model grows with the rules rather than with every predicate's
+    full domain). Atom names are only rendered at the output boundary.
+
+    For convenience at that boundary the table is also a read-only mapping
+    from atom names (e.g. "Parent(Zeus,Apollo)") to variables.
+
+    The values of function terms over the same constant ids are kept in
+    `functions`, a FunctionTable.
+
+    Both orders of a pair of a symmetric predicate (see
+    predicate_properties) share one atom index, the one with the smaller
+    constant id first, and so one variable. A truth-table entry in either
+    order fixes the pair; entries that disagree are listed in `conflicts`.
+    """
+
+    def __init__(self, model, predicates, constants, functions=()):
+        self.model = model
+        self.predicates = predicates
+        self.predicate_ids = {pred["name"]: i for i, pred in enumerate(predicates)}
+        self.arities = [pred["data"]["paramCount"] for pred in predicates]
+        self.negated = [_is_true(pred["negated"]) for pred in predicates]
+        self.symmetric = [
+            "symmetric" in predicate_properties(pred) for pred in predicates
+        ]
+        self.constants = []
+        self.constant_ids = {}
+        self.radix = 0
+        self.bases = []
+        # atom index -> value as seen by the rules, for truth-table entries
+        self.known = {}
+        # slot -> variable, slot -> atom index, atom index -> slot
+        self.variables = []
+        self.slot_atoms = array("q")
+        self.slots = {}
+        # slot -> index of the variable in the model
+        self.variable_indices = array("q")
+        self._input_arrays = None
+        self._known_arrays = None
+        self.add_constants(constants)
+        self.functions = FunctionTable(model, functions, self)
+
+    def add_constants(self, names):
+        """Add constants to the domain, re-indexing if the radix overflows."""
+        for name in names:
+            self.constant_ids[name] = len(self.constants)
+            self.constants.append(name)
+        if len(self.constants) > self.radix:
+            old = [self.decode(index) for index in self.slot_atoms]
+            self.radix = max(2, 1 << (len(self.constants) - 1).bit_length())
+            self.bases = [0]
+            for arity in self.arities:
+                self.bases.append(self.bases[-1] + self.radix**arity)
+            self.slot_atoms = array("q", (self.index(p, ids) for p, ids in old))
+            self.slots = {index: slot for slot, index in enumerate(self.slot_atoms)}
+        self._load_truth_tables()
+
+    def _load_truth_tables(self):
+        self._input_arrays = None
+        self._known_arrays = None
+        self.known = {}
+        # Atom names whose truth-table entries disagree with the other order
+        # of a symmetric pair
+        self.conflicts = []
+        for pred_id, pred in enumerate(self.predicates):
+            for key, value in pred["data"]["truthTable"].items():
+                ids = [self.constant_ids.get(name) for name in key.split(",")]
+                if None in ids or len(ids) != self.arities[pred_id]:
+                    continue
+                index = self.index(pred_id, ids)
+                value = _is_true(value) != self.negated[pred_id]
+                if self.known.get(index, value) != value:
+                    self.conflicts.append(f"{pred['name']}({key})")
+                self.known[index] = value
+
+    def index(self, pred_id, ids):
+        """Return the atom index of predicate `pred_id` over constant ids."""
+        if self.symmetric[pred_id] and ids[0] > ids[1]:
+            ids = (ids[1], ids[0])
+        local = 0
+        for constant_id in ids:
+            local = local * self.radix + constant_id
+        return self.bases[pred_id] + local
+
+    def decode(self, index):
+        """Return (predicate id, constant id tuple) for an atom index."""
+        pred_id = bisect.bisect_right(self.bases, index) - 1
+        local = index - self.bases[pred_id]
+        ids = []
+        for _ in range(self.arities[pred_id]):
+            local, constant_id = divmod(local, self.radix)
+            ids.append(constant_id)
+        return pred_id, tuple(reversed(ids))
+
+    def render(self, index):
+        """Return the name of an atom, e.g. "Parent(Zeus,Apollo)"."""
+        pred_id, ids = self.decode(index)
+        args = ",".join(self.constants[i] for i in ids)
+        return f"{self.predicates[pred_id]['name']}({args})"
+
+    def atom(self, pred_id, ids):
+        """
+        Return the value of an atom as seen by the rules.
+
+        Atoms with a truth-table entry are returned as Python booleans;
+        other atoms get a variable, created on first use.
+        """
+        return self.literal(self.index(pred_id, ids))
+
+    def literal(self, index):
+        """Return the value of the atom at `index`, see atom()."""
+        known = self.known.get(index)
+        if known is not None:
+            return known
+        slot = self.slots.get(index)
+        if slot is None:
+            slot = self.slots[index] = len(self.variables)
+            var = self.model.NewBoolVar("")
+            self.variables.append(var)
+            self.variable_indices.append(var.Index())
+            self.slot_atoms.append(index)
+        return self.variables[slot]
+
+    def slot_values(self, solver):
+        """Read the value of every atom variable at once, by slot."""
+        solution = np.asarray(solver.ResponseProto().solution, dtype=np.int64)
+        return solution[np.frombuffer(self.variable_indices, dtype=np.int64)] != 0
+
+    def input_arrays(self):
+        """
+        Return the truth tables as {predicate name: boolean array}.
+
+        Each array has shape (n,) * arity over the current constants, in
+        the order they were added, and is False where an entry is missing.
+        """
+        if self._input_arrays is None:
+            arrays = dict(self._known())
+            for pred_id, pred in enumerate(self.predicates):
+                if self.symmetric[pred_id]:
+                    # As given, not as completed by symmetry
+                    arrays[pred["name"]] = self._table_array(pred_id)
+            self._input_arrays = arrays
+        return self._input_arrays
+
+    def predicate_arrays(self, slot_values):
+        """
+        Return the atom values of a solution as {predicate name: array}.
+
+        Atoms the rules never reached keep their truth-table value.
+
+        Args:
+            slot_values: Boolean array of variable values, as returned by
+                `slot_values()`
+        """
+        indices = np.frombuffer(self.slot_atoms, dtype=np.int64)
+        arrays = {name: a.copy() for name, a in self._known().items()}
+        return self._mirror(self._scatter(indices, slot_values, into=arrays))
+
+    def _known(self):
+        # The known atoms as arrays, with symmetric pairs completed
+        if self._known_arrays is None:
+            indices = np.fromiter(self.known, dtype=np.int64, count=len(self.known))
+            values = np.fromiter(self.known.values(), dtype=bool, count=len(self.known))
+            arrays = self._mirror(self._scatter(indices, values))
+            for array_ in arrays.values():
+                array_.flags.writeable = False
+            self._known_arrays = arrays
+        return self._known_arrays
+
+    def _table_array(self, pred_id):
+        pred = self.predicates[pred_id]
+        values = np.zeros((len(self.constants),) * self.arities[pred_id], dtype=bool)
+        for key, value in pred["data"]["truthTable"].items():
+            ids = [self.constant_ids.get(name) for name in key.split(",")]
+            if None not in ids and len(ids) == values.ndim:
+                values[tuple(ids)] = _is_true(value)
+        values.flags.writeable = False
+        return values
+
+    def _mirror(self, arrays):
+        # Atoms of a symmetric pair are stored in the upper triangle
+        lower = np.tril_indices(len(self.constants), -1)
+        for pred_id, pred in enumerate(self.predicates):
+            if self.symmetric[pred_id]:
+                values = arrays[pred["name"]]
+                values[lower] = values.T[lower]
+        return arrays
+
+    def _scatter(self, indices, values, into=None):
+        # Values are as seen by the rules; arrays hold the underlying ones
+        n = len(self.constants)
+        if into is None:
+            into = {
+                pred["name"]: np.zeros((n,) * arity, dtype=bool)
+                for pred, arity in zip(self.predicates, self.arities)
+            }
+        pred_ids = np.searchsorted(self.bases, indices, side="right") - 1
+        for pred_id, pred in enumerate(self.predicates):
+            selected = pred_ids == pred_id
+            if not selected.any():
+                continue
+            arity = self.arities[pred_id]
+            local = indices[selected] - self.bases[pred_id]
+            digits = np.unravel_index(local, (self.radix,) * arity)
+            pred_values = values[selected]
+            if self.negated[pred_id]:
+                pred_values = ~pred_values
+            into[pred["name"]][digits] = pred_values
+        return into
+
+    def _lookup(self, name):
+        pred_name, _, args = name.partition("(")
+        pred_id = self.predicate_ids.get(pred_name)
+        ids = [self.constant_ids.get(c) for c in args[:-1].split(",")]
+        if pred_id is None or None in ids or len(ids) != self.arities[pred_id]:
+            return None
+        return self.slots.get(self.index(pred_id, ids))
+
+    def __getitem__(self, name):
+        slot = self._lookup(name)
+        if slot is None:
+            raise KeyError(name)
+        return self.variables[slot]
+
+    def __contains__(self, name):
+        return self._lookup(name) is not None
+
+    def __iter__(self):
+        return (self.render(index) for index in self.slot_atoms)
+
+    def __len__(self):
+        return len(self.variables)
+
+
+class FunctionTable:
+    """
+    Values of the function symbols over the constants of a model.
+
+    The value of `f(c1, ..., ck)` is a constant id when the definition of
+    f maps the arguments to a constant of the domain, and an integer
+    variable over the constant ids otherwise (an undefined argument,
+    typically a new constant), which the solver assigns. Values are
+    created on first use. A term whose arguments are themselves variables
+    is evaluated with an element constraint over the function's values,
+    so a k-ary function never needs more than n ** k value variables,
+    however deeply its terms are nested.
+
+    Definitions are {name, data} as accepted by
+    fol_evaluator.load_functions; each is loaded the first time a rule
+    applies it.
+    """
+
+    def __init__(self, model, functions, atoms):
+        self.model = model
+        self.atoms = atoms
+        self.definitions = {func["name"]: func["data"] for func in functions}
+        self._callers = {}
+        # (name, constant ids) -> constant id or variable
+        self.values = {}
+        # (name, constant ids) of the values that are variables
+        self.variable_keys = []
+        # Constants mentioned by a value fixed by a definition
+        self.named_constants = set()
+        # Element targets and equality literals, by the terms they relate
+        self._applications = {}
+        self._equalities = {}
+
+    def value(self, name, ids):
+        """Return f(ids) for constant ids: a constant id or a variable."""
+        key = (name, tuple(ids))
+        value = self.values.get(key)
+        if value is None:
+            value = self.values[key] = self._value(name, key[1])
+        return value
+
+    def _value(self, name, ids):
+        constants = self.atoms.constants
+        args = tuple(constants[i] for i in ids)
+        call = self._caller(name)
+        try:
+            result = call(args)
+        except FOLEvaluationError as e:
+            raise FOLCompileError(str(e)) from None
+        except Exception as e:
+            # Definitions are written for the existing constants
+            logger.debug("%s(%s) is undefined: %s", name, ",".join(args), e)
+            result = None
+        constant_id = None
+        if isinstance(result, str):
+            constant_id = self.atoms.constant_ids.get(result)
+        if constant_id is not None:
+            self.named_constants.update(args)
+            self.named_constants.add(result)
+            return constant_id
+        self.variable_keys.append((name, ids))
+        return self.model.NewIntVar(0, len(constants) - 1, f"{name}({','.join(args)})")
+
+    def _caller(self, name):
+        call = self._callers.get(name)
+        if call is None:
+            if name not in self.definitions:
+                raise FOLCompileError(f"Unknown function {name}")
+            try:
+                (loaded,) = load_functions(
+                    [{"name": name, "data": self.definitions[name]}]
+                )
+                call = function_caller(loaded["data"])
+            except Exception as e:
+                raise FOLCompileError(f"Cannot load function {name}: {e}") from None
+            self._callers[name] = call
+        return call
+
+    def apply(self, name, args):
+        """
+        Return the value of a function term.
+
+        Args:
+            name: The function symbol
+            args: Constant ids or integer variables, one per argument
+
+        Returns:
+            A constant id or an integer variable
+        """
+        if all(isinstance(arg, int) for arg in args):
+            return self.value(name, args)
+        key = (name, tuple(_term_key(arg) for arg in args))
+        target = self._applications.get(key)
+        if target is None:
+            n = len(self.atoms.constants)
+            index, grid = element_grid(args, n)
+            target = self.model.NewIntVar(0, n - 1, "")
+            self.model.AddElement(
+                index, [self.value(name, ids) for ids in grid], target
+            )
+            self._applications[key] = target
+        return target
+
+    def equal(self, left, right):
+        """
+        Return a literal for the equality of two terms, one of which (at
+        least) is an integer variable.
+        """
+        key = tuple(sorted([_term_key(left), _term_key(right)], key=str))
+        literal = self._equalities.get(key)
+        if literal is None:
+            literal = self._equalities[key] = self.model.NewBoolVar("equal_condition")
+            self.model.Add(left == right).OnlyEnforceIf(literal)
+            self.model.Add(left != right).OnlyEnforceIf(literal.Not())
+        return literal
+
+    def assignments(self, solver):
+        """Return the values the solver chose, as {"f(A,B)": constant name}."""
+        constants = self.atoms.constants
+        return {
+            f"{name}({','.join(constants[i] for i in ids)})": constants[
+                solver.Value(self.values[(name, ids)])
+            ]
+            for name, ids in self.variable_keys
+        }
+
+
+def element_grid(args, n):
+    """
+    Lay out the ground instances of terms with variable arguments.
+
+    Args:
+        args: Constant ids or integer variables
+        n: Number of constants
+
+    Returns:
+        (index, grid): a linear expression over the variable arguments,
+        and the list of constant id tuples it indexes, in order
+    """
+    index = 0
+    for arg in args:
+        if not isinstance(arg, int):
+            index = index * n + arg
+    choices = [[arg] if isinstance(arg, int) else range(n) for arg in args]
+    return index, list(itertools.product(*choices))
+
+
+def _term_key(term):
+    return term if isinstance(term, int) else ("var", term.Index())
+
+
+def add_lex_leader(model, atoms, first, second):
+    """
+    Require the atom vector to be lexicographically no greater than the
+    vector obtained by swapping constants `first` and `second`.
+    """
+    first, second = atoms.constant_ids[first], atoms.constant_ids[second]
+    swap = {first: second, second: first}
+    xs, ys = [], []
+    seen = set()
+    for slot, index in enumerate(atoms.slot_atoms):
+        pred_id, ids = atoms.decode(index)
+        if first not in ids and second not in ids:
+            continue
+        swapped = atoms.index(pred_id, [swap.get(i, i) for i in ids])
+        if swapped == index or index in seen:
+            continue
+        if swapped not in atoms.slots:
+            # Grounding reached the atoms asymmetrically; the swap is not a
+            # symmetry of this model.
+            logger.debug("Skipping symmetry breaking for %s/%s", first, second)
+            return
+        seen.add(swapped)
+        xs.append(atoms.variables[slot])
+        ys.append(atoms.variables[atoms.slots[swapped]])
+    add_lex_leq(model, xs, ys)
+
+
+def add_lex_leq(model, xs, ys):
+    """
+    Require the literal vector `xs` to be lexicographically <= `ys`.
+
+    Each position gets a `prefix_equal` literal that is forced true while
+    the vectors agree so far; only then does the position have to satisfy
+    x <= y.
+    """
+    prefix_equal = []
+    for i, (x, y) in enumerate(zip(xs, ys)):
+        model.AddBoolOr([x.Not(), y]).OnlyEnforceIf(prefix_equal)
+        if i == len(xs) - 1:
+            break
+        equal = model.NewBoolVar("lex_prefix_equal")
+        model.AddBoolOr([equal, x, y]).OnlyEnforceIf(prefix_equal)
+        model.AddBoolOr([equal, x.Not(), y.Not()]).OnlyEnforceIf(prefix_equal)
+        prefix_equal = [equal]
+
+
+def highest_new_constant(names):
+    """Return the largest K among names of the form NewConstantK, or 0."""
+    highest = 0
+    for name in names:
+        match = _NEW_CONSTANT_RE.fullmatch(name)
+        if match:
+            highest = max(highest, int(match.group(1)))
+    return highest
+
+
+def predicate_properties(pred):
+    """
+    Return the properties a predicate declares, as a frozenset.
+
+    Properties are listed in the predicate's data, e.g. {"paramCount": 2,
+    "truthTable": {...}, "properties": ["symmetric", "irreflexive"]}, and
+    hold of the predicate as the rules see it. See PREDICATE_PROPERTIES.
+
+    Raises:
+        FOLCompileError: On an unknown property, or one that does not
+            apply to the predicate's arity
+    """
+    name = pred["name"]
+    properties = frozenset(pred["data"].get("properties") or ())
+    unknown = properties.difference(PREDICATE_PROPERTIES)
+    if unknown:
+        raise FOLCompileError(
+            f"Unknown properties of {name}: {', '.join(sorted(unknown))}"
+        )
+    arity = pred["data"]["paramCount"]
+    relational = properties - {"functional"}
+    if relational and arity != 2:
+        raise FOLCompileError(
+            f"{name} must be binary to be {', '.join(sorted(relational))}"
+        )
+    if "functional" in properties and arity < 1:
+        raise FOLCompileError(f"{name} needs an argument to be functional")
+    return properties
+
+
+def property_axioms(pred):
+    """
+    Return the rules that a predicate's properties stand for.
+
+    FOLCSPSolver compiles the properties into specialized constraints;
+    the axioms are the same constraints written as ordinary rules.
+
+    Returns:
+        dict: {property: FOL text}, in PREDICATE_PROPERTIES order
+    """
+    name = pred["name"]
+    properties = predicate_properties(pred)
+    axioms = {
+        "symmetric": f"forall(x) forall(y) {name}(x,y) -> {name}(y,x)",
+        "antisymmetric": f"forall(x) forall(y) {name}(x,y) && {name}(y,x) -> x == y",
+        "reflexive": f"forall(x) {name}(x,x)",
+        "irreflexive": f"forall(x) !{name}(x,x)",
+        "transitive": f"forall(x) forall(y) forall(z)"
+        f" {name}(x,y) && {name}(y,z) -> {name}(x,z)",
+    }
+    if "functional" in properties:
+        prefix = [f"x{i}" for i in range(pred["data"]["paramCount"] - 1)]
+        quantifiers = " ".join(f"forall({v})" for v in prefix + ["y", "z"])
+        first = ",".join(prefix + ["y"])
+        second = ",".join(prefix + ["z"])
+        axioms["functional"] = (
+            f"{quantifiers} {name}({first}) && {name}({second}) -> y == z"
+        )
+    return {p: axioms[p] for p in PREDICATE_PROPERTIES if p in properties}
+
+
+def _fold_count(literals, low, high, closed=True):
+    """
+    Fold the bools among the operands of a count.
+
+    Args:
+        literals: Grounded literals, or bools
+        low, high: Bounds on how many of them hold; high None for none
+        closed: Whether the operands are all there will be, or more may
+            be added (see FormulaGrounder.extend)
+
+    Returns:
+        The count's value if the bools decide it, or (the other literals,
+        low, high) with the bounds that are left to enforce: low 0 and
+        high None when there is no bound
+    """
+    kept = [lit for lit in literals if not isinstance(lit, bool)]
+    held = sum(lit is True for lit in literals)
+    low = max(low - held, 0)
+    if high is not None:
+        high -= held
+        if high < low:
+            return False
+        if closed and high >= len(kept):
+            high = None
+    if closed and low > len(kept):
+        return False
+    if low == 0 and high is None:
+        return True
+    return kept, low, high
+
+
+def _negate(literal):
+    if isinstance(literal, bool):
+        return not literal
+    return literal.Not()
+
+
+# tracemalloc is process-wide: one SolverStats collects at a time
+_STATS_LOCK = threading.Lock()
+
+
+class SolverStats:
+    """
+    Collects per-phase wall time and peak memory of one solve.
+
+    Peak memory is measured with tracemalloc, which only sees Python
+    allocations; the process peak RSS is reported alongside it to cover
+    CP-SAT's own memory. Tracing runs while the collector is entered.
+
+    Tracing and its peak are process-wide, so collectors are entered one
+    at a time: a concurrent solve with stats waits for the current one to
+    finish. Solves without stats are not held up, but their Python
+    allocations during a traced phase count towards its peak, so peaks
+    are only exact while a single solve runs.
+    """
+
+    def __init__(self):
+        self.phases = {}
+        self._started_tracing = False
+
+    def __enter__(self):
+        _STATS_LOCK.acquire()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return self
+
+    def __exit__(self, *exc_info):
+        try:
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+        finally:
+            _STATS_LOCK.release()
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Time a phase; repeated phases of the same name accumulate."""
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] - baseline
+            entry = self.phases.setdefault(name, {"seconds": 0.0, "peak_bytes": 0})
+            entry["seconds"] += seconds
+            entry["peak_bytes"] = max(entry["peak_bytes"], peak)
+
+    def report(self, model, atoms, solver=None):
+        """
+        Return the collected stats as a JSON-serialisable dict.
+
+        Args:
+            model: The CpModel that was solved
+            atoms: The AtomTable of the model
+            solver: The CpSolver, once it has run
+        """
+        proto = model.Proto()
+        stats = {
+            "phases": self.phases,
+            "model": {
+                "variables": len(proto.variables),
+                "constraints": len(proto.constraints),
+                "atom_variables": len(atoms),
+                "proto_bytes": _proto_bytes(model),
+            },
+        }
+        if solver is not None:
+            response = solver.ResponseProto()
+            stats["solver"] = {
+                "status": solver.StatusName(response.status),
+                "wall_time": response.wall_time,
+                "user_time": response.user_time,
+                "deterministic_time": response.deterministic_time,
+                "num_booleans": response.num_booleans,
+                "num_conflicts": response.num_conflicts,
+                "num_branches": response.num_branches,
+                "num_binary_propagations": response.num_binary_propagations,
+                "num_restarts": response.num_restarts,
+            }
+        if resource is not None:
+            # ru_maxrss is in kilobytes on Linux
+            rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            stats["max_rss_bytes"] = rss * 1024
+        return stats
+
+
+def _proto_bytes(model):
+    """Return the serialized size of a CpModel, without touching disk."""
+    proto = model.Proto()
+    if hasattr(proto, "ByteSize"):
+        return proto.ByteSize()
+    # Newer OR-Tools wrap the proto natively, with no in-memory
+    # serialization; export it to an anonymous in-memory file instead
+    if hasattr(os, "memfd_create"):
+        fd = os.memfd_create("model")
+        try:
+            model.ExportToFile(f"/proc/self/fd/{fd}")
+            return os.fstat(fd).st_size
+        finally:
+            os.close(fd)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "model.pb")
+        model.ExportToFile(path)
+        return os.path.getsize(path)
+
+
+_NO_PHASE = contextlib.nullcontext()
+
+
+def _phase(stats, name):
+    return _NO_PHASE if stats is None else stats.phase(name)
+
+
 class FOLCSPSolver:
-    def __init__(self, constants, predicates, functions, constraints):
+    def __init__(
+        self,
+        constants,
+        predicates,
+        functions,
+        constraints,
+        symmetry_breaking=True,
+        limits=None,
+        grounding_cache=SHARED_GROUNDING_CACHE,
+        order_ranks=False,
+    ):
         """
         Initialize the FOL CSP solver.
 
         Args:
             constants: List of {id: number, name: string}
             predicates: List of {name: string, data: {paramCount: number, truthTable: dict}, negated: boolean}
-            functions: List of {name: string, data: string}
+            functions: List of {name: string, data: string}, where data is
+                the Python source of a `def` or a table (see FunctionTable)
             constraints: List of {code: string, enabled: boolean}
+            symmetry_breaking: Whether to order interchangeable new
+                constants, so the solver does not explore the k! equivalent
+                ways of naming them
+            limits: Overrides for DEFAULT_GROUNDING_LIMITS
+            grounding_cache: GroundingCache reused across solves, or None
+                to ground every rule from scratch
+            order_ranks: Whether to give strict partial orders rank
+                variables (see add_predicate_properties). They make
+                refuting a cycle faster but finding an order slower.
         """
         self.constants = constants
         self.predicates = predicates
         self.functions = functions
         self.constraints = constraints
+        self.symmetry_breaking = symmetry_breaking
+        self.limits = {**DEFAULT_GROUNDING_LIMITS, **(limits or {})}
+        self.grounding_cache = grounding_cache
+        self.order_ranks = order_ranks
+        # Stats of the last solve that collected them
+        self.last_stats = None
 
     def generate_constants(self, num_new_constants):
         """Generate new constant names."""
         return [f"NewConstant{i+1}" for i in range(num_new_constants)]
 
-    def create_model(self, num_new_constants):
-        """Create the OR-Tools CP-SAT model."""
-        model = cp_model.CpModel()
+    def create_model(self, num_new_constants, stats=None, polarity_aware=True):
+        """
+        Create the OR-Tools CP-SAT model.
 
-        # Get all constants (existing + new)
-        existing_constants = [c["name"] for c in self.constants]
-        new_constants = self.generate_constants(num_new_constants)
-        all_constants = existing_constants + new_constants
+        Args:
+            num_new_constants: Number of new constants to generate
+            stats: Optional SolverStats timing the parse, ground and build
+                phases
+            polarity_aware: Whether subformulas are only defined in the
+                polarity they are used in (see FormulaGrounder); pass
+                False to enumerate solutions
+        """
+        formulas = {}
+        named_constants = set()
+        for index, constraint in enumerate(self.constraints):
+            if not _is_true(constraint["enabled"]):
+                continue
+            with _phase(stats, "parse"):
+                formula = self.parse_constraint(constraint["code"])
+            formulas[constraint.get("number", index + 1)] = formula
+            named_constants |= constant_names(formula)
 
-        # Create variables for each predicate application
-        predicate_vars = {}
-        for pred in self.predicates:
-            name = pred["name"]
-            param_count = pred["data"]["paramCount"]
-            truth_table = pred["data"]["truthTable"]
-            negated = str(pred["negated"]).lower() == "true"
-
-            # Create variables for all possible combinations
-            for const_combo in itertools.product(all_constants, repeat=param_count):
-                key = ",".join(const_combo)
-                var_name = f"{name}({key})"
-                predicate_vars[var_name] = model.NewBoolVar(var_name)
-
-                # Add constraints for known truth values
-                if key in truth_table:
-                    # Convert string "True"/"False" to Python bool
-                    value = str(truth_table[key]).lower() == "true"
-                    if negated:
-                        value = not value
-                    model.Add(predicate_vars[var_name] == value)
+        # Refuse (or shrink) oversized requests before allocating anything
+        num_new_constants = self.admit(
+            formulas,
+            num_new_constants,
+            minimum=highest_new_constant(named_constants),
+        )
+
+        with _phase(stats, "build"):
+            model = cp_model.CpModel()
+
+            # Get all constants (existing + new)
+            existing_constants = [c["name"] for c in self.constants]
+            new_constants = self.generate_constants(num_new_constants)
+            all_constants = existing_constants + new_constants
+
+            # Atom variables are created lazily, as grounding reaches them
+            predicate_vars = AtomTable(
+                model, self.predicates, all_constants, self.functions
+            )
 
         # Add constraints from FOL formulas
-        for constraint in self.constraints:
-            if not str(constraint["enabled"]).lower() == "true":
-                continue
-            self.add_fol_constraints(
-                model, constraint["code"], predicate_vars, all_constants
+        for formula in formulas.values():
+            with _phase(stats, "ground"):
+                self.ground_constraint(
+                    model, formula, predicate_vars, all_constants, polarity_aware
+                )
+        with _phase(stats, "ground"):
+            # Ranks are not functions of the atoms, which solution
+            # enumeration projects on
+            self.add_predicate_properties(
+                model, predicate_vars, self.order_ranks and polarity_aware
             )
 
+        if self.symmetry_breaking:
+            with _phase(stats, "build"):
+                self.add_symmetry_breaking(
+                    model, predicate_vars, new_constants, named_constants
+                )
+
         return model, predicate_vars, new_constants, existing_constants
 
-    def add_fol_constraints(self, model, fol_formula, predicate_vars, all_constants):
+    def estimate_grounding(self, formulas, num_new_constants):
         """
-        Add constraints from FOL formula to the model.
-        This is a simplified version that handles basic cases.
+        Estimate the size of the model grounding `formulas`.
+
+        Args:
+            formulas: {rule number: parsed rule}
+            num_new_constants: Number of new constants to ground over
+
+        Returns:
+            dict: {"rules": {number: {"variables", "constraints",
+            "literals"}}, "properties": the same per predicate declaring
+            properties, "symmetry": the same for the symmetry-breaking
+            constraints, "total": the same for the whole model}. A rule's
+            variables include the atoms it mentions; the total counts
+            shared atoms once.
         """
-        fol_formula = fol_formula.strip()
-        logger.debug(f"Processing formula: {fol_formula}")
-
-        # Handle negated predicates
-        is_negated = fol_formula.startswith("!")
-        if is_negated:
-            fol_formula = fol_formula[1:].strip()
-
-        # Handle forall quantifier without implication
-        if fol_formula.startswith("forall"):
-            var = fol_formula[fol_formula.index("(") + 1 : fol_formula.index(")")]
-            rest = fol_formula[fol_formula.index(")") + 1 :].strip()
-            logger.debug(f"Found forall with var={var}, rest={rest}")
-
-            # Handle nested forall
-            if rest.startswith("forall"):
-                logger.debug("Found nested forall")
-                # Replace first variable
-                for const in all_constants:
-                    # Replace variable in both predicate arguments and variable declarations
-                    new_formula = rest
-                    # Replace in predicate arguments
-                    new_formula = new_formula.replace(f"{var},", f"{const},")
-                    new_formula = new_formula.replace(f"{var})", f"{const})")
-                    # Replace in variable declarations
-                    new_formula = new_formula.replace(
-                        f"forall({var})", f"forall({const})"
-                    )
-                    logger.debug(
-                        f"After substituting {var} with {const}: {new_formula}"
-                    )
-                    self.add_fol_constraints(
-                        model, new_formula, predicate_vars, all_constants
-                    )
-                return
+        existing_constants = [c["name"] for c in self.constants]
+        all_constants = existing_constants + self.generate_constants(num_new_constants)
+        capacity = atom_capacity(self.predicates, all_constants)
+        estimates = {
+            number: estimate_formula(formula, len(all_constants))
+            for number, formula in formulas.items()
+        }
+        properties = {}
+        for pred in self.predicates:
+            declared = predicate_properties(pred)
+            if declared:
+                properties[pred["name"]] = estimate_properties(
+                    pred["name"],
+                    pred["data"]["paramCount"],
+                    declared,
+                    len(all_constants),
+                    self.order_ranks,
+                )
+        symmetry = estimate_symmetry([], len(all_constants), 0)
+        if self.symmetry_breaking:
+            # Constants fixed as function values are not known before
+            # grounding; counting them as interchangeable only adds
+            named_constants = set()
+            for formula in formulas.values():
+                named_constants |= constant_names(formula)
+            free = self.interchangeable_constants(
+                all_constants[len(existing_constants) :], named_constants
+            )
+            reached = set(properties)
+            for estimate in estimates.values():
+                reached.update(
+                    name for name, count in estimate["atoms"].items() if count
+                )
+            symmetry = estimate_symmetry(
+                [
+                    pred["data"]["paramCount"]
+                    for pred in self.predicates
+                    if pred["name"] in reached
+                ],
+                len(all_constants),
+                len(free),
+            )
+        return {
+            "rules": {
+                number: combine([estimate], capacity)
+                for number, estimate in estimates.items()
+            },
+            "properties": {
+                name: combine([estimate], capacity)
+                for name, estimate in properties.items()
+            },
+            "symmetry": combine([symmetry], capacity),
+            "total": combine(
+                [*estimates.values(), *properties.values(), symmetry], capacity
+            ),
+        }
+
+    def admit(self, formulas, num_new_constants, minimum=0):
+        """
+        Check the estimated model size against `self.limits`.
+
+        Args:
+            formulas: {rule number: parsed rule}
+            num_new_constants: Requested number of new constants
+            minimum: Fewest new constants a downgrade may fall back to
 
-            # Handle single forall
-            for const in all_constants:
-                const_formula = rest.replace(f"{var},", f"{const},").replace(
-                    f"{var})", f"{const})"
+        Returns:
+            int: The number of new constants to ground with; lower than
+            requested only when limits["on_exceed"] is "downgrade"
+
+        Raises:
+            GroundingLimitError: If even the allowed number of new
+                constants exceeds a limit
+        """
+        violation = self._limit_violation(formulas, num_new_constants)
+        if violation is None:
+            return num_new_constants
+        if self.limits["on_exceed"] == "downgrade" and minimum < num_new_constants:
+            # The estimate grows with the domain; find the largest size
+            # that fits
+            low, high = minimum, num_new_constants - 1
+            if self._limit_violation(formulas, low) is None:
+                while low < high:
+                    middle = (low + high + 1) // 2
+                    if self._limit_violation(formulas, middle) is None:
+                        low = middle
+                    else:
+                        high = middle - 1
+                logger.info(
+                    "Downgraded request from %d to %d new constants",
+                    num_new_constants,
+                    low,
                 )
-                logger.debug(f"After substituting {var} with {const}: {const_formula}")
-                if "->" in const_formula:
-                    # Handle implications
-                    antecedent, consequent = const_formula.split("->")
-                    antecedent = antecedent.strip()
-                    consequent = consequent.strip()
-                    logger.debug(f"Found implication: {antecedent} -> {consequent}")
-
-                    # Handle conjunction in antecedent
-                    if "&&" in antecedent:
-                        # Split antecedent into parts and clean up parentheses
-                        antecedent = antecedent.strip("()")
-                        antecedents = [a.strip() for a in antecedent.split("&&")]
-                        logger.debug(f"Found conjunction in antecedent: {antecedents}")
-
-                        # Create a new boolean variable for the AND condition
-                        and_var = model.NewBoolVar("and_condition")
-
-                        # Add AND constraint
-                        and_terms = []
-                        for ant in antecedents:
-                            if ant in predicate_vars:
-                                and_terms.append(predicate_vars[ant])
-                                logger.debug(f"Added term to AND: {ant}")
-                        if and_terms:
-                            # All terms must be true for the AND to be true
-                            model.Add(sum(and_terms) == len(and_terms)).OnlyEnforceIf(
-                                and_var
-                            )
-                            model.Add(sum(and_terms) < len(and_terms)).OnlyEnforceIf(
-                                and_var.Not()
+                return low
+        raise GroundingLimitError(violation)
+
+    def _limit_violation(self, formulas, num_new_constants):
+        estimate = self.estimate_grounding(formulas, num_new_constants)
+        for measure in ("variables", "constraints", "literals"):
+            limit = self.limits.get(f"max_{measure}")
+            if limit is None or estimate["total"][measure] <= limit:
+                continue
+            parts = {**estimate["rules"], **estimate["properties"]}
+            rule = max(parts, key=lambda n: parts[n][measure])
+            if rule in formulas:
+                formula = str(formulas[rule])
+            else:
+                # A predicate's declared properties
+                pred = next(p for p in self.predicates if p["name"] == rule)
+                formula = " && ".join(property_axioms(pred).values())
+            return {
+                "rule": rule,
+                "formula": formula,
+                "measure": measure,
+                "estimate": estimate["total"][measure],
+                "limit": limit,
+                "num_new_constants": num_new_constants,
+            }
+        return None
+
+    def parse_constraint(self, fol_formula):
+        """
+        Parse a constraint's code into an AST.
+
+        Raises:
+            FOLCompileError: If the code does not follow the grammar.
+        """
+        fol_formula = fol_formula.strip()
+        logger.debug("Processing formula: %s", fol_formula)
+        try:
+            return parse_formula(fol_formula)
+        except FOLSyntaxError as e:
+            raise FOLCompileError(f"Cannot parse rule {fol_formula!r}: {e}") from e
+
+    def interchangeable_constants(self, new_constants, named_constants):
+        """
+        Return the new constants that no rule names and no truth table
+        mentions; any permutation of them preserves satisfiability.
+        """
+        named_constants = set(named_constants)
+        for pred in self.predicates:
+            for key in pred["data"]["truthTable"]:
+                named_constants |= set(key.split(","))
+        return [c for c in new_constants if c not in named_constants]
+
+    def add_symmetry_breaking(
+        self, model, predicate_vars, new_constants, named_constants
+    ):
+        """
+        Add lex-leader constraints between interchangeable new constants.
+
+        For each pair of consecutive interchangeable constants, the atom
+        vector (in variable creation order) must be lexicographically no
+        greater than the vector obtained by swapping the two constants,
+        which keeps exactly the lexicographically smallest of the equivalent
+        assignments.
+        """
+        # Function values fixed by a definition single out their constants
+        named_constants = (
+            set(named_constants) | predicate_vars.functions.named_constants
+        )
+        free = self.interchangeable_constants(new_constants, named_constants)
+        for first, second in zip(free, free[1:]):
+            add_lex_leader(model, predicate_vars, first, second)
+
+    def add_predicate_properties(self, model, atoms, ranks=False):
+        """
+        Compile the properties the predicates declare (see
+        predicate_properties) into constraints over their atoms.
+
+        Symmetric pairs already share a variable in the AtomTable. The
+        other properties are plain clauses over the atoms, with no
+        auxiliary literals: a unit clause per constant for (ir)reflexivity,
+        one clause per unordered pair for antisymmetry, an AtMostOne per
+        argument prefix for functionality, and one clause per triple
+        x != y != z for transitivity, skipping the triples whose premise
+        the truth tables falsify.
+
+        A transitive predicate that is also irreflexive or antisymmetric
+        is a (strict) partial order. With `ranks` it also gets a rank
+        variable per constant, increasing along the relation. A partial
+        order always has such a ranking, so the ranks only let the solver
+        refute cycles without chasing them through the transitivity
+        clauses.
+
+        Args:
+            model: The CpModel
+            atoms: The model's AtomTable
+            ranks: Whether to add rank variables
+        """
+        if atoms.conflicts:
+            logger.debug("Symmetric truth-table entries disagree: %s", atoms.conflicts)
+            model.AddBoolOr([])
+        grounder = FormulaGrounder(model, atoms, atoms.constants)
+        ids = range(len(atoms.constants))
+        for pred_id, pred in enumerate(atoms.predicates):
+            properties = predicate_properties(pred)
+            if not properties:
+                continue
+            atom = functools.partial(atoms.atom, pred_id)
+            if "reflexive" in properties:
+                for c in ids:
+                    grounder.require_literal(atom((c, c)))
+            if "irreflexive" in properties:
+                for c in ids:
+                    grounder.require_literal(_negate(atom((c, c))))
+            if "antisymmetric" in properties:
+                for a, b in itertools.combinations(ids, 2):
+                    grounder.require_clause(
+                        [_negate(atom((a, b))), _negate(atom((b, a)))]
+                    )
+            if "functional" in properties:
+                for prefix in itertools.product(ids, repeat=atoms.arities[pred_id] - 1):
+                    literals = [atom(prefix + (y,)) for y in ids]
+                    held = sum(lit is True for lit in literals)
+                    unknown = [lit for lit in literals if not isinstance(lit, bool)]
+                    if held > 1:
+                        model.AddBoolOr([])
+                    elif held:
+                        for literal in unknown:
+                            grounder.require_literal(literal.Not())
+                    elif len(unknown) > 1:
+                        model.AddAtMostOne(unknown)
+            if "transitive" in properties:
+                for x, y in itertools.permutations(ids, 2):
+                    first = atom((x, y))
+                    if first is False:
+                        continue
+                    for z in ids:
+                        if z != y:
+                            grounder.require_clause(
+                                [_negate(first), _negate(atom((y, z))), atom((x, z))]
                             )
+                if ranks and properties & {"irreflexive", "antisymmetric"}:
+                    rank = [model.NewIntVar(0, len(ids) - 1, "") for _ in ids]
+                    for x, y in itertools.permutations(ids, 2):
+                        literal = atom((x, y))
+                        if literal is True:
+                            model.Add(rank[x] < rank[y])
+                        elif literal is not False:
+                            model.Add(rank[x] < rank[y]).OnlyEnforceIf(literal)
 
-                            # Add implication
-                            if consequent in predicate_vars:
-                                model.Add(
-                                    predicate_vars[consequent] == True
-                                ).OnlyEnforceIf(and_var)
-                                logger.debug(
-                                    f"Added implication: {antecedents} -> {consequent}"
-                                )
-                    # Handle disjunction in antecedent
-                    elif "||" in antecedent:
-                        # Split antecedent into parts
-                        antecedents = antecedent.split("||")
-                        antecedents = [a.strip() for a in antecedents]
-
-                        # Create a new boolean variable for the OR condition
-                        or_var = model.NewBoolVar("or_condition")
-
-                        # Add OR constraint
-                        or_terms = []
-                        for ant in antecedents:
-                            if ant in predicate_vars:
-                                or_terms.append(predicate_vars[ant])
-                        if or_terms:
-                            model.Add(sum(or_terms) >= 1).OnlyEnforceIf(or_var)
-                            model.Add(sum(or_terms) == 0).OnlyEnforceIf(or_var.Not())
-
-                            # Add implication
-                            if consequent in predicate_vars:
-                                model.Add(
-                                    predicate_vars[consequent] == True
-                                ).OnlyEnforceIf(or_var)
-                    else:
-                        # Handle regular implication
-                        if antecedent in predicate_vars:
-                            if "&&" in consequent:
-                                # Split consequent into parts
-                                consequents = consequent.split("&&")
-                                consequents = [c.strip() for c in consequents]
-
-                                # Add each part as a separate implication
-                                for cons in consequents:
-                                    if cons in predicate_vars:
-                                        model.Add(
-                                            predicate_vars[cons] == True
-                                        ).OnlyEnforceIf(predicate_vars[antecedent])
-                            else:
-                                if consequent in predicate_vars:
-                                    model.Add(
-                                        predicate_vars[consequent] == True
-                                    ).OnlyEnforceIf(predicate_vars[antecedent])
-                else:
-                    # Handle direct assertions
-                    pred_name = const_formula[: const_formula.index("(")]
-                    args = const_formula[
-                        const_formula.index("(") + 1 : const_formula.index(")")
-                    ].split(",")
-                    args = [arg.strip() for arg in args]
-                    var_name = f"{pred_name}({','.join(args)})"
-
-                    if var_name in predicate_vars:
-                        model.Add(predicate_vars[var_name] == True)
-            return
+    def add_fol_constraints(self, model, fol_formula, predicate_vars, all_constants):
+        """
+        Compile an FOL formula and require it to hold in the model.
+
+        The formula is parsed once into an AST and then grounded over
+        `all_constants`, giving every ground subformula a single reified
+        literal.
+
+        Returns:
+            The parsed formula.
+
+        Raises:
+            FOLCompileError: If the formula cannot be parsed or refers to
+                unknown predicates, constants or free variables.
+        """
+        formula = self.parse_constraint(fol_formula)
+        self.ground_constraint(model, formula, predicate_vars, all_constants)
+        return formula
+
+    def ground_constraint(
+        self, model, formula, predicate_vars, all_constants, polarity_aware=True
+    ):
+        """
+        Ground a parsed formula and require it to hold in the model.
 
-        # Handle basic predicate assertions
+        With a grounding cache, the formula's circuit over `all_constants`
+        is replayed against the truth tables instead, once it is compiled.
+        Rules with function terms are always grounded directly, since
+        their ground instances depend on the function definitions.
+        """
+        grounder = FormulaGrounder(
+            model, predicate_vars, all_constants, polarity_aware=polarity_aware
+        )
+        circuit = None
         if (
-            "(" in fol_formula
-            and ")" in fol_formula
-            and "->" not in fol_formula
-            and "&&" not in fol_formula
-            and "||" not in fol_formula
+            self.grounding_cache is not None
+            and predicate_vars.constants == all_constants
+            and not any(isinstance(node, FunctionTerm) for node in iter_nodes(formula))
         ):
-            pred_name = fol_formula[: fol_formula.index("(")]
-            args = fol_formula[
-                fol_formula.index("(") + 1 : fol_formula.index(")")
-            ].split(",")
-            args = [arg.strip() for arg in args]
-
-            var_name = f"{pred_name}({','.join(args)})"
-            if var_name in predicate_vars:
-                model.Add(predicate_vars[var_name] == (not is_negated))
-
-        # Handle implications
-        elif "->" in fol_formula:
-            antecedent, consequent = fol_formula.split("->")
-            antecedent = antecedent.strip()
-            consequent = consequent.strip()
-
-            # Handle conjunction in antecedent
-            if "&&" in antecedent:
-                # Split antecedent into parts
-                antecedents = antecedent.split("&&")
-                antecedents = [a.strip() for a in antecedents]
-
-                # Create a new boolean variable for the AND condition
-                and_var = model.NewBoolVar("and_condition")
-
-                # Add AND constraint
-                and_terms = []
-                for ant in antecedents:
-                    if ant in predicate_vars:
-                        and_terms.append(predicate_vars[ant])
-                if and_terms:
-                    # All terms must be true for the AND to be true
-                    model.Add(sum(and_terms) == len(and_terms)).OnlyEnforceIf(and_var)
-                    model.Add(sum(and_terms) < len(and_terms)).OnlyEnforceIf(
-                        and_var.Not()
-                    )
+            circuit = self.grounding_cache.circuit(formula, predicate_vars)
+        if circuit is None:
+            grounder.require(formula, {})
+        else:
+            grounder.replay(circuit)
 
-                    # Add implication
-                    if consequent in predicate_vars:
-                        model.Add(predicate_vars[consequent] == True).OnlyEnforceIf(
-                            and_var
-                        )
-            # Handle disjunction in antecedent
-            elif "||" in antecedent:
-                # Split antecedent into parts
-                antecedents = antecedent.split("||")
-                antecedents = [a.strip() for a in antecedents]
-
-                # Create a new boolean variable for the OR condition
-                or_var = model.NewBoolVar("or_condition")
-
-                # Add OR constraint
-                or_terms = []
-                for ant in antecedents:
-                    if ant in predicate_vars:
-                        or_terms.append(predicate_vars[ant])
-                if or_terms:
-                    model.Add(sum(or_terms) >= 1).OnlyEnforceIf(or_var)
-                    model.Add(sum(or_terms) == 0).OnlyEnforceIf(or_var.Not())
-
-                    # Add implication
-                    if consequent in predicate_vars:
-                        model.Add(predicate_vars[consequent] == True).OnlyEnforceIf(
-                            or_var
-                        )
-            else:
-                # Handle regular implication
-                if antecedent in predicate_vars:
-                    if "&&" in consequent:
-                        # Split consequent into parts
-                        consequents = consequent.split("&&")
-                        consequents = [c.strip() for c in consequents]
-
-                        # Add each part as a separate implication
-                        for cons in consequents:
-                            if cons in predicate_vars:
-                                model.Add(predicate_vars[cons] == True).OnlyEnforceIf(
-                                    predicate_vars[antecedent]
-                                )
-                    else:
-                        if consequent in predicate_vars:
-                            model.Add(predicate_vars[consequent] == True).OnlyEnforceIf(
-                                predicate_vars[antecedent]
-                            )
+    def extract_solution(
+        self,
+        solver,
+        predicate_vars,
+        existing_constants,
+        new_constants,
+        assignments="all",
+    ):
+        """
+        Read the predicate assignments of a solved model.
+
+        All variable values are read in one pass into a boolean array per
+        predicate (see AtomTable.predicate_arrays); atom names are only
+        rendered for the atoms that are reported.
+
+        The values the solver chose for function terms are reported under
+        "function_assignments", e.g. {"spouse(NewConstant1)": "Zeus"}.
+
+        Args:
+            solver: The CpSolver that solved the model
+            predicate_vars: The AtomTable of the model
+            existing_constants: Names of the constants from the context
+            new_constants: Names of the generated constants
+            assignments: Which atoms to report: "all", "new" for the atoms
+                involving at least one new constant, or "changed" for the
+                atoms whose value differs from the input truth table (where
+                a missing entry counts as False)
 
-        # Handle conjunction (&&)
-        elif "&&" in fol_formula:
-            conjuncts = fol_formula.split("&&")
-            for conjunct in conjuncts:
-                self.add_fol_constraints(
-                    model, conjunct.strip(), predicate_vars, all_constants
+        Raises:
+            ValueError: If `assignments` is not one of the modes above
+        """
+        if assignments not in ASSIGNMENT_MODES:
+            raise ValueError(
+                f"assignments must be one of {ASSIGNMENT_MODES}, got {assignments!r}"
+            )
+        atoms = predicate_vars
+        arrays = atoms.predicate_arrays(atoms.slot_values(solver))
+        all_constants = existing_constants + new_constants
+        first_new = len(existing_constants)
+
+        predicate_assignments = {}
+        for pred in self.predicates:
+            name = pred["name"]
+            values = arrays[name]
+            if assignments == "all":
+                keys = (
+                    f"{name}({','.join(combo)})"
+                    for combo in itertools.product(all_constants, repeat=values.ndim)
                 )
+                predicate_assignments.update(zip(keys, values.ravel().tolist()))
+                continue
+            if assignments == "new":
+                mask = np.zeros(values.shape, dtype=bool)
+                is_new = np.arange(len(all_constants)) >= first_new
+                for axis in range(values.ndim):
+                    mask |= np.expand_dims(
+                        is_new, [a for a in range(values.ndim) if a != axis]
+                    )
+            else:
+                mask = values != atoms.input_arrays()[name]
+            for ids in np.argwhere(mask).tolist():
+                key = f"{name}({','.join(all_constants[i] for i in ids)})"
+                predicate_assignments[key] = bool(values[tuple(ids)])
+
+        logger.debug("Extracted %d predicate assignments", len(predicate_assignments))
+        return {
+            "new_constants": new_constants,
+            "predicate_assignments": predicate_assignments,
+            "function_assignments": atoms.functions.assignments(solver),
+        }
+
+    def iter_solutions(
+        self,
+        num_new_constants,
+        limit=None,
+        predicates=None,
+        buffer_size=16,
+        dedup_window=DEFAULT_DEDUP_WINDOW,
+    ):
+        """
+        Stream distinct solutions as assignment deltas.
+
+        CP-SAT enumerates the model in a single search on a background
+        thread and hands each solution to a bounded queue through a
+        solution callback; the search blocks while the queue is full, so
+        memory stays flat however many solutions are consumed. Closing the
+        generator stops the search.
+
+        Only atoms involving new constants are reported. The first item
+        holds all of them, each later item only the atoms whose value
+        changed since the previous item. The search also tells apart
+        solutions that differ only in atoms that are not reported; the
+        callback drops such a repeat if it agrees with one of the last
+        `dedup_window` distinct solutions, so deduplication costs at most
+        16 bytes per remembered solution.
+
+        Args:
+            num_new_constants: Number of new constants to generate
+            limit: Maximum number of solutions to yield
+            predicates: Optional predicate names to project onto; atoms of
+                other predicates are neither reported nor told apart
+            buffer_size: Solutions the search may run ahead of the consumer
+            dedup_window: Distinct solutions remembered to drop repeats
+
+        Yields:
+            dict: {atom name: bool} changes since the previous solution
+        """
+        # Auxiliary variables must follow the atoms, or every solution is
+        # enumerated once per assignment of the unconstrained ones
+        model, predicate_vars, new_constants, existing_constants = self.create_model(
+            num_new_constants, polarity_aware=False
+        )
+
+        # Reported atoms are either model variables or fixed by the data
+        atoms = predicate_vars
+        indexes, variables, negations, fixed = [], [], [], {}
+        constant_ids = range(len(atoms.constants))
+        first_new = len(existing_constants)
+        for pred_id, pred in enumerate(self.predicates):
+            if predicates is not None and pred["name"] not in predicates:
+                continue
+            negated = atoms.negated[pred_id]
+            for ids in itertools.product(constant_ids, repeat=atoms.arities[pred_id]):
+                if max(ids, default=-1) < first_new:
+                    continue
+                index = atoms.index(pred_id, ids)
+                slot = atoms.slots.get(index)
+                if slot is not None:
+                    indexes.append(index)
+                    variables.append(atoms.variables[slot])
+                    negations.append(negated)
+                else:
+                    value = atoms.known.get(index, negated) != negated
+                    fixed[atoms.render(index)] = value
 
-        # Handle disjunction (||)
-        elif "||" in fol_formula:
-            disjuncts = fol_formula.split("||")
-            disjuncts = [d.strip() for d in disjuncts]
+        solutions = queue.Queue(maxsize=buffer_size)
+        stream = _SolutionStream(variables, solutions, dedup_window)
+        solver = cp_model.CpSolver()
+        solver.parameters.enumerate_all_solutions = True
 
-            # Create a new boolean variable for the OR condition
-            or_var = model.NewBoolVar("or_condition")
+        def search():
+            try:
+                solver.Solve(model, stream)
+            finally:
+                stream.emit(None)
 
-            # Add OR constraint
-            or_terms = []
-            for disjunct in disjuncts:
-                if disjunct in predicate_vars:
-                    or_terms.append(predicate_vars[disjunct])
-            if or_terms:
-                model.Add(sum(or_terms) >= 1).OnlyEnforceIf(or_var)
-                model.Add(sum(or_terms) == 0).OnlyEnforceIf(or_var.Not())
+        thread = threading.Thread(target=search, daemon=True)
+        thread.start()
+        previous = None
+        count = 0
+        try:
+            while limit is None or count < limit:
+                values = solutions.get()
+                if values is None:
+                    return
+                if previous is None:
+                    delta = dict(fixed)
+                    changed = range(len(values))
+                else:
+                    delta = {}
+                    changed = (
+                        i for i in range(len(values)) if values[i] != previous[i]
+                    )
+                for i in changed:
+                    delta[atoms.render(indexes[i])] = bool(values[i]) != negations[i]
+                previous = values
+                count += 1
+                yield delta
+        finally:
+            stream.stopped = True
+            while thread.is_alive():
+                # A stop requested before the search started is lost, so
+                # it is repeated until the thread ends
+                solver.StopSearch()
+                try:
+                    solutions.get(timeout=0.05)
+                except queue.Empty:
+                    pass
+            thread.join()
+
+    def session(self, num_new_constants=0):
+        """Start a persistent solver session; see FOLSolverSession."""
+        return FOLSolverSession(self, num_new_constants)
 
-    def solve(self, num_new_constants):
+    def solve(self, num_new_constants, assignments="all", stats=False):
         """
         Solve the CSP and return the solution.
 
+        Args:
+            num_new_constants: Number of new constants to generate
+            assignments: Which atoms to report, see extract_solution()
+            stats: Whether to collect timing, memory, model size and CP-SAT
+                statistics (see SolverStats). They are returned under the
+                solution's "stats" key and kept in `last_stats`, which also
+                covers infeasible solves.
+
         Returns:
             dict: Solution containing new constants and their predicate assignments
         """
-        # Create and solve model
-        model, predicate_vars, new_constants, existing_constants = self.create_model(
-            num_new_constants
+        collector = SolverStats() if stats else None
+        solution = None
+        with collector or _NO_PHASE:
+            # Create and solve model
+            model, predicate_vars, new_constants, existing_constants = (
+                self.create_model(num_new_constants, collector)
+            )
+            solver = cp_model.CpSolver()
+            with _phase(collector, "solve"):
+                status = solver.Solve(model)
+
+            if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
+                with _phase(collector, "extract"):
+                    solution = self.extract_solution(
+                        solver,
+                        predicate_vars,
+                        existing_constants,
+                        new_constants,
+                        assignments,
+                    )
+            else:
+                logger.debug("No solution found")
+
+        if collector is not None:
+            self.last_stats = collector.report(model, predicate_vars, solver)
+            if solution is not None:
+                solution["stats"] = self.last_stats
+        return solution
+
+
+class _SolutionStream(cp_model.CpSolverSolutionCallback):
+    """
+    Pushes the values of `variables` for every solution into a queue,
+    skipping repeats of the last `window` distinct ones.
+    """
+
+    def __init__(self, variables, solutions, window):
+        super().__init__()
+        self.variables = variables
+        self.solutions = solutions
+        self.window = window
+        self.stopped = False
+        # Digests of recent distinct solutions, oldest first
+        self._seen = OrderedDict()
+
+    def on_solution_callback(self):
+        if self.stopped:
+            self.StopSearch()
+            return
+        values = bytes(self.BooleanValue(var) for var in self.variables)
+        digest = hashlib.blake2b(values, digest_size=16).digest()
+        if digest in self._seen:
+            return
+        self._seen[digest] = None
+        if len(self._seen) > self.window:
+            self._seen.popitem(last=False)
+        self.emit(values)
+        if self.stopped:
+            self.StopSearch()
+
+    def emit(self, item):
+        # Block while the consumer is behind, unless it has gone away
+        while not self.stopped:
+            try:
+                self.solutions.put(item, timeout=0.05)
+                return
+            except queue.Full:
+                pass
+
+
+class FOLSolverSession:
+    """
+    A grounded CP-SAT model that persists across solves and can grow.
+
+    The enabled rules are grounded once, with every quantifier left open to
+    more constants. `extend(k)` adds k new constants by grounding only the
+    rule instances that involve them, and each solve is hinted with the
+    previous solution, so trying one more new constant at a time costs
+    about as much as a single model build.
+
+    Each rule is guarded by an enabling literal and solved under
+    assumptions, so `set_enabled()` never rebuilds the model, and an
+    infeasible solve leaves the responsible rule numbers in `unsat_core`.
+    A disabled rule is only grounded once it is first enabled.
+    """
+
+    def __init__(self, solver, num_new_constants=0):
+        """
+        Ground the enabled rules of `solver`.
+
+        Args:
+            solver: The FOLCSPSolver holding the context and constraints
+            num_new_constants: Number of new constants to start with; raised
+                to the highest NewConstantK that a rule names
+        """
+        self.solver = solver
+        self.model = cp_model.CpModel()
+        self.existing_constants = [c["name"] for c in solver.constants]
+        self.new_constants = []
+        self.named_constants = set()
+        # Rule numbers behind the last infeasible solve
+        self.unsat_core = []
+        # Atom values of the last solution, by slot
+        self._hint = []
+        self._ordered_pairs = 0
+
+        # number -> {code, formula, enabled, guard}; every rule is parsed up
+        # front so that symmetry breaking knows all the constants they name
+        self.rules = {}
+        for index, constraint in enumerate(solver.constraints):
+            enabled = _is_true(constraint["enabled"])
+            try:
+                formula = solver.parse_constraint(constraint["code"])
+            except FOLCompileError:
+                if enabled:
+                    raise
+                formula = None
+            else:
+                self.named_constants |= constant_names(formula)
+            self.rules[constraint.get("number", index + 1)] = {
+                "code": constraint["code"],
+                "formula": formula,
+                "enabled": enabled,
+                "guard": None,
+            }
+        named = highest_new_constant(self.named_constants)
+        num_new_constants = solver.admit(
+            self._grounded_formulas(initial=True),
+            max(num_new_constants, named),
+            minimum=named,
+        )
+
+        self.new_constants = solver.generate_constants(num_new_constants)
+        all_constants = self.existing_constants + self.new_constants
+        self.atoms = AtomTable(self.model, solver.predicates, all_constants)
+        self.grounder = FormulaGrounder(
+            self.model, self.atoms, all_constants, extensible=True
+        )
+        for number, rule in self.rules.items():
+            if rule["enabled"]:
+                self._ground_rule(number, rule)
+        # Predicate properties are grounded as their axioms, whose
+        # quantifiers stay open to new constants like the rules'
+        for pred in solver.predicates:
+            for prop, axiom in property_axioms(pred).items():
+                # Symmetric pairs share their variable already
+                if prop != "symmetric":
+                    self.grounder.require(parse_formula(axiom), {})
+        self._require_consistent_tables()
+        self._break_symmetry()
+
+    def _grounded_formulas(self, initial=False):
+        return {
+            number: rule["formula"]
+            for number, rule in self.rules.items()
+            if (rule["enabled"] if initial else rule["guard"] is not None)
+        }
+
+    def _ground_rule(self, number, rule):
+        guard = self.model.NewBoolVar(f"enable_rule_{number}")
+        literal = self.grounder.ground(rule["formula"], {})
+        if literal is False:
+            self.model.AddBoolOr([guard.Not()])
+        elif literal is not True:
+            self.model.AddImplication(guard, literal)
+            self.grounder.demand(literal, True)
+        rule["guard"] = guard
+
+    def set_enabled(self, number, enabled=True):
+        """
+        Enable or disable a rule for the following solves.
+
+        Raises:
+            FOLCompileError: If a rule being enabled cannot be compiled.
+        """
+        rule = self.rules[number]
+        if enabled and rule["guard"] is None:
+            if rule["formula"] is None:
+                # Re-parse to surface the syntax error
+                self.solver.parse_constraint(rule["code"])
+            formulas = self._grounded_formulas()
+            formulas[number] = rule["formula"]
+            count = len(self.new_constants)
+            self.solver.admit(formulas, count, minimum=count)
+            self._ground_rule(number, rule)
+        rule["enabled"] = enabled
+
+    def extend(self, k):
+        """
+        Add k more new constants, grounding only the new rule instances.
+
+        Returns:
+            list: The names of the added constants
+
+        Raises:
+            GroundingLimitError: If the larger model would exceed the
+                solver's limits
+        """
+        start = len(self.new_constants)
+        self.solver.admit(self._grounded_formulas(), start + k, minimum=start + k)
+        added = self.solver.generate_constants(start + k)[start:]
+        self.new_constants += added
+        self.atoms.add_constants(added)
+        self.grounder.extend(added)
+        self._require_consistent_tables()
+        self._break_symmetry()
+        return added
+
+    def _require_consistent_tables(self):
+        if self.atoms.conflicts:
+            logger.debug(
+                "Symmetric truth-table entries disagree: %s", self.atoms.conflicts
+            )
+            self.model.AddBoolOr([])
+
+    def _break_symmetry(self):
+        if not self.solver.symmetry_breaking:
+            return
+        free = self.solver.interchangeable_constants(
+            self.new_constants, self.named_constants
+        )
+        # Pairs ordered earlier stay valid: their lex-leader constraints
+        # cover a prefix of the (creation-ordered) atom vector.
+        pairs = list(zip(free, free[1:]))
+        for first, second in pairs[self._ordered_pairs :]:
+            add_lex_leader(self.model, self.atoms, first, second)
+        self._ordered_pairs = len(pairs)
+
+    def solve(self, assignments="all"):
+        """
+        Solve over the current constants.
+
+        Args:
+            assignments: Which atoms to report, see
+                FOLCSPSolver.extract_solution()
+
+        Returns:
+            dict: Solution as returned by FOLCSPSolver.solve, or None
+        """
+        self.model.ClearHints()
+        for var, value in zip(self.atoms.variables, self._hint):
+            self.model.AddHint(var, value)
+        guards = {
+            rule["guard"].Index(): number
+            for number, rule in self.rules.items()
+            if rule["enabled"]
+        }
+        self.model.ClearAssumptions()
+        self.model.AddAssumptions(self.grounder.open_assumptions())
+        self.model.AddAssumptions(
+            [self.rules[number]["guard"] for number in guards.values()]
         )
+
         solver = cp_model.CpSolver()
-        status = solver.Solve(model)
-
-        if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
-            # Extract solution
-            solution = {"new_constants": new_constants, "predicate_assignments": {}}
-
-            # Get values for predicates involving new constants
-            for pred in self.predicates:
-                name = pred["name"]
-                param_count = pred["data"]["paramCount"]
-                all_constants = existing_constants + new_constants
-
-                # Include assignments where any parameter is a new constant
-                for const_combo in itertools.product(all_constants, repeat=param_count):
-                    key = ",".join(const_combo)
-                    var_name = f"{name}({key})"
-                    if var_name in predicate_vars:
-                        value = bool(solver.Value(predicate_vars[var_name]))
-                        if str(pred["negated"]).lower() == "true":
-                            value = not value
-                        solution["predicate_assignments"][var_name] = value
-                        logger.debug(f"Predicate assignment: {var_name} = {value}")
-
-            return solution
-        else:
+        status = solver.Solve(self.model)
+        if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
             logger.debug("No solution found")
+            # Open quantifier tails can show up in the core as well, when
+            # more constants might help; only rules are reported.
+            self.unsat_core = sorted(
+                guards[literal]
+                for literal in solver.SufficientAssumptionsForInfeasibility()
+                if literal in guards
+            )
             return None
+        self.unsat_core = []
+
+        self._hint = self.atoms.slot_values(solver).tolist()
+        return self.solver.extract_solution(
+            solver,
+            self.atoms,
+            self.existing_constants,
+            list(self.new_constants),
+            assignments,
+        )
+
+    def find_min_constants(self, max_new_constants):
+        """
+        Solve with the fewest new constants, adding one at a time.
+
+        Returns:
+            dict: The first solution found, or None if even
+            `max_new_constants` new constants are not enough
+        """
+        while True:
+            solution = self.solve()
+            if solution is not None or len(self.new_constants) >= max_new_constants:
+                return solution
+            self.extend(1)
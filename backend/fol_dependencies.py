@@ -0,0 +1,208 @@
+"""
+Per-rule results that survive truth-table edits they do not depend on.
+
+A rule's result only depends on its text, the domain, the function
+definitions and the atoms it can reach. The atoms a rule can reach are
+indexed by pattern: every predicate occurrence contributes its argument
+list, with constants kept and variables or function terms as wildcards,
+so `forall(x) Parent(Zeus,x) -> God(x)` depends on `Parent(Zeus,*)` and
+`God(*)` only.
+
+RuleMemo keeps the results of previous requests together with the
+version of each truth table they were computed on. Versions are told
+apart by comparing the tables themselves, and each version keeps its set
+of true atoms, so the atoms an edit flipped are the symmetric difference
+of two sets. A rule is recomputed only when a flipped atom matches one of
+its patterns; every other rule reuses its previous result.
+"""
+
+from collections import OrderedDict
+import itertools
+import threading
+
+from fol_evaluator import _is_true
+from fol_parser import Constant, Predicate, iter_nodes
+
+# Rules whose results are kept, across all contexts
+DEFAULT_MAX_RULES = 4096
+
+# Recent truth-table versions kept per predicate name; a rule computed on
+# an older version can no longer be checked against the edit
+DEFAULT_VERSIONS_PER_PREDICATE = 4
+
+
+def atom_patterns(formula):
+    """
+    Return the atoms a rule can reach, as {predicate name: patterns}.
+
+    A pattern is a tuple with a constant name for each argument that is a
+    constant and None for the other arguments.
+    """
+    patterns = {}
+    for node in iter_nodes(formula):
+        if isinstance(node, Predicate):
+            pattern = tuple(
+                arg.name if isinstance(arg, Constant) else None for arg in node.args
+            )
+            patterns.setdefault(node.name, set()).add(pattern)
+    return {name: frozenset(p) for name, p in patterns.items()}
+
+
+def _matches(pattern, args):
+    return len(pattern) == len(args) and all(
+        p is None or p == a for p, a in zip(pattern, args)
+    )
+
+
+class RuleMemo:
+    """
+    Results of rules from earlier requests, kept until an edit reaches them.
+
+    A request takes a `snapshot()` of its context, looks each rule up in
+    it and stores the results it had to compute. The memo is thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_rules=DEFAULT_MAX_RULES,
+        versions_per_predicate=DEFAULT_VERSIONS_PER_PREDICATE,
+    ):
+        self.max_rules = max_rules
+        self.versions_per_predicate = versions_per_predicate
+        self.hits = self.misses = 0
+        # predicate name -> [(truth table, true atoms, version)], newest last
+        self._versions = {}
+        self._version_ids = itertools.count()
+        # (old version, new version) -> atoms whose value differs
+        self._diffs = OrderedDict()
+        # rule key -> {"versions", "patterns", "result"}
+        self._rules = OrderedDict()
+        self._lock = threading.Lock()
+
+    def snapshot(self, constants, predicates, functions, options):
+        """
+        Register a request's context.
+
+        Args:
+            constants: Constant names, in quantification order
+            predicates: List of {name, data: {paramCount, truthTable},
+                negated}
+            functions: Hashable description of the function definitions,
+                e.g. their JSON text
+            options: Hashable description of everything else the results
+                depend on, e.g. ("evaluate", engine, trace)
+
+        Returns:
+            RuleSnapshot
+        """
+        versions, true_atoms = {}, {}
+        for pred in predicates:
+            name = pred["name"]
+            table = pred["data"]["truthTable"]
+            version, atoms = self._version(name, table)
+            versions[name] = (
+                version,
+                pred["data"]["paramCount"],
+                _is_true(pred["negated"]),
+            )
+            true_atoms[name] = atoms
+        context = (options, tuple(constants), functions)
+        return RuleSnapshot(self, context, versions, true_atoms)
+
+    def info(self):
+        """Return hit and miss counts and the number of rules kept."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "rules": len(self._rules)}
+
+    def _version(self, name, table):
+        with self._lock:
+            recent = self._versions.setdefault(name, [])
+            for entry in recent:
+                if entry[0] == table:
+                    return entry[2], entry[1]
+        atoms = frozenset(
+            tuple(key.split(",")) for key, value in table.items() if _is_true(value)
+        )
+        with self._lock:
+            version = next(self._version_ids)
+            # A copy, in case the caller edits the table in place
+            recent.append((dict(table), atoms, version))
+            del recent[: -self.versions_per_predicate]
+        return version, atoms
+
+    def _changed_atoms(self, name, old, new):
+        """Return the atoms of `name` flipped from version `old` to `new`."""
+        with self._lock:
+            changed = self._diffs.get((old, new))
+            if changed is not None:
+                return changed
+            tables = {v: atoms for _, atoms, v in self._versions.get(name, ())}
+        if old not in tables or new not in tables:
+            return None
+        changed = tables[old] ^ tables[new]
+        with self._lock:
+            self._diffs[(old, new)] = changed
+            while len(self._diffs) > self.max_rules:
+                self._diffs.popitem(last=False)
+        return changed
+
+
+class RuleSnapshot:
+    """The context of one request, see RuleMemo.snapshot()."""
+
+    def __init__(self, memo, context, versions, true_atoms):
+        self.memo = memo
+        self.context = context
+        self.versions = versions
+        # predicate name -> frozenset of argument tuples marked true
+        self.true_atoms = true_atoms
+
+    def lookup(self, code):
+        """Return the stored result of a rule, or None to compute it."""
+        memo = self.memo
+        key = (self.context, code)
+        with memo._lock:
+            entry = memo._rules.get(key)
+            if entry is None:
+                memo.misses += 1
+                return None
+            memo._rules.move_to_end(key)
+        current = {}
+        for name, patterns in entry["patterns"].items():
+            old, new = entry["versions"][name], self.versions.get(name)
+            current[name] = new
+            if old == new:
+                continue
+            # A changed arity or negation flips every atom
+            if old is None or new is None or old[1:] != new[1:]:
+                return self._miss()
+            changed = memo._changed_atoms(name, old[0], new[0])
+            if changed is None or any(
+                _matches(pattern, args) for args in changed for pattern in patterns
+            ):
+                return self._miss()
+        with memo._lock:
+            entry["versions"] = current
+            memo.hits += 1
+        return entry["result"]
+
+    def store(self, code, formula, result):
+        """Keep the result of a rule computed in this context."""
+        patterns = atom_patterns(formula)
+        versions = {name: self.versions.get(name) for name in patterns}
+        memo = self.memo
+        with memo._lock:
+            key = (self.context, code)
+            memo._rules[key] = {
+                "versions": versions,
+                "patterns": patterns,
+                "result": result,
+            }
+            memo._rules.move_to_end(key)
+            while len(memo._rules) > memo.max_rules:
+                memo._rules.popitem(last=False)
+
+    def _miss(self):
+        with self.memo._lock:
+            self.memo.misses += 1
+        return None
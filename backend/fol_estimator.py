@@ -0,0 +1,349 @@
+"""
+Static estimate of how large a rule grounds.
+
+The grounder encodes every subformula once per binding of its free
+variables, so a subformula with f free variables over n constants has
+n ** f ground instances. Counting instances per AST node, and the
+variables and constraints each instance adds, bounds the model size from
+the rule text, the predicate arities and the number of constants alone,
+in time linear in the size of the rule. Like the grounder, the count
+follows the polarity of each subformula: one defining clause per
+polarity it is used in, and none for the connectives at the top of the
+rule, which are required directly with negations pushed inwards. A
+counting quantifier is one constraint on the sum of its instances, or
+the conjunction or disjunction its bounds amount to.
+
+The figures are upper bounds: partial evaluation against the truth tables
+usually drops part of the grounding, but never adds to it. Function terms
+are counted as if no definition fixed any value, and symmetry breaking as
+if the rules reached every atom of the predicates they mention.
+"""
+
+from collections import Counter
+
+from fol_parser import (
+    And,
+    Count,
+    Equal,
+    Exists,
+    Forall,
+    FunctionTerm,
+    Iff,
+    Implies,
+    Not,
+    Or,
+    Predicate,
+    free_variables,
+    iter_nodes,
+)
+
+
+def estimate_formula(formula, num_constants):
+    """
+    Estimate the grounding of one rule.
+
+    Args:
+        formula: The parsed rule
+        num_constants: Number of constants the rule is grounded over
+
+    Returns:
+        dict: {"atoms": Counter of atom occurrences per predicate name,
+        "variables": auxiliary (non-atom) variables, "constraints":
+        constraints, "literals": total constraint length}
+    """
+    free_cache = {}
+    atoms = Counter()
+    totals = Counter()
+
+    def instances(node):
+        return num_constants ** len(free_variables(node, free_cache))
+
+    def require(node, positive=True):
+        # The top of the rule is required without literals of its own
+        if isinstance(node, Not):
+            require(node.operand, not positive)
+        elif isinstance(node, Implies) and not positive:
+            require(node.right, False)
+            require(node.left, True)
+        elif isinstance(node, Count) and positive:
+            # A single constraint per instance, unless the bounds decide it
+            case, low, high = _count_case(node, num_constants)
+            if case is not True:
+                count = instances(node)
+                totals["constraints"] += count
+                if case is not False:
+                    totals["literals"] += num_constants * count
+                    demand(node.body, _count_polarities(case, low, high, True))
+        elif isinstance(node, (And, Or, Forall, Exists)) and (
+            isinstance(node, (And, Forall)) == positive
+        ):
+            # A conjunction, each operand required on its own
+            for operand, _ in _operands(node):
+                require(operand, positive)
+        elif isinstance(node, (And, Or, Implies, Forall, Exists)):
+            # One clause per instance
+            count = instances(node)
+            totals["constraints"] += count
+            totals["literals"] += _width(node, num_constants) * count
+            for operand, same in _operands(node):
+                demand(operand, {positive == same})
+        else:
+            count = instances(node)
+            totals["constraints"] += count
+            totals["literals"] += count
+            demand(node, {positive})
+
+    def function_terms(terms):
+        # A value variable per argument tuple of the function and an
+        # element constraint per application, both at most; returns how
+        # many of `terms` are function terms
+        for term in terms:
+            for sub in iter_nodes(term):
+                if isinstance(sub, FunctionTerm):
+                    count = instances(sub)
+                    totals["variables"] += count + num_constants ** len(sub.args)
+                    totals["constraints"] += count
+                    totals["literals"] += (num_constants + 2) * count
+        return sum(isinstance(term, FunctionTerm) for term in terms)
+
+    def demand(node, polarities):
+        if isinstance(node, Predicate):
+            count = instances(node)
+            applied = function_terms(node.args)
+            # An atom over a function value is picked by an element
+            # constraint out of every atom it can be
+            atoms[node.name] += count * num_constants**applied
+            if applied:
+                totals["variables"] += count
+                totals["constraints"] += count
+                totals["literals"] += (num_constants**applied + 2) * count
+        elif isinstance(node, Equal):
+            if function_terms((node.left, node.right)):
+                # A literal reifying the equality in both directions
+                count = instances(node)
+                totals["variables"] += count
+                totals["constraints"] += 2 * count
+                totals["literals"] += 6 * count
+        elif isinstance(node, Not):
+            demand(node.operand, {not p for p in polarities})
+        elif isinstance(node, Count):
+            # One literal, defined by a constraint per polarity
+            case, low, high = _count_case(node, num_constants)
+            if isinstance(case, bool):
+                return
+            count = instances(node)
+            totals["variables"] += count
+            totals["constraints"] += len(polarities) * count
+            totals["literals"] += (num_constants + 1) * len(polarities) * count
+            demand(
+                node.body,
+                set().union(
+                    *(_count_polarities(case, low, high, p) for p in polarities)
+                ),
+            )
+        elif isinstance(node, (And, Or, Implies, Iff, Forall, Exists)):
+            # One literal, defined by a clause per polarity it is used in
+            # (two for a biconditional)
+            count = instances(node)
+            totals["variables"] += count
+            if isinstance(node, Iff):
+                totals["constraints"] += 2 * len(polarities) * count
+                totals["literals"] += 6 * len(polarities) * count
+                demand(node.left, {True, False})
+                demand(node.right, {True, False})
+                return
+            width = _width(node, num_constants)
+            totals["constraints"] += len(polarities) * count
+            totals["literals"] += (width + 1) * len(polarities) * count
+            for operand, positive in _operands(node):
+                demand(operand, polarities if positive else {not p for p in polarities})
+        # Equalities between constants and variables add nothing
+
+    require(formula)
+    return {
+        "atoms": atoms,
+        "variables": totals["variables"],
+        "constraints": totals["constraints"],
+        "literals": totals["literals"],
+    }
+
+
+def _count_case(node, num_constants):
+    """
+    Return how the grounder encodes a counting quantifier over
+    `num_constants` unknown instances, with the bounds left to enforce.
+
+    Returns:
+        tuple: (case, low, high), where case is the count's value if its
+        bounds decide it, or "none", "all", "any" or "count"; high is
+        None when it cannot be exceeded
+    """
+    low, high = node.bounds()
+    if high is not None:
+        if high < low:
+            return False, low, high
+        if high >= num_constants:
+            high = None
+    if low > num_constants:
+        return False, low, high
+    if low == 0 and high is None:
+        return True, low, high
+    if high == 0:
+        return "none", low, high
+    if low == num_constants:
+        return "all", low, high
+    if low == 1 and high is None:
+        return "any", low, high
+    return "count", low, high
+
+
+def _count_polarities(case, low, high, positive):
+    """Return the polarities a count used in `positive` uses its body in."""
+    if case == "none":
+        return {not positive}
+    if case != "count":
+        return {positive}
+    polarities = set()
+    if low > 0:
+        polarities.add(positive)
+    if high is not None:
+        polarities.add(not positive)
+    return polarities
+
+
+def _width(node, num_constants):
+    if isinstance(node, (And, Or)):
+        return len(node.operands)
+    if isinstance(node, (Forall, Exists)):
+        return num_constants
+    return 2
+
+
+def _operands(node):
+    """Yield (operand, whether it occurs positively) of a connective."""
+    if isinstance(node, (And, Or)):
+        for operand in node.operands:
+            yield operand, True
+    elif isinstance(node, (Forall, Exists)):
+        yield node.body, True
+    else:
+        yield node.left, False
+        yield node.right, True
+
+
+def estimate_properties(name, arity, properties, num_constants, ranks=False):
+    """
+    Estimate the constraints compiled from a predicate's declared
+    properties, see FOLCSPSolver.add_predicate_properties.
+
+    Args:
+        name: The predicate name
+        arity: Its number of arguments
+        properties: The properties it declares
+        num_constants: Number of constants the model is grounded over
+        ranks: Whether partial orders get rank variables
+
+    Returns:
+        dict: As returned by estimate_formula
+    """
+    n = num_constants
+    atoms = Counter({name: n**arity})
+    variables = constraints = literals = 0
+    for prop in properties & {"reflexive", "irreflexive"}:
+        constraints += n
+        literals += n
+    if "antisymmetric" in properties:
+        pairs = n * (n - 1) // 2
+        constraints += pairs
+        literals += 2 * pairs
+    if "functional" in properties:
+        prefixes = n ** (arity - 1)
+        constraints += prefixes
+        literals += n * prefixes
+    if "transitive" in properties:
+        triples = n * (n - 1) * (n - 1)
+        constraints += triples
+        literals += 3 * triples
+        if ranks and properties & {"irreflexive", "antisymmetric"}:
+            # Rank variables, ordered along each pair
+            variables += n
+            constraints += n * (n - 1)
+            literals += 3 * n * (n - 1)
+    return {
+        "atoms": atoms,
+        "variables": variables,
+        "constraints": constraints,
+        "literals": literals,
+    }
+
+
+def estimate_symmetry(arities, num_constants, num_interchangeable):
+    """
+    Estimate the lex-leader constraints between interchangeable new
+    constants, see FOLCSPSolver.add_symmetry_breaking.
+
+    Each consecutive pair of interchangeable constants compares the atoms
+    mentioning either of them with their swapped counterparts, one
+    position per swapped pair, as in add_lex_leq.
+
+    Args:
+        arities: The arities of the predicates whose atoms the model has
+        num_constants: Number of constants the model is grounded over
+        num_interchangeable: Number of interchangeable new constants
+
+    Returns:
+        dict: As returned by estimate_formula
+    """
+    n = num_constants
+    pairs = max(0, num_interchangeable - 1)
+    positions = sum(n**arity - (n - 2) ** arity for arity in arities) // 2
+    if not pairs or not positions:
+        return {"atoms": Counter(), "variables": 0, "constraints": 0, "literals": 0}
+    # A clause per position, and a prefix literal defined by two clauses
+    # of four literals (with their enforcement) per position but the last
+    return {
+        "atoms": Counter(),
+        "variables": pairs * (positions - 1),
+        "constraints": pairs * (3 * positions - 2),
+        "literals": pairs * (11 * positions - 9),
+    }
+
+
+def atom_capacity(predicates, constants):
+    """
+    Return, per predicate name, how many of its atoms can be variables:
+    every atom over `constants` that has no truth-table entry.
+    """
+    constant_set = set(constants)
+    capacity = {}
+    for pred in predicates:
+        arity = pred["data"]["paramCount"]
+        known = sum(
+            1
+            for key in pred["data"]["truthTable"]
+            if len(key.split(",")) == arity and constant_set.issuperset(key.split(","))
+        )
+        capacity[pred["name"]] = max(0, len(constant_set) ** arity - known)
+    return capacity
+
+
+def combine(estimates, capacity):
+    """
+    Total the estimates of several rules sharing one model.
+
+    Atoms are shared between rules, so each predicate contributes at most
+    its capacity however often the rules mention it.
+
+    Returns:
+        dict: {"variables", "constraints", "literals"} for the whole model
+    """
+    atoms = Counter()
+    total = {"variables": 0, "constraints": 0, "literals": 0}
+    for estimate in estimates:
+        atoms.update(estimate["atoms"])
+        for key in total:
+            total[key] += estimate[key]
+    total["variables"] += sum(
+        min(count, capacity.get(name, count)) for name, count in atoms.items()
+    )
+    return total
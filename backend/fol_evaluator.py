@@ -0,0 +1,836 @@
+"""
+Model checker for FOL rules over a finite context.
+
+Rules are parsed with fol_parser and evaluated directly on their AST
+against the context's truth tables, which are loaded once into sets of
+true argument tuples. Connectives and quantifiers short-circuit, so
+`forall` stops at the first counterexample and `exists` at the first
+witness; counting quantifiers stop as soon as the count is decided.
+
+For large domains TensorEvaluator checks a rule on whole arrays at once:
+each predicate is a boolean NumPy array with one axis per argument,
+connectives are broadcast elementwise operations and quantifiers are
+`all`/`any` reductions over their variable's axis (`sum` for counting
+quantifiers).
+
+`evaluate_rules()` produces the result structure /evaluate has always
+returned: {"Rule N": {"satisfied", "rule", "evaluations"}}, or
+{"Rule N": {"error", "rule"}} for a rule that cannot be evaluated. By
+default "evaluations" only lists the atoms that decided the verdict,
+e.g. those of the first counterexample of a violated `forall`, rather
+than every atom looked up.
+"""
+
+import functools
+import inspect
+import random
+
+import numpy as np
+
+from fol_parser import (
+    And,
+    Constant,
+    Count,
+    Equal,
+    Exists,
+    Forall,
+    FunctionTerm,
+    Iff,
+    Implies,
+    Not,
+    Or,
+    Predicate,
+    Variable,
+    free_variables,
+    iter_nodes,
+    parse_formula,
+)
+
+
+class FOLEvaluationError(ValueError):
+    """Raised when a rule cannot be evaluated in the context."""
+
+
+def _is_true(value):
+    # Flags and truth-table values may be booleans or "True"/"False"
+    # strings in any case; shared by the solver and the result caches
+    return value is True or str(value).lower() == "true"
+
+
+class Evaluator:
+    """
+    Evaluates rule ASTs in a fixed context.
+
+    Each predicate is stored as the set of argument tuples its truth table
+    marks true, plus its "negated" flag; a missing entry is false before
+    negation. Function terms are evaluated through the context's function
+    definitions, memoized per argument tuple.
+    """
+
+    def __init__(self, constants, predicates, functions=(), true_atoms=None):
+        """
+        Load a context.
+
+        Args:
+            constants: Constant names, in quantification order
+            predicates: List of {name, data: {paramCount, truthTable},
+                negated}
+            functions: List of {name, data} where data is either
+                a table {"Arg1,Arg2": value} or a Python callable
+            true_atoms: Optional {predicate name: frozenset of argument
+                tuples} for truth tables already loaded, e.g. by
+                fol_dependencies.RuleMemo
+        """
+        self.constants = list(constants)
+        self.true_atoms = {}
+        self.arities = {}
+        self.negated = {}
+        for pred in predicates:
+            name = pred["name"]
+            self.arities[name] = pred["data"]["paramCount"]
+            self.negated[name] = _is_true(pred["negated"])
+            if true_atoms is not None and name in true_atoms:
+                self.true_atoms[name] = true_atoms[name]
+                continue
+            self.true_atoms[name] = frozenset(
+                tuple(key.split(","))
+                for key, value in pred["data"]["truthTable"].items()
+                if _is_true(value)
+            )
+        self.functions = {
+            func["name"]: function_caller(func["data"]) for func in functions
+        }
+        self._function_values = {}
+        # Set while evaluating with a trace
+        self._trace = None
+
+    def evaluate(self, formula, trace=None):
+        """
+        Return the truth value of a closed formula.
+
+        Args:
+            formula: The rule AST
+            trace: Optional list receiving {predicate, args, value} for each
+                atom looked up, in evaluation order
+
+        Raises:
+            FOLEvaluationError: If the rule mentions an unknown predicate or
+                function, applies one to the wrong number of arguments,
+                or a function is undefined on its arguments
+        """
+        self._trace = trace
+        try:
+            return self._eval(formula, {})
+        finally:
+            self._trace = None
+
+    def witness(self, formula):
+        """
+        Return the truth value of a closed formula and why it holds.
+
+        Only the instances that decide the verdict are followed: the first
+        counterexample of a false `forall`, the first witness of a true
+        `exists`, the first k witnesses of a true `atleast(k, x)`, the
+        first k + 1 of a count above its bound, and the first operand that
+        decides a connective. A quantifier decided by all of its instances
+        (a true `forall`, an `exists` without witness, or a count within
+        or below its bounds otherwise) is reported as exhausted instead of
+        being expanded, so the witness stays within the size of the rule
+        however large the domain.
+
+        Args:
+            formula: The rule AST
+
+        Returns:
+            tuple: (value, {"bindings": [{variable, value}], "atoms":
+            [{predicate, args, value}], "exhausted": [{quantifier,
+            variable, bindings}]}), where bindings are the decisive
+            quantifier instances, outermost first
+
+        Raises:
+            FOLEvaluationError: See evaluate()
+        """
+        witness = {"bindings": [], "atoms": [], "exhausted": []}
+        return self._witness(formula, {}, witness), witness
+
+    def _witness(self, node, env, witness):
+        kind = type(node)
+        if kind is Predicate:
+            # The atom is traced straight into the witness
+            self._trace = witness["atoms"]
+            try:
+                return self._atom(node, env)
+            finally:
+                self._trace = None
+        if kind is Not:
+            return not self._witness(node.operand, env, witness)
+        if kind is And or kind is Or:
+            # The first operand equal to `decisive` decides on its own;
+            # otherwise every operand is part of the reason
+            decisive = kind is Or
+            start = _checkpoint(witness)
+            for operand in node.operands:
+                mark = _checkpoint(witness)
+                if self._witness(operand, env, witness) == decisive:
+                    _drop(witness, start, mark)
+                    return decisive
+            return not decisive
+        if kind is Implies:
+            start = _checkpoint(witness)
+            if not self._witness(node.left, env, witness):
+                return True
+            mark = _checkpoint(witness)
+            if self._witness(node.right, env, witness):
+                _drop(witness, start, mark)
+                return True
+            return False
+        if kind is Iff:
+            left = self._witness(node.left, env, witness)
+            return left == self._witness(node.right, env, witness)
+        if kind is Forall or kind is Exists:
+            variable, body = node.variable, node.body
+            decisive = kind is Exists
+            for constant in self.constants:
+                inner = {**env, variable: constant}
+                if self._eval(body, inner) == decisive:
+                    witness["bindings"].append(
+                        {"variable": variable, "value": constant}
+                    )
+                    self._witness(body, inner, witness)
+                    return decisive
+            witness["exhausted"].append(
+                {
+                    "quantifier": "exists" if decisive else "forall",
+                    "variable": variable,
+                    "bindings": dict(env),
+                }
+            )
+            return not decisive
+        if kind is Count:
+            value = self._eval(node, env)
+            low, high = node.bounds()
+            witnesses = []
+            for constant in self.constants:
+                if high is not None and len(witnesses) > high:
+                    break
+                if high is None and len(witnesses) == low:
+                    break
+                if self._eval(node.body, {**env, node.variable: constant}):
+                    witnesses.append(constant)
+            # Too many instances hold, or enough of them for `atleast`
+            if (high is None and value) or not (value or len(witnesses) < low):
+                for constant in witnesses:
+                    inner = {**env, node.variable: constant}
+                    witness["bindings"].append(
+                        {"variable": node.variable, "value": constant}
+                    )
+                    self._witness(node.body, inner, witness)
+                return value
+            witness["exhausted"].append(
+                {
+                    "quantifier": node.kind,
+                    "variable": node.variable,
+                    "bindings": dict(env),
+                }
+            )
+            return value
+        return self._eval(node, env)
+
+    def _eval(self, node, env):
+        kind = type(node)
+        if kind is Predicate:
+            return self._atom(node, env)
+        if kind is Not:
+            return not self._eval(node.operand, env)
+        if kind is And:
+            return all(self._eval(o, env) for o in node.operands)
+        if kind is Or:
+            return any(self._eval(o, env) for o in node.operands)
+        if kind is Implies:
+            return not self._eval(node.left, env) or self._eval(node.right, env)
+        if kind is Iff:
+            return self._eval(node.left, env) == self._eval(node.right, env)
+        if kind is Forall or kind is Exists:
+            variable, body = node.variable, node.body
+            instances = (self._eval(body, {**env, variable: c}) for c in self.constants)
+            return all(instances) if kind is Forall else any(instances)
+        if kind is Count:
+            low, high = node.bounds()
+            count, remaining = 0, len(self.constants)
+            for constant in self.constants:
+                remaining -= 1
+                if self._eval(node.body, {**env, node.variable: constant}):
+                    count += 1
+                    if high is not None and count > high:
+                        return False
+                if count + remaining < low:
+                    return False
+                if count >= low and (high is None or count + remaining <= high):
+                    return True
+            return low <= count and (high is None or count <= high)
+        if kind is Equal:
+            return self._term(node.left, env) == self._term(node.right, env)
+        raise FOLEvaluationError(f"Unsupported formula {node}")
+
+    def ground(self, formula):
+        """
+        Instantiate a closed formula over the domain.
+
+        Quantifiers are expanded into one instance per constant, equalities
+        and function terms are evaluated, and the constants they produce
+        are folded away. What is left is a propositional circuit over the
+        ground atoms in the rule's support, made of True, False,
+        ("atom", (name, args)), ("not", node), ("and", nodes),
+        ("or", nodes), ("iff", left, right) and ("count", low, high,
+        nodes), which holds when between low and high of its nodes do.
+
+        Raises:
+            FOLEvaluationError: See evaluate()
+        """
+        return self._ground(formula, {})
+
+    def atom_value(self, atom):
+        """The value rules see for a ground atom (name, args)."""
+        name, args = atom
+        return (args in self.true_atoms[name]) != self.negated[name]
+
+    def _ground(self, node, env):
+        kind = type(node)
+        if kind is Predicate:
+            return ("atom", (node.name, self._arguments(node, env)))
+        if kind is Not:
+            return _negation(self._ground(node.operand, env))
+        if kind is And or kind is Or:
+            operands = [self._ground(o, env) for o in node.operands]
+            return _connective("and" if kind is And else "or", operands)
+        if kind is Implies:
+            left = _negation(self._ground(node.left, env))
+            return _connective("or", [left, self._ground(node.right, env)])
+        if kind is Iff:
+            left = self._ground(node.left, env)
+            right = self._ground(node.right, env)
+            if type(left) is bool:
+                return right if left else _negation(right)
+            if type(right) is bool:
+                return left if right else _negation(left)
+            return ("iff", left, right)
+        if kind is Forall or kind is Exists:
+            variable, body = node.variable, node.body
+            instances = [
+                self._ground(body, {**env, variable: c}) for c in self.constants
+            ]
+            return _connective("and" if kind is Forall else "or", instances)
+        if kind is Count:
+            instances = [
+                self._ground(node.body, {**env, node.variable: c})
+                for c in self.constants
+            ]
+            return _count(*node.bounds(), instances)
+        return self._eval(node, env)
+
+    def _arguments(self, node, env):
+        if node.name not in self.true_atoms:
+            raise FOLEvaluationError(f"Unknown predicate {node.name}")
+        if len(node.args) != self.arities[node.name]:
+            raise FOLEvaluationError(
+                f"{node.name} takes {self.arities[node.name]} argument(s), "
+                f"got {len(node.args)}"
+            )
+        return tuple(self._term(a, env) for a in node.args)
+
+    def _atom(self, node, env):
+        args = self._arguments(node, env)
+        value = (args in self.true_atoms[node.name]) != self.negated[node.name]
+        if self._trace is not None:
+            self._trace.append(
+                {"predicate": node.name, "args": list(args), "value": value}
+            )
+        return value
+
+    def _term(self, term, env):
+        kind = type(term)
+        if kind is Variable:
+            value = env.get(term.name)
+            if value is None:
+                raise FOLEvaluationError(f"Free variable {term.name}")
+            return value
+        if kind is Constant:
+            return term.name
+        if kind is FunctionTerm:
+            function = self.functions.get(term.name)
+            if function is None:
+                raise FOLEvaluationError(f"Unknown function {term.name}")
+            args = tuple(self._term(a, env) for a in term.args)
+            key = (term.name, args)
+            if key not in self._function_values:
+                self._function_values[key] = function(args)
+            value = self._function_values[key]
+            if value is None:
+                raise FOLEvaluationError(f"{term.name}({','.join(args)}) is undefined")
+            return value
+        raise FOLEvaluationError(f"Unsupported term {term}")
+
+
+def _negation(node):
+    if type(node) is bool:
+        return not node
+    if node[0] == "not":
+        return node[1]
+    return ("not", node)
+
+
+def _connective(op, operands):
+    # Fold constant operands into an "and"/"or" node
+    absorbing = op == "or"
+    kept = []
+    for operand in operands:
+        if type(operand) is bool:
+            if operand == absorbing:
+                return absorbing
+        elif operand[0] == op:
+            kept.extend(operand[1])
+        else:
+            kept.append(operand)
+    if not kept:
+        return not absorbing
+    if len(kept) == 1:
+        return kept[0]
+    return (op, tuple(kept))
+
+
+def _count(low, high, operands):
+    # Fold constant operands into a "count" node, or the "and"/"or" node
+    # it amounts to; a high of None is no upper bound
+    kept = [operand for operand in operands if type(operand) is not bool]
+    held = len(operands) - len(kept) - operands.count(False)
+    low = max(low - held, 0)
+    high = len(kept) if high is None else min(high - held, len(kept))
+    if high < low:
+        return False
+    if low == 0 and high == len(kept):
+        return True
+    if high == 0:
+        return _connective("and", [_negation(operand) for operand in kept])
+    if low == len(kept):
+        return _connective("and", kept)
+    if low == 1 and high == len(kept):
+        return _connective("or", kept)
+    return ("count", low, high, tuple(kept))
+
+
+def _checkpoint(witness):
+    return {key: len(entries) for key, entries in witness.items()}
+
+
+def _drop(witness, start, end):
+    # Forget the reasons recorded between two checkpoints
+    for key, entries in witness.items():
+        del entries[start[key] : end[key]]
+
+
+class _Trace(list):
+    """
+    A trace keeping at most `limit` of the atoms appended to it.
+
+    In "bounded" mode the first `limit` atoms are kept; in "sampled" mode
+    a uniform sample of them, in evaluation order. `total` counts every
+    atom appended.
+    """
+
+    def __init__(self, limit, sampled=False, seed=0):
+        super().__init__()
+        self.limit = limit
+        self.sampled = sampled
+        self.total = 0
+        self._random = random.Random(seed)
+        self._order = []
+
+    def append(self, entry):
+        self.total += 1
+        if len(self) < self.limit:
+            super().append(entry)
+            self._order.append(self.total)
+            return
+        if not self.sampled:
+            return
+        # Reservoir sampling
+        slot = self._random.randrange(self.total)
+        if slot < self.limit:
+            self[slot] = entry
+            self._order[slot] = self.total
+
+    def entries(self):
+        """The kept atoms, in evaluation order."""
+        return [entry for _, entry in sorted(zip(self._order, self))]
+
+
+class _Unsupported(Exception):
+    """Raised when a rule has to be left to the scalar evaluator."""
+
+
+class TensorEvaluator:
+    """
+    Evaluates rule ASTs on boolean arrays over the whole domain.
+
+    Every quantifier of a rule gets an axis of its own, and every
+    subformula evaluates to an array that is either 0-d or has one axis
+    per quantifier, of size n on the axes of its free variables and 1
+    elsewhere, so connectives broadcast and `forall`/`exists` reduce
+    their axis with `all`/`any`. An atom is a single fancy-indexing
+    lookup into its predicate's array.
+
+    Predicates whose dense array would exceed `dense_limit` cells are
+    kept sparse, as the sorted mixed-radix codes of their true argument
+    tuples, and looked up with a binary search.
+
+    Rules whose intermediate arrays would exceed `max_cells` cells, or
+    that the scalar evaluator would reject, are reported by `supports()`
+    and `evaluate()` raises for them; evaluate_rules() then falls back to
+    Evaluator.
+    """
+
+    def __init__(
+        self,
+        constants,
+        predicates,
+        functions=(),
+        max_cells=1 << 26,
+        dense_limit=1 << 24,
+    ):
+        """
+        Load a context, see Evaluator.
+
+        Args:
+            max_cells: Largest intermediate array a rule may need
+            dense_limit: Largest predicate kept as a dense array
+        """
+        self.constants = list(constants)
+        self.constant_ids = {name: i for i, name in enumerate(self.constants)}
+        self.max_cells = max_cells
+        self.dense_limit = dense_limit
+        n = len(self.constants)
+        self.predicates = {}
+        for pred in predicates:
+            arity = pred["data"]["paramCount"]
+            rows = []
+            for key, value in pred["data"]["truthTable"].items():
+                ids = [self.constant_ids.get(name) for name in key.split(",")]
+                if _is_true(value) and len(ids) == arity and None not in ids:
+                    rows.append(ids)
+            ids = np.array(rows, dtype=np.int64).reshape(len(rows), arity)
+            negated = _is_true(pred["negated"])
+            sparse = n**arity > dense_limit
+            if sparse:
+                table = np.unique(self._encode(tuple(ids.T)))
+            else:
+                table = np.zeros((n,) * arity, dtype=bool)
+                if rows:
+                    table[tuple(ids.T)] = True
+            self.predicates[pred["name"]] = (arity, negated, sparse, table)
+        self._function_defs = {f["name"]: f["data"] for f in functions}
+        self._function_tables = {}
+        # id(quantifier node) -> axis, for the rule being evaluated
+        self._axes = {}
+
+    def _encode(self, indices):
+        n = len(self.constants)
+        code = np.int64(0)
+        for index in indices:
+            code = code * n + index
+        return code
+
+    def supports(self, formula):
+        """Whether `evaluate()` can check `formula` within the limits."""
+        n = len(self.constants)
+        free_cache = {}
+        quantifiers = 0
+        for node in iter_nodes(formula):
+            if isinstance(node, (Forall, Exists, Count)):
+                quantifiers += 1
+            if n ** len(free_variables(node, free_cache)) > self.max_cells:
+                return False
+            if isinstance(node, Predicate):
+                entry = self.predicates.get(node.name)
+                if entry is None or entry[0] != len(node.args):
+                    return False
+                # Sparse codes must fit in an int64
+                if entry[2] and n ** entry[0] >= 2**63:
+                    return False
+        # NumPy arrays have at most 32 axes
+        return quantifiers <= 32
+
+    def evaluate(self, formula):
+        """
+        Return the truth value of a closed formula.
+
+        Raises:
+            _Unsupported: If the rule is beyond the limits or would raise
+                an error in the scalar evaluator
+        """
+        if not self.supports(formula):
+            raise _Unsupported(formula)
+        axes = {}
+        for node in iter_nodes(formula):
+            if isinstance(node, (Forall, Exists, Count)):
+                axes[id(node)] = len(axes)
+        self._axes = axes
+        return bool(self._eval(formula, {}))
+
+    def _eval(self, node, env):
+        kind = type(node)
+        if kind is Predicate:
+            _, negated, sparse, table = self.predicates[node.name]
+            indices = tuple(self._term(a, env) for a in node.args)
+            if not sparse:
+                value = table[indices]
+            elif len(table) == 0:
+                value = np.zeros_like(self._encode(indices), dtype=bool)
+            else:
+                codes = self._encode(indices)
+                position = np.searchsorted(table, codes)
+                value = table[np.minimum(position, len(table) - 1)] == codes
+            return ~value if negated else value
+        if kind is Not:
+            return ~self._eval(node.operand, env)
+        if kind is And or kind is Or:
+            values = (self._eval(o, env) for o in node.operands)
+            if kind is And:
+                return functools.reduce(np.logical_and, values)
+            return functools.reduce(np.logical_or, values)
+        if kind is Implies:
+            return ~self._eval(node.left, env) | self._eval(node.right, env)
+        if kind is Iff:
+            return self._eval(node.left, env) == self._eval(node.right, env)
+        if kind is Forall or kind is Exists:
+            axis = self._axes[id(node)]
+            body = self._eval(node.body, {**env, node.variable: axis})
+            if body.ndim == 0:
+                # The body does not depend on the variable
+                if not self.constants:
+                    return np.bool_(kind is Forall)
+                return body
+            if kind is Forall:
+                return body.all(axis=axis, keepdims=True)
+            return body.any(axis=axis, keepdims=True)
+        if kind is Count:
+            axis = self._axes[id(node)]
+            body = self._eval(node.body, {**env, node.variable: axis})
+            if body.ndim == 0 or body.shape[axis] == 1:
+                # The body does not depend on the variable
+                count = body * len(self.constants)
+            else:
+                count = body.sum(axis=axis, keepdims=True)
+            low, high = node.bounds()
+            if high is None:
+                return count >= low
+            return (count >= low) & (count <= high)
+        if kind is Equal:
+            return np.asarray(self._term(node.left, env) == self._term(node.right, env))
+        raise _Unsupported(node)
+
+    def _term(self, term, env):
+        kind = type(term)
+        if kind is Variable:
+            axis = env.get(term.name)
+            if axis is None:
+                raise _Unsupported(term)
+            shape = [1] * len(self._axes)
+            shape[axis] = len(self.constants)
+            return np.arange(len(self.constants)).reshape(shape)
+        if kind is Constant:
+            constant_id = self.constant_ids.get(term.name)
+            if constant_id is None:
+                # Names outside the domain are left to the scalar path
+                raise _Unsupported(term)
+            return np.int64(constant_id)
+        if kind is FunctionTerm:
+            table = self._function_table(term.name, len(term.args))
+            values = table[tuple(self._term(a, env) for a in term.args)]
+            if np.any(values < 0):
+                # Undefined somewhere; the scalar path reports where
+                raise _Unsupported(term)
+            return values
+        raise _Unsupported(term)
+
+    def _function_table(self, name, arity):
+        key = (name, arity)
+        if key not in self._function_tables:
+            definition = self._function_defs.get(name)
+            n = len(self.constants)
+            if definition is None or n**arity > self.dense_limit:
+                raise _Unsupported(name)
+            call = function_caller(definition)
+            # -1 marks arguments the function is undefined or raises on;
+            # the scalar path only calls it on the arguments a rule reaches
+            values = np.full((n,) * arity, -1, dtype=np.int64)
+            for index in np.ndindex(*values.shape):
+                try:
+                    result = call(tuple(self.constants[i] for i in index))
+                except Exception:
+                    continue
+                values[index] = self.constant_ids.get(result, -1)
+            self._function_tables[key] = values
+        return self._function_tables[key]
+
+
+def function_caller(data):
+    """
+    Return a function definition as a callable on argument tuples.
+
+    Args:
+        data: A table {"Arg1,Arg2": value}, where missing entries are
+            undefined (None), or a Python callable
+
+    Raises:
+        FOLEvaluationError: If the definition is not callable
+    """
+    if isinstance(data, dict):
+        table = {tuple(key.split(",")): value for key, value in data.items()}
+        return table.get
+    return _tuple_call(data)
+
+
+def _tuple_call(function):
+    if not callable(function):
+        raise FOLEvaluationError(f"Function definition {function!r} is not callable")
+    signature = inspect.signature(function)
+
+    def call(args):
+        try:
+            signature.bind(*args)
+        except TypeError as e:
+            raise FOLEvaluationError(f"Cannot apply {function.__name__}: {e}")
+        return function(*args)
+
+    return call
+
+
+def load_functions(functions):
+    """
+    Turn the frontend's function definitions into Evaluator functions.
+
+    The frontend stores each function as the Python source of a `def`;
+    that source (and only it; rules are never turned into code) is
+    executed once in a namespace of its own to obtain the callable.
+    Tables are passed through unchanged.
+
+    Args:
+        functions: List of {name, data}
+
+    Returns:
+        list: [{name, data}] with callables or tables as data
+    """
+    loaded = []
+    for func in functions:
+        data = func["data"]
+        if isinstance(data, str):
+            namespace = {}
+            exec(compile(data, f"<function {func['name']}>", "exec"), namespace)
+            data = namespace[func["name"]]
+        loaded.append({"name": func["name"], "data": data})
+    return loaded
+
+
+ENGINES = ("scalar", "tensor")
+TRACE_MODES = ("witness", "full", "bounded", "sampled")
+DEFAULT_TRACE_LIMIT = 100
+
+
+def evaluate_rules(
+    constants,
+    predicates,
+    rules,
+    functions=(),
+    num_new_constants=0,
+    engine="scalar",
+    trace="witness",
+    trace_limit=DEFAULT_TRACE_LIMIT,
+    memo=None,
+):
+    """
+    Evaluate every enabled rule in a context.
+
+    Args:
+        constants: List of {id, name}
+        predicates: List of {name, data: {paramCount, truthTable}, negated}
+        rules: List of {code, enabled, number}
+        functions: Function definitions, see Evaluator
+        num_new_constants: Number of NewConstantK constants to add to the
+            domain, with no true atoms
+        engine: "scalar" to evaluate one binding at a time, or "tensor" to
+            use TensorEvaluator where it applies; tensor verdicts come with
+            empty evaluations
+        trace: Which atoms to report as evaluations: "witness" for those
+            that decided the verdict (see Evaluator.witness, which is also
+            returned as "witness"), "full" for every atom looked up, or
+            "bounded"/"sampled" for the first/a uniform sample of
+            `trace_limit` of them, with "evaluationCount" giving the total
+        trace_limit: Atoms kept by the "bounded" and "sampled" traces
+        memo: Optional fol_dependencies.RuleSnapshot of this context; rules
+            no truth-table edit reached since an earlier request reuse
+            its result
+
+    Returns:
+        dict: {"Rule N": {"satisfied": bool, "rule": code, "evaluations":
+        [{predicate, args, value}]}} or {"Rule N": {"error", "rule"}}
+
+    Raises:
+        ValueError: If `engine` is not one of ENGINES or `trace` not one
+            of TRACE_MODES
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of {ENGINES}, got {engine!r}")
+    if trace not in TRACE_MODES:
+        raise ValueError(f"trace must be one of {TRACE_MODES}, got {trace!r}")
+    names = [c["name"] for c in constants]
+    names += [f"NewConstant{i + 1}" for i in range(num_new_constants)]
+    true_atoms = None if memo is None else memo.true_atoms
+    evaluator = Evaluator(names, predicates, functions, true_atoms)
+    tensor = None
+    if engine == "tensor":
+        tensor = TensorEvaluator(names, predicates, functions)
+    results = {}
+    for index, rule in enumerate(rules):
+        if not _is_true(rule["enabled"]):
+            continue
+        label = f"Rule {rule.get('number', index + 1)}"
+        result = {"rule": rule["code"], "evaluations": []}
+        formula = None
+        try:
+            formula = parse_formula(rule["code"].strip())
+            if memo is not None:
+                stored = memo.lookup(rule["code"])
+                if stored is not None:
+                    results[label] = stored
+                    continue
+            try:
+                if tensor is None:
+                    raise _Unsupported(formula)
+                result["satisfied"] = tensor.evaluate(formula)
+            except _Unsupported:
+                result.update(_evaluate_traced(evaluator, formula, trace, trace_limit))
+        except Exception as e:
+            result = {"error": str(e), "rule": rule["code"]}
+        results[label] = result
+        if memo is not None and formula is not None:
+            memo.store(rule["code"], formula, result)
+    return results
+
+
+def _evaluate_traced(evaluator, formula, trace, trace_limit):
+    if trace == "witness":
+        satisfied, witness = evaluator.witness(formula)
+        return {
+            "satisfied": satisfied,
+            "evaluations": witness["atoms"],
+            "witness": witness,
+        }
+    if trace == "full":
+        atoms = []
+        return {"satisfied": evaluator.evaluate(formula, atoms), "evaluations": atoms}
+    atoms = _Trace(trace_limit, sampled=trace == "sampled")
+    return {
+        "satisfied": evaluator.evaluate(formula, atoms),
+        "evaluations": atoms.entries(),
+        "evaluationCount": atoms.total,
+    }
@@ -0,0 +1,596 @@
+"""
+Explanations of why rules are violated in a context.
+
+The explanation of a violated rule is its complete reason: every
+sufficient reason for the violation, i.e. every minimal set of the
+context's atom values that forces the rule to be false whatever the
+other atoms are. It is written as a DNF over the rule-visible atoms,
+
+    (God(Zeus) & ~Human(Zeus)) | (God(Hera) & ~Human(Hera))
+
+"False" for a satisfied rule and "True" for a rule that cannot hold.
+
+Only the atoms in the rule's support, those left after grounding it in
+the context (see Evaluator.ground), are considered. Sufficient reasons
+are found one at a time by MARCO-style enumeration: a CP-SAT "map" model
+over the support proposes the largest subset of the instance not yet
+explored, a CP-SAT model of the grounded rule decides with assumptions
+whether that subset forces a violation, and sufficient subsets are
+shrunk to a minimal reason. Three-valued evaluation of the grounded rule
+answers most checks without a solver call. Enumeration stops at a time
+budget or a number of reasons, in which case the explanation is marked
+incomplete.
+"""
+
+import logging
+import time
+
+from ortools.sat.python import cp_model
+
+from fol_evaluator import Evaluator, _is_true
+from fol_parser import parse_formula
+
+logger = logging.getLogger(__name__)
+
+# Seconds per explain_rules() call, shared by its rules
+DEFAULT_TIME_BUDGET = 1.0
+DEFAULT_MAX_REASONS = 32
+
+# Reasons up to this size are shrunk with one oracle check per atom
+_SMALL_REASON = 16
+
+
+class _OutOfTime(Exception):
+    """Raised when the time budget of an explanation runs out."""
+
+
+def _decisive(node, fixed):
+    """
+    Three-valued value of a grounded rule, with atoms that settle it.
+
+    Returns:
+        tuple: (value, atoms), where fixing only `atoms` to their values in
+        `fixed` already gives `value`; atoms is meaningless if value is None
+    """
+    if type(node) is bool:
+        return node, set()
+    op = node[0]
+    if op == "atom":
+        value = fixed.get(node[1])
+        return value, {node[1]}
+    if op == "not":
+        value, atoms = _decisive(node[1], fixed)
+        return (None if value is None else not value), atoms
+    if op == "iff":
+        left, left_atoms = _decisive(node[1], fixed)
+        right, right_atoms = _decisive(node[2], fixed)
+        if left is None or right is None:
+            return None, set()
+        return left == right, left_atoms | right_atoms
+    if op == "count":
+        _, low, high, operands = node
+        decided = {True: [], False: []}
+        unknown = 0
+        for operand in operands:
+            value, atoms = _decisive(operand, fixed)
+            if value is None:
+                unknown += 1
+            else:
+                decided[value].append(atoms)
+        held = len(decided[True])
+        if held > high:
+            # Any high + 1 operands that hold
+            return False, set().union(*decided[True][: high + 1])
+        if held + unknown < low:
+            failed = len(operands) - low + 1
+            return False, set().union(*decided[False][:failed])
+        if unknown:
+            return None, set()
+        # Enough operands hold, and enough fail
+        failed = len(operands) - high
+        return True, set().union(*decided[True][:low], *decided[False][:failed])
+    absorbing = op == "or"
+    result, support = not absorbing, set()
+    for operand in node[1]:
+        value, atoms = _decisive(operand, fixed)
+        if value is absorbing:
+            return absorbing, atoms
+        if value is None:
+            result = None
+        else:
+            support |= atoms
+    return result, support
+
+
+class _Circuit:
+    """
+    A grounded rule flattened into arrays, operands before their users.
+
+    Every ground atom is a single leaf, shared by all of its occurrences,
+    and `atoms` lists them in order of first occurrence.
+    """
+
+    def __init__(self, node):
+        self.ops = []
+        self.children = []
+        self.parents = []
+        # Leaf index -> atom, or the value of a constant
+        self.labels = []
+        self.leaves = {}
+        self.root = self._add(node)
+        self.atoms = list(self.leaves)
+
+    def _new(self, op, children, label=None):
+        index = len(self.ops)
+        self.ops.append(op)
+        self.children.append(children)
+        self.parents.append([])
+        self.labels.append(label)
+        for child in children:
+            self.parents[child].append(index)
+        return index
+
+    def _add(self, node):
+        if type(node) is bool:
+            return self._new("const", (), node)
+        op = node[0]
+        if op == "atom":
+            if node[1] not in self.leaves:
+                self.leaves[node[1]] = self._new("atom", (), node[1])
+            return self.leaves[node[1]]
+        if op == "not":
+            return self._new(op, (self._add(node[1]),))
+        if op == "iff":
+            return self._new(op, (self._add(node[1]), self._add(node[2])))
+        if op == "count":
+            # The bounds are the node's label
+            operands = tuple(self._add(operand) for operand in node[3])
+            return self._new(op, operands, node[1:3])
+        return self._new(op, tuple(self._add(operand) for operand in node[1]))
+
+
+class _Propagator:
+    """
+    Three-valued value of a circuit, updated one atom at a time.
+
+    Atoms start at their value in `fixed`, or `default` (None meaning
+    unknown). Every "and"/"or"/"count" node counts its operands by value,
+    so changing an atom only revisits the nodes above it.
+    """
+
+    def __init__(self, circuit, fixed, default=None):
+        self.circuit = circuit
+        self.fixed = fixed
+        self.default = default
+        self.values = []
+        self.counts = []
+        for index, op in enumerate(circuit.ops):
+            counts = None
+            if op == "atom":
+                value = fixed.get(circuit.labels[index], default)
+            elif op == "const":
+                value = circuit.labels[index]
+            else:
+                if op == "and" or op == "or" or op == "count":
+                    counts = {True: 0, False: 0, None: 0}
+                    for child in circuit.children[index]:
+                        counts[self.values[child]] += 1
+                self.counts.append(counts)
+                self.values.append(None)
+                self.values[index] = self._compute(index)
+                continue
+            self.counts.append(counts)
+            self.values.append(value)
+
+    def probe(self, changes):
+        """The rule's value with some atoms changed; they are restored."""
+        try:
+            for atom, value in changes:
+                self._set(atom, value)
+            return self.values[self.circuit.root]
+        finally:
+            for atom, _ in changes:
+                self._set(atom, self.fixed.get(atom, self.default))
+
+    def forget(self, atom):
+        """Make an atom of `fixed` take the default value for good."""
+        del self.fixed[atom]
+        self._set(atom, self.default)
+
+    def _set(self, atom, value):
+        leaf = self.circuit.leaves[atom]
+        old = self.values[leaf]
+        if old is not value:
+            self.values[leaf] = value
+            self._propagate(leaf, old)
+
+    def _compute(self, index):
+        op = self.circuit.ops[index]
+        if op == "and" or op == "or":
+            absorbing = op == "or"
+            counts = self.counts[index]
+            if counts[absorbing]:
+                return absorbing
+            return None if counts[None] else not absorbing
+        if op == "count":
+            low, high = self.circuit.labels[index]
+            counts = self.counts[index]
+            if counts[True] > high or counts[True] + counts[None] < low:
+                return False
+            return None if counts[None] else True
+        values = [self.values[child] for child in self.circuit.children[index]]
+        if None in values:
+            return None
+        if op == "not":
+            return not values[0]
+        return values[0] == values[1]
+
+    def _propagate(self, index, old):
+        new = self.values[index]
+        for parent in self.circuit.parents[index]:
+            counts = self.counts[parent]
+            if counts is not None:
+                counts[old] -= 1
+                counts[new] += 1
+            before = self.values[parent]
+            after = self._compute(parent)
+            if after is not before:
+                self.values[parent] = after
+                self._propagate(parent, before)
+
+
+class _RuleOracle:
+    """
+    Decides whether a set of atom values forces a grounded rule false.
+
+    The set is checked by three-valued propagation with the other atoms
+    unknown, then against completions setting them all false or all
+    true, which settles most checks. Each of these starts from whichever
+    of the instance or the uniform assignment is closer to the set, so a
+    check costs time in the size of the smaller side only. The rest go to
+    CP-SAT: the rule is encoded once, asserted true, and solved with the
+    set's values as assumptions, so the set is sufficient exactly when
+    the model is infeasible.
+    """
+
+    def __init__(self, circuit, instance, deadline):
+        self.circuit = circuit
+        self.instance = instance
+        self.deadline = deadline
+        self.solver_calls = 0
+        self._views = {}
+        self._model = None
+        self._atoms = {}
+
+    def sufficient(self, atoms):
+        """Whether the instance's values of `atoms` force a violation."""
+        if time.perf_counter() > self.deadline:
+            raise _OutOfTime()
+        fixed = {atom: self.instance[atom] for atom in atoms}
+        missing = [atom for atom in self.instance if atom not in fixed]
+        for default in (None, False, True):
+            if len(fixed) <= len(missing):
+                result = self._view(default).probe(list(fixed.items()))
+            else:
+                changes = [(atom, default) for atom in missing]
+                result = self._view("instance").probe(changes)
+            if default is None and result is not None:
+                return result is False
+            if result is True:
+                # A completion satisfying the rule
+                return False
+        if self._model is None:
+            self._model = cp_model.CpModel()
+            self._model.AddBoolAnd([self._literal(self.circuit.root)])
+        self._model.ClearAssumptions()
+        self._model.AddAssumptions(
+            [
+                self._atoms[atom] if value else self._atoms[atom].Not()
+                for atom, value in fixed.items()
+            ]
+        )
+        status, _ = _solve(self._model, self.deadline)
+        self.solver_calls += 1
+        return status == cp_model.INFEASIBLE
+
+    def _view(self, default):
+        if default not in self._views:
+            if default == "instance":
+                view = _Propagator(self.circuit, self.instance)
+            else:
+                view = _Propagator(self.circuit, {}, default)
+            self._views[default] = view
+        return self._views[default]
+
+    def _literal(self, index):
+        # Tseitin encoding: a literal equivalent to the node
+        circuit, model = self.circuit, self._model
+        op = circuit.ops[index]
+        if op == "atom":
+            atom = circuit.labels[index]
+            if atom not in self._atoms:
+                self._atoms[atom] = model.NewBoolVar(str(atom))
+            return self._atoms[atom]
+        if op == "const":
+            return model.NewConstant(int(circuit.labels[index]))
+        operands = [self._literal(child) for child in circuit.children[index]]
+        if op == "not":
+            return operands[0].Not()
+        result = model.NewBoolVar("")
+        if op == "count":
+            low, high = circuit.labels[index]
+            total = sum(operands)
+            model.AddLinearConstraint(total, low, high).OnlyEnforceIf(result)
+            outside = [[0, low - 1], [high + 1, len(operands)]]
+            model.AddLinearExpressionInDomain(
+                total,
+                cp_model.Domain.FromIntervals([i for i in outside if i[0] <= i[1]]),
+            ).OnlyEnforceIf(result.Not())
+            return result
+        if op == "iff":
+            left, right = operands
+            model.Add(left == right).OnlyEnforceIf(result)
+            model.Add(left != right).OnlyEnforceIf(result.Not())
+            return result
+        negations = [operand.Not() for operand in operands]
+        if op == "and":
+            model.AddBoolAnd(operands).OnlyEnforceIf(result)
+            model.AddBoolOr(negations).OnlyEnforceIf(result.Not())
+        else:
+            model.AddBoolOr(operands).OnlyEnforceIf(result)
+            model.AddBoolAnd(negations).OnlyEnforceIf(result.Not())
+        return result
+
+
+def _solve(model, deadline):
+    remaining = deadline - time.perf_counter()
+    if remaining <= 0:
+        raise _OutOfTime()
+    solver = cp_model.CpSolver()
+    solver.parameters.max_time_in_seconds = remaining
+    solver.parameters.num_workers = 1
+    status = solver.Solve(model)
+    if status == cp_model.UNKNOWN:
+        raise _OutOfTime()
+    return status, solver
+
+
+def explain(evaluator, formula, time_budget=DEFAULT_TIME_BUDGET, max_reasons=None):
+    """
+    Compute the sufficient reasons for a rule being violated.
+
+    Args:
+        evaluator: Evaluator holding the context
+        formula: The rule AST
+        time_budget: Seconds to spend on the rule; once they run out the
+            reasons found so far are returned (at least one, not
+            necessarily minimal, if the rule is violated)
+        max_reasons: Stop after this many reasons; None for
+            DEFAULT_MAX_REASONS
+
+    Returns:
+        dict: {"violated": bool, "reasons": [[atom]], "complete": bool},
+        where each reason lists (name, args) atoms, in their order in the
+        rule, and complete tells whether every reason was found
+
+    Raises:
+        FOLEvaluationError: If the rule cannot be evaluated, see Evaluator
+    """
+    if max_reasons is None:
+        max_reasons = DEFAULT_MAX_REASONS
+    deadline = time.perf_counter() + time_budget
+    tree = evaluator.ground(formula)
+    circuit = _Circuit(tree)
+    order = {atom: position for position, atom in enumerate(circuit.atoms)}
+    instance = {atom: evaluator.atom_value(atom) for atom in circuit.atoms}
+    satisfied, atoms = _decisive(tree, instance)
+    if satisfied:
+        return {"violated": False, "reasons": [], "complete": True}
+
+    oracle = _RuleOracle(circuit, instance, deadline)
+    reasons = []
+    # The reason being shrunk; sufficient all along, so kept on timeout
+    shrinking = None
+
+    def shrink(seed):
+        nonlocal shrinking
+        # Start from the atoms that settle the rule under the seed alone
+        value, candidate = _decisive(tree, {a: instance[a] for a in seed})
+        shrinking = sorted(candidate if value is False else seed, key=order.get)
+        if len(shrinking) <= _SMALL_REASON:
+            for atom in list(shrinking):
+                smaller = [a for a in shrinking if a != atom]
+                if oracle.sufficient(smaller):
+                    shrinking = smaller
+        else:
+            # Large candidates are shrunk on a propagator of their own,
+            # so each step only costs the atom's occurrences
+            state = _Propagator(circuit, {a: instance[a] for a in shrinking})
+            for atom in list(shrinking):
+                if time.perf_counter() > deadline:
+                    raise _OutOfTime()
+                # Not needed if the rule stays false without it, needed if
+                # flipping it makes the rule true; else ask the oracle
+                if state.probe([(atom, None)]) is False or (
+                    state.probe([(atom, not instance[atom])]) is not True
+                    and oracle.sufficient([a for a in shrinking if a != atom])
+                ):
+                    state.forget(atom)
+                    shrinking = [a for a in shrinking if a != atom]
+        reason, shrinking = shrinking, None
+        return reason
+
+    complete = False
+    # The map model is only built once greedy seeds run out; it then
+    # excludes every superset of a reason and every subset of a seed
+    # that is not sufficient
+    map_model = selected = None
+    insufficient = []
+
+    def block(model, reason=None, seed=None):
+        if reason is not None:
+            model.AddBoolOr([selected[atom].Not() for atom in reason])
+        else:
+            model.AddBoolOr([selected[atom] for atom in order if atom not in seed])
+
+    # Seeds leave out one atom of every reason found; they come from
+    # dropping the last atom of each reason as long as that yields new
+    # reasons, and from the map model afterwards
+    dropped = set()
+    try:
+        while len(reasons) < max_reasons:
+            if not insufficient:
+                seed = [atom for atom in order if atom not in dropped]
+            else:
+                if map_model is None:
+                    map_model = cp_model.CpModel()
+                    selected = {atom: map_model.NewBoolVar("") for atom in order}
+                    map_model.Maximize(sum(selected.values()))
+                    for reason in reasons:
+                        block(map_model, reason=reason)
+                    for seed in insufficient:
+                        block(map_model, seed=seed)
+                # A time-limited solve may return a seed that is not
+                # maximal, which only costs extra iterations
+                status, solver = _solve(map_model, deadline)
+                if status == cp_model.INFEASIBLE:
+                    complete = True
+                    break
+                seed = [a for a in order if solver.BooleanValue(selected[a])]
+            if oracle.sufficient(seed):
+                reason = shrink(seed)
+                reasons.append(reason)
+                if not reason:
+                    # The rule cannot hold at all
+                    complete = True
+                    break
+                dropped.add(reason[-1])
+                if map_model is not None:
+                    block(map_model, reason=reason)
+            else:
+                insufficient.append(set(seed))
+                if map_model is not None:
+                    block(map_model, seed=insufficient[-1])
+    except _OutOfTime:
+        logger.debug("Explanation of %s ran out of time", formula)
+        if shrinking is not None:
+            reasons.append(shrinking)
+    if not reasons:
+        reasons.append(sorted(atoms, key=order.get))
+    logger.debug(
+        "Explained %s: %d reason(s), %d solver call(s)",
+        formula,
+        len(reasons),
+        oracle.solver_calls,
+    )
+    return {"violated": True, "reasons": reasons, "complete": complete}
+
+
+def _literal_text(atom, value):
+    name, args = atom
+    return f"{'' if value else '~'}{name}({', '.join(args)})"
+
+
+def format_reasons(reasons, evaluator):
+    """
+    Write reasons as a DNF string, e.g. "(P(A) & ~Q(A)) | R(B)".
+
+    Args:
+        reasons: Lists of (name, args) atoms, as returned by explain()
+        evaluator: Evaluator giving the atoms' values
+
+    Returns:
+        str: "False" if there is no reason, "True" for an empty one
+    """
+    if not reasons:
+        return "False"
+    terms = []
+    for reason in reasons:
+        if not reason:
+            return "True"
+        literals = [_literal_text(atom, evaluator.atom_value(atom)) for atom in reason]
+        term = " & ".join(literals)
+        terms.append(f"({term})" if len(literals) > 1 and len(reasons) > 1 else term)
+    return " | ".join(terms)
+
+
+def explain_rules(
+    constants,
+    predicates,
+    rules,
+    functions=(),
+    time_budget=DEFAULT_TIME_BUDGET,
+    max_reasons=DEFAULT_MAX_REASONS,
+    memo=None,
+):
+    """
+    Explain every enabled rule in a context.
+
+    Args:
+        constants: List of {id, name}
+        predicates: List of {name, data: {paramCount, truthTable}, negated}
+        rules: List of {code, enabled, number}
+        functions: Function definitions, see Evaluator
+        time_budget: Seconds for all rules; each rule gets an even share of
+            what the rules before it left, see explain()
+        max_reasons: Reasons reported per rule at most
+        memo: Optional fol_dependencies.RuleSnapshot of this context; rules
+            no truth-table edit reached since an earlier request reuse
+            their explanation and leave their share of the budget to the
+            others
+
+    Returns:
+        dict: {"Rule N": {"rule": code, "result": DNF string, "reasons":
+        [[{predicate, args, value}]], "complete": bool}} or
+        {"Rule N": {"error", "rule"}}
+    """
+    true_atoms = None if memo is None else memo.true_atoms
+    evaluator = Evaluator(
+        [c["name"] for c in constants], predicates, functions, true_atoms
+    )
+    deadline = time.perf_counter() + time_budget
+    enabled = [
+        (index, rule) for index, rule in enumerate(rules) if _is_true(rule["enabled"])
+    ]
+    pending = []
+    results = {}
+    for index, rule in enabled:
+        label = f"Rule {rule.get('number', index + 1)}"
+        try:
+            formula = parse_formula(rule["code"].strip())
+        except Exception as e:
+            results[label] = {"error": str(e), "rule": rule["code"]}
+            continue
+        stored = None if memo is None else memo.lookup(rule["code"])
+        if stored is None:
+            pending.append((label, rule, formula))
+        results[label] = stored
+    for position, (label, rule, formula) in enumerate(pending):
+        share = (deadline - time.perf_counter()) / (len(pending) - position)
+        results[label] = _explain_rule(evaluator, rule, formula, share, max_reasons)
+        if memo is not None:
+            memo.store(rule["code"], formula, results[label])
+    return results
+
+
+def _explain_rule(evaluator, rule, formula, time_budget, max_reasons):
+    try:
+        explanation = explain(evaluator, formula, time_budget, max_reasons)
+    except Exception as e:
+        return {"error": str(e), "rule": rule["code"]}
+    return {
+        "rule": rule["code"],
+        "result": format_reasons(explanation["reasons"], evaluator),
+        "reasons": [
+            [
+                {
+                    "predicate": name,
+                    "args": list(args),
+                    "value": evaluator.atom_value((name, args)),
+                }
+                for name, args in reason
+            ]
+            for reason in explanation["reasons"]
+        ],
+        "complete": explanation["complete"],
+    }
@@ -0,0 +1,422 @@
+"""
+Python parser for the FOL language described in lang/fol.g4.
+
+Rules are parsed into an immutable AST that the solver (and anything else
+that needs to reason about a rule) can walk directly, instead of
+re-slicing the rule text.
+
+Connectives bind, from tightest to loosest: `!`, `&&`, `||`, `->`, `<->`.
+`->` is right associative, the other binary connectives are left
+associative, and a quantifier's body extends as far to the right as
+possible (`forall(x) A(x) -> B(x)` quantifies the whole implication).
+Parenthesised sub-formulas are accepted as well. The counting quantifiers
+`atmost(k, x)`, `atleast(k, x)` and `exactly(k, x)` scope like `forall`
+and bound the number of constants x satisfying their body.
+
+Parsed rules are memoized by their text in a bounded LRU cache, so every
+component checking the same rule (the solver, the evaluator and the
+explainer) shares one AST for as long as the process lives.
+"""
+
+from dataclasses import dataclass
+import functools
+import re
+
+
+class FOLSyntaxError(ValueError):
+    """Raised when a rule does not follow the FOL grammar."""
+
+
+# ---------------------------------------------------------------------------
+# AST
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class Constant:
+    name: str
+
+    def __str__(self):
+        return self.name
+
+
+@dataclass(frozen=True)
+class Variable:
+    name: str
+
+    def __str__(self):
+        return self.name
+
+
+@dataclass(frozen=True)
+class FunctionTerm:
+    name: str
+    args: tuple
+
+    def __str__(self):
+        return f"{self.name}({','.join(str(a) for a in self.args)})"
+
+
+@dataclass(frozen=True)
+class Predicate:
+    name: str
+    args: tuple
+
+    def __str__(self):
+        return f"{self.name}({','.join(str(a) for a in self.args)})"
+
+
+@dataclass(frozen=True)
+class Equal:
+    left: object
+    right: object
+
+    def __str__(self):
+        return f"{self.left} == {self.right}"
+
+
+@dataclass(frozen=True)
+class Not:
+    operand: object
+
+    def __str__(self):
+        return f"!{_wrap(self.operand)}"
+
+
+@dataclass(frozen=True)
+class And:
+    operands: tuple
+
+    def __str__(self):
+        return " && ".join(_wrap(o) for o in self.operands)
+
+
+@dataclass(frozen=True)
+class Or:
+    operands: tuple
+
+    def __str__(self):
+        return " || ".join(_wrap(o) for o in self.operands)
+
+
+@dataclass(frozen=True)
+class Implies:
+    left: object
+    right: object
+
+    def __str__(self):
+        return f"{_wrap(self.left)} -> {_wrap(self.right)}"
+
+
+@dataclass(frozen=True)
+class Iff:
+    left: object
+    right: object
+
+    def __str__(self):
+        return f"{_wrap(self.left)} <-> {_wrap(self.right)}"
+
+
+@dataclass(frozen=True)
+class Forall:
+    variable: str
+    body: object
+
+    def __str__(self):
+        return f"forall({self.variable}) {self.body}"
+
+
+@dataclass(frozen=True)
+class Exists:
+    variable: str
+    body: object
+
+    def __str__(self):
+        return f"exists({self.variable}) {self.body}"
+
+
+@dataclass(frozen=True)
+class Count:
+    kind: str
+    bound: int
+    variable: str
+    body: object
+
+    def __str__(self):
+        return f"{self.kind}({self.bound},{self.variable}) {self.body}"
+
+    def bounds(self):
+        """
+        Return (low, high) bounds on the number of constants satisfying
+        the body; high is None for `atleast`.
+        """
+        if self.kind == "atmost":
+            return 0, self.bound
+        if self.kind == "atleast":
+            return self.bound, None
+        return self.bound, self.bound
+
+
+def _wrap(node):
+    if isinstance(node, (Predicate, Not)):
+        return str(node)
+    return f"({node})"
+
+
+QUANTIFIERS = (Forall, Exists, Count)
+
+# Kinds of counting quantifiers, see Count
+COUNTING = ("atmost", "atleast", "exactly")
+
+
+# ---------------------------------------------------------------------------
+# Lexer
+# ---------------------------------------------------------------------------
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<WHITESPACE>[ \t]+)
+  | (?P<ENDLINE>[\r\n]+)
+  | (?P<BICOND><->)
+  | (?P<IMPL>->)
+  | (?P<CONJ>&&)
+  | (?P<DISJ>\|\|)
+  | (?P<EQUAL>==)
+  | (?P<NOT>!)
+  | (?P<LPAREN>\()
+  | (?P<RPAREN>\))
+  | (?P<SEPARATOR>,)
+  | (?P<UPPER_CONSTANT>[A-Z][a-zA-Z0-9]*)
+  | (?P<LOWER_CONSTANT>[a-z][a-zA-Z0-9]*)
+  | (?P<NUMBER>[0-9]+)
+    """,
+    re.VERBOSE,
+)
+
+_KEYWORDS = {
+    "forall": "FORALL",
+    "exists": "EXISTS",
+    **{kind: "COUNTING" for kind in COUNTING},
+}
+
+
+def tokenize(text):
+    """Split rule text into (kind, value, position) tuples."""
+    tokens = []
+    pos = 0
+    while pos < len(text):
+        match = _TOKEN_RE.match(text, pos)
+        if match is None:
+            raise FOLSyntaxError(f"Unexpected character {text[pos]!r} at {pos}")
+        kind = match.lastgroup
+        value = match.group()
+        if kind == "LOWER_CONSTANT":
+            kind = _KEYWORDS.get(value, kind)
+        if kind != "WHITESPACE":
+            tokens.append((kind, value, pos))
+        pos = match.end()
+    tokens.append(("EOF", "", pos))
+    return tokens
+
+
+# ---------------------------------------------------------------------------
+# Parser
+# ---------------------------------------------------------------------------
+
+
+class _Parser:
+    def __init__(self, text):
+        self.tokens = tokenize(text)
+        self.index = 0
+
+    def peek(self, offset=0):
+        return self.tokens[self.index + offset]
+
+    def advance(self):
+        token = self.tokens[self.index]
+        self.index += 1
+        return token
+
+    def expect(self, kind):
+        token = self.advance()
+        if token[0] != kind:
+            raise FOLSyntaxError(
+                f"Expected {kind} but found {token[1] or token[0]!r} at {token[2]}"
+            )
+        return token
+
+    def skip_endlines(self):
+        while self.peek()[0] == "ENDLINE":
+            self.advance()
+
+    def condition(self):
+        self.skip_endlines()
+        formulas = [self.formula()]
+        while self.peek()[0] == "ENDLINE":
+            self.skip_endlines()
+            if self.peek()[0] == "EOF":
+                break
+            formulas.append(self.formula())
+        self.expect("EOF")
+        return formulas
+
+    def formula(self):
+        return self.iff()
+
+    def iff(self):
+        left = self.implies()
+        while self.peek()[0] == "BICOND":
+            self.advance()
+            left = Iff(left, self.implies())
+        return left
+
+    def implies(self):
+        left = self.disjunction()
+        if self.peek()[0] == "IMPL":
+            self.advance()
+            return Implies(left, self.implies())
+        return left
+
+    def disjunction(self):
+        operands = [self.conjunction()]
+        while self.peek()[0] == "DISJ":
+            self.advance()
+            operands.append(self.conjunction())
+        return operands[0] if len(operands) == 1 else Or(tuple(operands))
+
+    def conjunction(self):
+        operands = [self.unary()]
+        while self.peek()[0] == "CONJ":
+            self.advance()
+            operands.append(self.unary())
+        return operands[0] if len(operands) == 1 else And(tuple(operands))
+
+    def unary(self):
+        kind, value, pos = self.peek()
+        if kind == "NOT":
+            self.advance()
+            return Not(self.unary())
+        if kind in ("FORALL", "EXISTS"):
+            self.advance()
+            self.expect("LPAREN")
+            variable = self.expect("LOWER_CONSTANT")[1]
+            self.expect("RPAREN")
+            body = self.formula()
+            return (
+                Forall(variable, body) if kind == "FORALL" else Exists(variable, body)
+            )
+        if kind == "COUNTING":
+            self.advance()
+            self.expect("LPAREN")
+            bound = int(self.expect("NUMBER")[1])
+            self.expect("SEPARATOR")
+            variable = self.expect("LOWER_CONSTANT")[1]
+            self.expect("RPAREN")
+            return Count(value, bound, variable, self.formula())
+        if kind == "LPAREN":
+            self.advance()
+            inner = self.formula()
+            self.expect("RPAREN")
+            return inner
+        if kind == "UPPER_CONSTANT" and self.peek(1)[0] == "LPAREN":
+            self.advance()
+            return Predicate(value, self.arguments())
+        if kind in ("UPPER_CONSTANT", "LOWER_CONSTANT"):
+            left = self.term()
+            self.expect("EQUAL")
+            return Equal(left, self.term())
+        raise FOLSyntaxError(f"Unexpected {value or kind!r} at {pos}")
+
+    def arguments(self):
+        self.expect("LPAREN")
+        args = [self.term()]
+        while self.peek()[0] == "SEPARATOR":
+            self.advance()
+            args.append(self.term())
+        self.expect("RPAREN")
+        return tuple(args)
+
+    def term(self):
+        kind, value, pos = self.advance()
+        if kind == "UPPER_CONSTANT":
+            return Constant(value)
+        if kind == "LOWER_CONSTANT":
+            if self.peek()[0] == "LPAREN":
+                return FunctionTerm(value, self.arguments())
+            return Variable(value)
+        raise FOLSyntaxError(f"Expected a term but found {value or kind!r} at {pos}")
+
+
+# Number of distinct rule texts whose AST is kept by parse_formula
+PARSE_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_formula(text):
+    """
+    Parse a rule into an AST.
+
+    A rule spanning several lines is the conjunction of its lines, matching
+    the `condition` rule of the grammar. The AST is immutable, so the
+    result is cached by `text` and the same object is returned for the
+    same rule; syntax errors are not cached.
+
+    Raises:
+        FOLSyntaxError: If the text does not follow the grammar.
+    """
+    formulas = _Parser(text).condition()
+    return formulas[0] if len(formulas) == 1 else And(tuple(formulas))
+
+
+def free_variables(node, cache=None):
+    """Return the frozenset of variable names occurring free in `node`."""
+    if cache is not None and id(node) in cache:
+        return cache[id(node)]
+    if isinstance(node, Variable):
+        result = frozenset([node.name])
+    elif isinstance(node, Constant):
+        result = frozenset()
+    elif isinstance(node, (Predicate, FunctionTerm)):
+        result = frozenset().union(*(free_variables(a, cache) for a in node.args))
+    elif isinstance(node, (Equal, Implies, Iff)):
+        result = free_variables(node.left, cache) | free_variables(node.right, cache)
+    elif isinstance(node, Not):
+        result = free_variables(node.operand, cache)
+    elif isinstance(node, (And, Or)):
+        result = frozenset().union(*(free_variables(o, cache) for o in node.operands))
+    elif isinstance(node, QUANTIFIERS):
+        result = free_variables(node.body, cache) - {node.variable}
+    else:
+        raise TypeError(f"Unknown AST node {node!r}")
+    if cache is not None:
+        cache[id(node)] = result
+    return result
+
+
+def children(node):
+    """Return the direct sub-formulas and sub-terms of `node`."""
+    if isinstance(node, (Predicate, FunctionTerm)):
+        return node.args
+    if isinstance(node, (Equal, Implies, Iff)):
+        return (node.left, node.right)
+    if isinstance(node, Not):
+        return (node.operand,)
+    if isinstance(node, (And, Or)):
+        return node.operands
+    if isinstance(node, QUANTIFIERS):
+        return (node.body,)
+    return ()
+
+
+def iter_nodes(node):
+    """Yield `node` and every sub-formula and sub-term below it."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        yield current
+        stack.extend(reversed(children(current)))
+
+
+def constant_names(node):
+    """Return the frozenset of individual constants mentioned in `node`."""
+    return frozenset(n.name for n in iter_nodes(node) if isinstance(n, Constant))
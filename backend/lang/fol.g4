@@ -26,6 +26,7 @@ formula
     | NOT formula
     | FORALL LPAREN variable RPAREN formula
     | EXISTS LPAREN variable RPAREN formula
+    | COUNTING LPAREN NUMBER separator variable RPAREN formula
     | pred_constant LPAREN term (separator term)* RPAREN
     | term EQUAL term
     ;
@@ -94,6 +95,13 @@ EXISTS
     : 'exists'
     ;
 
+//counting quantifiers - np. atmost(2, y) Parent(y, x)
+COUNTING
+    : 'atmost'
+    | 'atleast'
+    | 'exactly'
+    ;
+
 //predicate constant - np. _isProfesor(?x)   
 UPPER_CONSTANT
     : [A-Z] [a-zA-Z0-9]*
@@ -103,6 +111,10 @@ LOWER_CONSTANT
     : [a-z] [a-zA-Z0-9]*
     ;
 
+NUMBER
+    : [0-9]+
+    ;
+
 CONJ
     : '&&'
     ;
@@ -16,8 +16,9 @@ public class folParser extends Parser {
 	protected static final PredictionContextCache _sharedContextCache =
 		new PredictionContextCache();
 	public static final int
-		T__0=1, LPAREN=2, RPAREN=3, EQUAL=4, NOT=5, FORALL=6, EXISTS=7, UPPER_CONSTANT=8, 
-		LOWER_CONSTANT=9, CONJ=10, DISJ=11, IMPL=12, BICOND=13, ENDLINE=14, WHITESPACE=15;
+		T__0=1, LPAREN=2, RPAREN=3, EQUAL=4, NOT=5, FORALL=6, EXISTS=7, COUNTING=8, 
+		UPPER_CONSTANT=9, LOWER_CONSTANT=10, NUMBER=11, CONJ=12, DISJ=13, IMPL=14, 
+		BICOND=15, ENDLINE=16, WHITESPACE=17;
 	public static final int
 		RULE_condition = 0, RULE_formula = 1, RULE_term = 2, RULE_bin_connective = 3, 
 		RULE_variable = 4, RULE_pred_constant = 5, RULE_ind_constant = 6, RULE_func_constant = 7, 
@@ -33,14 +34,15 @@ public class folParser extends Parser {
 	private static String[] makeLiteralNames() {
 		return new String[] {
 			null, "','", "'('", "')'", "'=='", "'!'", "'forall'", "'exists'", null, 
-			null, "'&&'", "'||'", "'->'", "'<->'"
+			null, null, null, "'&&'", "'||'", "'->'", "'<->'"
 		};
 	}
 	private static final String[] _LITERAL_NAMES = makeLiteralNames();
 	private static String[] makeSymbolicNames() {
 		return new String[] {
-			null, null, "LPAREN", "RPAREN", "EQUAL", "NOT", "FORALL", "EXISTS", "UPPER_CONSTANT", 
-			"LOWER_CONSTANT", "CONJ", "DISJ", "IMPL", "BICOND", "ENDLINE", "WHITESPACE"
+			null, null, "LPAREN", "RPAREN", "EQUAL", "NOT", "FORALL", "EXISTS", "COUNTING", 
+			"UPPER_CONSTANT", "LOWER_CONSTANT", "NUMBER", "CONJ", "DISJ", "IMPL", 
+			"BICOND", "ENDLINE", "WHITESPACE"
 		};
 	}
 	private static final String[] _SYMBOLIC_NAMES = makeSymbolicNames();
@@ -197,6 +199,14 @@ public class folParser extends Parser {
 		}
 		public TerminalNode RPAREN() { return getToken(folParser.RPAREN, 0); }
 		public TerminalNode EXISTS() { return getToken(folParser.EXISTS, 0); }
+		public TerminalNode COUNTING() { return getToken(folParser.COUNTING, 0); }
+		public TerminalNode NUMBER() { return getToken(folParser.NUMBER, 0); }
+		public List<SeparatorContext> separator() {
+			return getRuleContexts(SeparatorContext.class);
+		}
+		public SeparatorContext separator(int i) {
+			return getRuleContext(SeparatorContext.class,i);
+		}
 		public Pred_constantContext pred_constant() {
 			return getRuleContext(Pred_constantContext.class,0);
 		}
@@ -206,12 +216,6 @@ public class folParser extends Parser {
 		public TermContext term(int i) {
 			return getRuleContext(TermContext.class,i);
 		}
-		public List<SeparatorContext> separator() {
-			return getRuleContexts(SeparatorContext.class);
-		}
-		public SeparatorContext separator(int i) {
-			return getRuleContext(SeparatorContext.class,i);
-		}
 		public TerminalNode EQUAL() { return getToken(folParser.EQUAL, 0); }
 		public FormulaContext(ParserRuleContext parent, int invokingState) {
 			super(parent, invokingState);
@@ -243,7 +247,7 @@ public class folParser extends Parser {
 			int _alt;
 			enterOuterAlt(_localctx, 1);
 			{
-			setState(71);
+			setState(79);
 			_errHandler.sync(this);
 			switch ( getInterpreter().adaptivePredict(_input,3,_ctx) ) {
 			case 1:
@@ -255,7 +259,7 @@ public class folParser extends Parser {
 				setState(37);
 				bin_connective();
 				setState(38);
-				formula(6);
+				formula(7);
 				}
 				break;
 			case 2:
@@ -263,7 +267,7 @@ public class folParser extends Parser {
 				setState(40);
 				match(NOT);
 				setState(41);
-				formula(5);
+				formula(6);
 				}
 				break;
 			case 3:
@@ -277,7 +281,7 @@ public class folParser extends Parser {
 				setState(45);
 				match(RPAREN);
 				setState(46);
-				formula(4);
+				formula(5);
 				}
 				break;
 			case 4:
@@ -291,50 +295,68 @@ public class folParser extends Parser {
 				setState(51);
 				match(RPAREN);
 				setState(52);
-				formula(3);
+				formula(4);
 				}
 				break;
 			case 5:
 				{
 				setState(54);
-				pred_constant();
+				match(COUNTING);
 				setState(55);
 				match(LPAREN);
 				setState(56);
-				term();
+				match(NUMBER);
+				setState(57);
+				separator();
+				setState(58);
+				variable();
+				setState(59);
+				match(RPAREN);
+				setState(60);
+				formula(3);
+				}
+				break;
+			case 6:
+				{
 				setState(62);
+				pred_constant();
+				setState(63);
+				match(LPAREN);
+				setState(64);
+				term();
+				setState(70);
 				_errHandler.sync(this);
 				_la = _input.LA(1);
 				while (_la==T__0) {
 					{
 					{
-					setState(57);
+					setState(65);
 					separator();
-					setState(58);
+					setState(66);
 					term();
 					}
 					}
-					setState(64);
+					setState(72);
 					_errHandler.sync(this);
 					_la = _input.LA(1);
 				}
-				setState(65);
+				setState(73);
 				match(RPAREN);
 				}
 				break;
-			case 6:
+			case 7:
 				{
-				setState(67);
+				setState(75);
 				term();
-				setState(68);
+				setState(76);
 				match(EQUAL);
-				setState(69);
+				setState(77);
 				term();
 				}
 				break;
 			}
 			_ctx.stop = _input.LT(-1);
-			setState(79);
+			setState(87);
 			_errHandler.sync(this);
 			_alt = getInterpreter().adaptivePredict(_input,4,_ctx);
 			while ( _alt!=2 && _alt!=org.antlr.v4.runtime.atn.ATN.INVALID_ALT_NUMBER ) {
@@ -345,16 +367,16 @@ public class folParser extends Parser {
 					{
 					_localctx = new FormulaContext(_parentctx, _parentState);
 					pushNewRecursionContext(_localctx, _startState, RULE_formula);
-					setState(73);
-					if (!(precpred(_ctx, 7))) throw new FailedPredicateException(this, "precpred(_ctx, 7)");
-					setState(74);
+					setState(81);
+					if (!(precpred(_ctx, 8))) throw new FailedPredicateException(this, "precpred(_ctx, 8)");
+					setState(82);
 					bin_connective();
-					setState(75);
-					formula(8);
+					setState(83);
+					formula(9);
 					}
 					} 
 				}
-				setState(81);
+				setState(89);
 				_errHandler.sync(this);
 				_alt = getInterpreter().adaptivePredict(_input,4,_ctx);
 			}
@@ -415,49 +437,49 @@ public class folParser extends Parser {
 		enterRule(_localctx, 4, RULE_term);
 		int _la;
 		try {
-			setState(97);
+			setState(105);
 			_errHandler.sync(this);
 			switch ( getInterpreter().adaptivePredict(_input,6,_ctx) ) {
 			case 1:
 				enterOuterAlt(_localctx, 1);
 				{
-				setState(82);
+				setState(90);
 				ind_constant();
 				}
 				break;
 			case 2:
 				enterOuterAlt(_localctx, 2);
 				{
-				setState(83);
+				setState(91);
 				variable();
 				}
 				break;
 			case 3:
 				enterOuterAlt(_localctx, 3);
 				{
-				setState(84);
+				setState(92);
 				func_constant();
-				setState(85);
+				setState(93);
 				match(LPAREN);
-				setState(86);
+				setState(94);
 				term();
-				setState(92);
+				setState(100);
 				_errHandler.sync(this);
 				_la = _input.LA(1);
 				while (_la==T__0) {
 					{
 					{
-					setState(87);
+					setState(95);
 					separator();
-					setState(88);
+					setState(96);
 					term();
 					}
 					}
-					setState(94);
+					setState(102);
 					_errHandler.sync(this);
 					_la = _input.LA(1);
 				}
-				setState(95);
+				setState(103);
 				match(RPAREN);
 				}
 				break;
@@ -501,9 +523,9 @@ public class folParser extends Parser {
 		try {
 			enterOuterAlt(_localctx, 1);
 			{
-			setState(99);
+			setState(107);
 			_la = _input.LA(1);
-			if ( !((((_la) & ~0x3f) == 0 && ((1L << _la) & 15360L) != 0)) ) {
+			if ( !((((_la) & ~0x3f) == 0 && ((1L << _la) & 61440L) != 0)) ) {
 			_errHandler.recoverInline(this);
 			}
 			else {
@@ -547,7 +569,7 @@ public class folParser extends Parser {
 		try {
 			enterOuterAlt(_localctx, 1);
 			{
-			setState(101);
+			setState(109);
 			match(LOWER_CONSTANT);
 			}
 		}
@@ -585,7 +607,7 @@ public class folParser extends Parser {
 		try {
 			enterOuterAlt(_localctx, 1);
 			{
-			setState(103);
+			setState(111);
 			match(UPPER_CONSTANT);
 			}
 		}
@@ -602,7 +624,7 @@ public class folParser extends Parser {
 
 	@SuppressWarnings("CheckReturnValue")
 	public static class Ind_constantContext extends ParserRuleContext {
-		public TerminalNode LOWER_CONSTANT() { return getToken(folParser.LOWER_CONSTANT, 0); }
+		public TerminalNode UPPER_CONSTANT() { return getToken(folParser.UPPER_CONSTANT, 0); }
 		public Ind_constantContext(ParserRuleContext parent, int invokingState) {
 			super(parent, invokingState);
 		}
@@ -623,8 +645,8 @@ public class folParser extends Parser {
 		try {
 			enterOuterAlt(_localctx, 1);
 			{
-			setState(105);
-			match(LOWER_CONSTANT);
+			setState(113);
+			match(UPPER_CONSTANT);
 			}
 		}
 		catch (RecognitionException re) {
@@ -661,7 +683,7 @@ public class folParser extends Parser {
 		try {
 			enterOuterAlt(_localctx, 1);
 			{
-			setState(107);
+			setState(115);
 			match(LOWER_CONSTANT);
 			}
 		}
@@ -698,7 +720,7 @@ public class folParser extends Parser {
 		try {
 			enterOuterAlt(_localctx, 1);
 			{
-			setState(109);
+			setState(117);
 			match(T__0);
 			}
 		}
@@ -723,13 +745,13 @@ public class folParser extends Parser {
 	private boolean formula_sempred(FormulaContext _localctx, int predIndex) {
 		switch (predIndex) {
 		case 0:
-			return precpred(_ctx, 7);
+			return precpred(_ctx, 8);
 		}
 		return true;
 	}
 
 	public static final String _serializedATN =
-		"\u0004\u0001\u000fp\u0002\u0000\u0007\u0000\u0002\u0001\u0007\u0001\u0002"+
+		"\u0004\u0001\u0011x\u0002\u0000\u0007\u0000\u0002\u0001\u0007\u0001\u0002"+
 		"\u0002\u0007\u0002\u0002\u0003\u0007\u0003\u0002\u0004\u0007\u0004\u0002"+
 		"\u0005\u0007\u0005\u0002\u0006\u0007\u0006\u0002\u0007\u0007\u0007\u0002"+
 		"\b\u0007\b\u0001\u0000\u0001\u0000\u0001\u0000\u0005\u0000\u0016\b\u0000"+
@@ -739,60 +761,64 @@ public class folParser extends Parser {
 		"\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001"+
 		"\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001"+
 		"\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001"+
-		"\u0001\u0005\u0001=\b\u0001\n\u0001\f\u0001@\t\u0001\u0001\u0001\u0001"+
-		"\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0003\u0001H\b"+
-		"\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0005\u0001N\b"+
-		"\u0001\n\u0001\f\u0001Q\t\u0001\u0001\u0002\u0001\u0002\u0001\u0002\u0001"+
-		"\u0002\u0001\u0002\u0001\u0002\u0001\u0002\u0001\u0002\u0005\u0002[\b"+
-		"\u0002\n\u0002\f\u0002^\t\u0002\u0001\u0002\u0001\u0002\u0003\u0002b\b"+
-		"\u0002\u0001\u0003\u0001\u0003\u0001\u0004\u0001\u0004\u0001\u0005\u0001"+
-		"\u0005\u0001\u0006\u0001\u0006\u0001\u0007\u0001\u0007\u0001\b\u0001\b"+
-		"\u0001\b\u0000\u0001\u0002\t\u0000\u0002\u0004\u0006\b\n\f\u000e\u0010"+
-		"\u0000\u0001\u0001\u0000\n\rr\u0000\u0012\u0001\u0000\u0000\u0000\u0002"+
-		"G\u0001\u0000\u0000\u0000\u0004a\u0001\u0000\u0000\u0000\u0006c\u0001"+
-		"\u0000\u0000\u0000\be\u0001\u0000\u0000\u0000\ng\u0001\u0000\u0000\u0000"+
-		"\fi\u0001\u0000\u0000\u0000\u000ek\u0001\u0000\u0000\u0000\u0010m\u0001"+
-		"\u0000\u0000\u0000\u0012\u0017\u0003\u0002\u0001\u0000\u0013\u0014\u0005"+
-		"\u000e\u0000\u0000\u0014\u0016\u0003\u0002\u0001\u0000\u0015\u0013\u0001"+
-		"\u0000\u0000\u0000\u0016\u0019\u0001\u0000\u0000\u0000\u0017\u0015\u0001"+
-		"\u0000\u0000\u0000\u0017\u0018\u0001\u0000\u0000\u0000\u0018\u001d\u0001"+
-		"\u0000\u0000\u0000\u0019\u0017\u0001\u0000\u0000\u0000\u001a\u001c\u0005"+
-		"\u000e\u0000\u0000\u001b\u001a\u0001\u0000\u0000\u0000\u001c\u001f\u0001"+
-		"\u0000\u0000\u0000\u001d\u001b\u0001\u0000\u0000\u0000\u001d\u001e\u0001"+
-		"\u0000\u0000\u0000\u001e \u0001\u0000\u0000\u0000\u001f\u001d\u0001\u0000"+
-		"\u0000\u0000 !\u0005\u0000\u0000\u0001!\u0001\u0001\u0000\u0000\u0000"+
-		"\"#\u0006\u0001\uffff\uffff\u0000#$\u0005\u0005\u0000\u0000$%\u0003\u0002"+
-		"\u0001\u0000%&\u0003\u0006\u0003\u0000&\'\u0003\u0002\u0001\u0006\'H\u0001"+
-		"\u0000\u0000\u0000()\u0005\u0005\u0000\u0000)H\u0003\u0002\u0001\u0005"+
-		"*+\u0005\u0006\u0000\u0000+,\u0005\u0002\u0000\u0000,-\u0003\b\u0004\u0000"+
-		"-.\u0005\u0003\u0000\u0000./\u0003\u0002\u0001\u0004/H\u0001\u0000\u0000"+
-		"\u000001\u0005\u0007\u0000\u000012\u0005\u0002\u0000\u000023\u0003\b\u0004"+
-		"\u000034\u0005\u0003\u0000\u000045\u0003\u0002\u0001\u00035H\u0001\u0000"+
-		"\u0000\u000067\u0003\n\u0005\u000078\u0005\u0002\u0000\u00008>\u0003\u0004"+
-		"\u0002\u00009:\u0003\u0010\b\u0000:;\u0003\u0004\u0002\u0000;=\u0001\u0000"+
-		"\u0000\u0000<9\u0001\u0000\u0000\u0000=@\u0001\u0000\u0000\u0000><\u0001"+
-		"\u0000\u0000\u0000>?\u0001\u0000\u0000\u0000?A\u0001\u0000\u0000\u0000"+
-		"@>\u0001\u0000\u0000\u0000AB\u0005\u0003\u0000\u0000BH\u0001\u0000\u0000"+
-		"\u0000CD\u0003\u0004\u0002\u0000DE\u0005\u0004\u0000\u0000EF\u0003\u0004"+
-		"\u0002\u0000FH\u0001\u0000\u0000\u0000G\"\u0001\u0000\u0000\u0000G(\u0001"+
-		"\u0000\u0000\u0000G*\u0001\u0000\u0000\u0000G0\u0001\u0000\u0000\u0000"+
-		"G6\u0001\u0000\u0000\u0000GC\u0001\u0000\u0000\u0000HO\u0001\u0000\u0000"+
-		"\u0000IJ\n\u0007\u0000\u0000JK\u0003\u0006\u0003\u0000KL\u0003\u0002\u0001"+
-		"\bLN\u0001\u0000\u0000\u0000MI\u0001\u0000\u0000\u0000NQ\u0001\u0000\u0000"+
-		"\u0000OM\u0001\u0000\u0000\u0000OP\u0001\u0000\u0000\u0000P\u0003\u0001"+
-		"\u0000\u0000\u0000QO\u0001\u0000\u0000\u0000Rb\u0003\f\u0006\u0000Sb\u0003"+
-		"\b\u0004\u0000TU\u0003\u000e\u0007\u0000UV\u0005\u0002\u0000\u0000V\\"+
-		"\u0003\u0004\u0002\u0000WX\u0003\u0010\b\u0000XY\u0003\u0004\u0002\u0000"+
-		"Y[\u0001\u0000\u0000\u0000ZW\u0001\u0000\u0000\u0000[^\u0001\u0000\u0000"+
-		"\u0000\\Z\u0001\u0000\u0000\u0000\\]\u0001\u0000\u0000\u0000]_\u0001\u0000"+
-		"\u0000\u0000^\\\u0001\u0000\u0000\u0000_`\u0005\u0003\u0000\u0000`b\u0001"+
-		"\u0000\u0000\u0000aR\u0001\u0000\u0000\u0000aS\u0001\u0000\u0000\u0000"+
-		"aT\u0001\u0000\u0000\u0000b\u0005\u0001\u0000\u0000\u0000cd\u0007\u0000"+
-		"\u0000\u0000d\u0007\u0001\u0000\u0000\u0000ef\u0005\t\u0000\u0000f\t\u0001"+
-		"\u0000\u0000\u0000gh\u0005\b\u0000\u0000h\u000b\u0001\u0000\u0000\u0000"+
-		"ij\u0005\t\u0000\u0000j\r\u0001\u0000\u0000\u0000kl\u0005\t\u0000\u0000"+
-		"l\u000f\u0001\u0000\u0000\u0000mn\u0005\u0001\u0000\u0000n\u0011\u0001"+
-		"\u0000\u0000\u0000\u0007\u0017\u001d>GO\\a";
+		"\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001"+
+		"\u0001\u0001\u0001\u0001\u0001\u0005\u0001E\b\u0001\n\u0001\f\u0001H\t"+
+		"\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001"+
+		"\u0001\u0003\u0001P\b\u0001\u0001\u0001\u0001\u0001\u0001\u0001\u0001"+
+		"\u0001\u0005\u0001V\b\u0001\n\u0001\f\u0001Y\t\u0001\u0001\u0002\u0001"+
+		"\u0002\u0001\u0002\u0001\u0002\u0001\u0002\u0001\u0002\u0001\u0002\u0001"+
+		"\u0002\u0005\u0002c\b\u0002\n\u0002\f\u0002f\t\u0002\u0001\u0002\u0001"+
+		"\u0002\u0003\u0002j\b\u0002\u0001\u0003\u0001\u0003\u0001\u0004\u0001"+
+		"\u0004\u0001\u0005\u0001\u0005\u0001\u0006\u0001\u0006\u0001\u0007\u0001"+
+		"\u0007\u0001\b\u0001\b\u0001\b\u0000\u0001\u0002\t\u0000\u0002\u0004\u0006"+
+		"\b\n\f\u000e\u0010\u0000\u0001\u0001\u0000\f\u000f{\u0000\u0012\u0001"+
+		"\u0000\u0000\u0000\u0002O\u0001\u0000\u0000\u0000\u0004i\u0001\u0000\u0000"+
+		"\u0000\u0006k\u0001\u0000\u0000\u0000\bm\u0001\u0000\u0000\u0000\no\u0001"+
+		"\u0000\u0000\u0000\fq\u0001\u0000\u0000\u0000\u000es\u0001\u0000\u0000"+
+		"\u0000\u0010u\u0001\u0000\u0000\u0000\u0012\u0017\u0003\u0002\u0001\u0000"+
+		"\u0013\u0014\u0005\u0010\u0000\u0000\u0014\u0016\u0003\u0002\u0001\u0000"+
+		"\u0015\u0013\u0001\u0000\u0000\u0000\u0016\u0019\u0001\u0000\u0000\u0000"+
+		"\u0017\u0015\u0001\u0000\u0000\u0000\u0017\u0018\u0001\u0000\u0000\u0000"+
+		"\u0018\u001d\u0001\u0000\u0000\u0000\u0019\u0017\u0001\u0000\u0000\u0000"+
+		"\u001a\u001c\u0005\u0010\u0000\u0000\u001b\u001a\u0001\u0000\u0000\u0000"+
+		"\u001c\u001f\u0001\u0000\u0000\u0000\u001d\u001b\u0001\u0000\u0000\u0000"+
+		"\u001d\u001e\u0001\u0000\u0000\u0000\u001e \u0001\u0000\u0000\u0000\u001f"+
+		"\u001d\u0001\u0000\u0000\u0000 !\u0005\u0000\u0000\u0001!\u0001\u0001"+
+		"\u0000\u0000\u0000\"#\u0006\u0001\uffff\uffff\u0000#$\u0005\u0005\u0000"+
+		"\u0000$%\u0003\u0002\u0001\u0000%&\u0003\u0006\u0003\u0000&\'\u0003\u0002"+
+		"\u0001\u0007\'P\u0001\u0000\u0000\u0000()\u0005\u0005\u0000\u0000)P\u0003"+
+		"\u0002\u0001\u0006*+\u0005\u0006\u0000\u0000+,\u0005\u0002\u0000\u0000"+
+		",-\u0003\b\u0004\u0000-.\u0005\u0003\u0000\u0000./\u0003\u0002\u0001\u0005"+
+		"/P\u0001\u0000\u0000\u000001\u0005\u0007\u0000\u000012\u0005\u0002\u0000"+
+		"\u000023\u0003\b\u0004\u000034\u0005\u0003\u0000\u000045\u0003\u0002\u0001"+
+		"\u00045P\u0001\u0000\u0000\u000067\u0005\b\u0000\u000078\u0005\u0002\u0000"+
+		"\u000089\u0005\u000b\u0000\u00009:\u0003\u0010\b\u0000:;\u0003\b\u0004"+
+		"\u0000;<\u0005\u0003\u0000\u0000<=\u0003\u0002\u0001\u0003=P\u0001\u0000"+
+		"\u0000\u0000>?\u0003\n\u0005\u0000?@\u0005\u0002\u0000\u0000@F\u0003\u0004"+
+		"\u0002\u0000AB\u0003\u0010\b\u0000BC\u0003\u0004\u0002\u0000CE\u0001\u0000"+
+		"\u0000\u0000DA\u0001\u0000\u0000\u0000EH\u0001\u0000\u0000\u0000FD\u0001"+
+		"\u0000\u0000\u0000FG\u0001\u0000\u0000\u0000GI\u0001\u0000\u0000\u0000"+
+		"HF\u0001\u0000\u0000\u0000IJ\u0005\u0003\u0000\u0000JP\u0001\u0000\u0000"+
+		"\u0000KL\u0003\u0004\u0002\u0000LM\u0005\u0004\u0000\u0000MN\u0003\u0004"+
+		"\u0002\u0000NP\u0001\u0000\u0000\u0000O\"\u0001\u0000\u0000\u0000O(\u0001"+
+		"\u0000\u0000\u0000O*\u0001\u0000\u0000\u0000O0\u0001\u0000\u0000\u0000"+
+		"O6\u0001\u0000\u0000\u0000O>\u0001\u0000\u0000\u0000OK\u0001\u0000\u0000"+
+		"\u0000PW\u0001\u0000\u0000\u0000QR\n\b\u0000\u0000RS\u0003\u0006\u0003"+
+		"\u0000ST\u0003\u0002\u0001\tTV\u0001\u0000\u0000\u0000UQ\u0001\u0000\u0000"+
+		"\u0000VY\u0001\u0000\u0000\u0000WU\u0001\u0000\u0000\u0000WX\u0001\u0000"+
+		"\u0000\u0000X\u0003\u0001\u0000\u0000\u0000YW\u0001\u0000\u0000\u0000"+
+		"Zj\u0003\f\u0006\u0000[j\u0003\b\u0004\u0000\\]\u0003\u000e\u0007\u0000"+
+		"]^\u0005\u0002\u0000\u0000^d\u0003\u0004\u0002\u0000_`\u0003\u0010\b\u0000"+
+		"`a\u0003\u0004\u0002\u0000ac\u0001\u0000\u0000\u0000b_\u0001\u0000\u0000"+
+		"\u0000cf\u0001\u0000\u0000\u0000db\u0001\u0000\u0000\u0000de\u0001\u0000"+
+		"\u0000\u0000eg\u0001\u0000\u0000\u0000fd\u0001\u0000\u0000\u0000gh\u0005"+
+		"\u0003\u0000\u0000hj\u0001\u0000\u0000\u0000iZ\u0001\u0000\u0000\u0000"+
+		"i[\u0001\u0000\u0000\u0000i\\\u0001\u0000\u0000\u0000j\u0005\u0001\u0000"+
+		"\u0000\u0000kl\u0007\u0000\u0000\u0000l\u0007\u0001\u0000\u0000\u0000"+
+		"mn\u0005\n\u0000\u0000n\t\u0001\u0000\u0000\u0000op\u0005\t\u0000\u0000"+
+		"p\u000b\u0001\u0000\u0000\u0000qr\u0005\t\u0000\u0000r\r\u0001\u0000\u0000"+
+		"\u0000st\u0005\n\u0000\u0000t\u000f\u0001\u0000\u0000\u0000uv\u0005\u0001"+
+		"\u0000\u0000v\u0011\u0001\u0000\u0000\u0000\u0007\u0017\u001dFOWdi";
 	public static final ATN _ATN =
 		new ATNDeserializer().deserialize(_serializedATN.toCharArray());
 	static {
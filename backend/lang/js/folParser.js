@@ -4,37 +4,40 @@ import antlr4 from 'antlr4';
 import folListener from './folListener.js';
 import folVisitor from './folVisitor.js';
 
-const serializedATN = [4,1,15,112,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,
+const serializedATN = [4,1,17,120,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,
 4,2,5,7,5,2,6,7,6,2,7,7,7,2,8,7,8,1,0,1,0,1,0,5,0,22,8,0,10,0,12,0,25,9,
 0,1,0,5,0,28,8,0,10,0,12,0,31,9,0,1,0,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
 1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
-1,5,1,61,8,1,10,1,12,1,64,9,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,72,8,1,1,1,1,1,
-1,1,1,1,5,1,78,8,1,10,1,12,1,81,9,1,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,5,2,
-91,8,2,10,2,12,2,94,9,2,1,2,1,2,3,2,98,8,2,1,3,1,3,1,4,1,4,1,5,1,5,1,6,1,
-6,1,7,1,7,1,8,1,8,1,8,0,1,2,9,0,2,4,6,8,10,12,14,16,0,1,1,0,10,13,114,0,
-18,1,0,0,0,2,71,1,0,0,0,4,97,1,0,0,0,6,99,1,0,0,0,8,101,1,0,0,0,10,103,1,
-0,0,0,12,105,1,0,0,0,14,107,1,0,0,0,16,109,1,0,0,0,18,23,3,2,1,0,19,20,5,
-14,0,0,20,22,3,2,1,0,21,19,1,0,0,0,22,25,1,0,0,0,23,21,1,0,0,0,23,24,1,0,
-0,0,24,29,1,0,0,0,25,23,1,0,0,0,26,28,5,14,0,0,27,26,1,0,0,0,28,31,1,0,0,
-0,29,27,1,0,0,0,29,30,1,0,0,0,30,32,1,0,0,0,31,29,1,0,0,0,32,33,5,0,0,1,
-33,1,1,0,0,0,34,35,6,1,-1,0,35,36,5,5,0,0,36,37,3,2,1,0,37,38,3,6,3,0,38,
-39,3,2,1,6,39,72,1,0,0,0,40,41,5,5,0,0,41,72,3,2,1,5,42,43,5,6,0,0,43,44,
-5,2,0,0,44,45,3,8,4,0,45,46,5,3,0,0,46,47,3,2,1,4,47,72,1,0,0,0,48,49,5,
-7,0,0,49,50,5,2,0,0,50,51,3,8,4,0,51,52,5,3,0,0,52,53,3,2,1,3,53,72,1,0,
-0,0,54,55,3,10,5,0,55,56,5,2,0,0,56,62,3,4,2,0,57,58,3,16,8,0,58,59,3,4,
-2,0,59,61,1,0,0,0,60,57,1,0,0,0,61,64,1,0,0,0,62,60,1,0,0,0,62,63,1,0,0,
-0,63,65,1,0,0,0,64,62,1,0,0,0,65,66,5,3,0,0,66,72,1,0,0,0,67,68,3,4,2,0,
-68,69,5,4,0,0,69,70,3,4,2,0,70,72,1,0,0,0,71,34,1,0,0,0,71,40,1,0,0,0,71,
-42,1,0,0,0,71,48,1,0,0,0,71,54,1,0,0,0,71,67,1,0,0,0,72,79,1,0,0,0,73,74,
-10,7,0,0,74,75,3,6,3,0,75,76,3,2,1,8,76,78,1,0,0,0,77,73,1,0,0,0,78,81,1,
-0,0,0,79,77,1,0,0,0,79,80,1,0,0,0,80,3,1,0,0,0,81,79,1,0,0,0,82,98,3,12,
-6,0,83,98,3,8,4,0,84,85,3,14,7,0,85,86,5,2,0,0,86,92,3,4,2,0,87,88,3,16,
-8,0,88,89,3,4,2,0,89,91,1,0,0,0,90,87,1,0,0,0,91,94,1,0,0,0,92,90,1,0,0,
-0,92,93,1,0,0,0,93,95,1,0,0,0,94,92,1,0,0,0,95,96,5,3,0,0,96,98,1,0,0,0,
-97,82,1,0,0,0,97,83,1,0,0,0,97,84,1,0,0,0,98,5,1,0,0,0,99,100,7,0,0,0,100,
-7,1,0,0,0,101,102,5,9,0,0,102,9,1,0,0,0,103,104,5,8,0,0,104,11,1,0,0,0,105,
-106,5,8,0,0,106,13,1,0,0,0,107,108,5,9,0,0,108,15,1,0,0,0,109,110,5,1,0,
-0,110,17,1,0,0,0,7,23,29,62,71,79,92,97];
+1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,1,69,8,1,10,1,12,1,72,9,1,1,1,1,1,1,
+1,1,1,1,1,1,1,3,1,80,8,1,1,1,1,1,1,1,1,1,5,1,86,8,1,10,1,12,1,89,9,1,1,2,
+1,2,1,2,1,2,1,2,1,2,1,2,1,2,5,2,99,8,2,10,2,12,2,102,9,2,1,2,1,2,3,2,106,
+8,2,1,3,1,3,1,4,1,4,1,5,1,5,1,6,1,6,1,7,1,7,1,8,1,8,1,8,0,1,2,9,0,2,4,6,
+8,10,12,14,16,0,1,1,0,12,15,123,0,18,1,0,0,0,2,79,1,0,0,0,4,105,1,0,0,0,
+6,107,1,0,0,0,8,109,1,0,0,0,10,111,1,0,0,0,12,113,1,0,0,0,14,115,1,0,0,0,
+16,117,1,0,0,0,18,23,3,2,1,0,19,20,5,16,0,0,20,22,3,2,1,0,21,19,1,0,0,0,
+22,25,1,0,0,0,23,21,1,0,0,0,23,24,1,0,0,0,24,29,1,0,0,0,25,23,1,0,0,0,26,
+28,5,16,0,0,27,26,1,0,0,0,28,31,1,0,0,0,29,27,1,0,0,0,29,30,1,0,0,0,30,32,
+1,0,0,0,31,29,1,0,0,0,32,33,5,0,0,1,33,1,1,0,0,0,34,35,6,1,-1,0,35,36,5,
+5,0,0,36,37,3,2,1,0,37,38,3,6,3,0,38,39,3,2,1,7,39,80,1,0,0,0,40,41,5,5,
+0,0,41,80,3,2,1,6,42,43,5,6,0,0,43,44,5,2,0,0,44,45,3,8,4,0,45,46,5,3,0,
+0,46,47,3,2,1,5,47,80,1,0,0,0,48,49,5,7,0,0,49,50,5,2,0,0,50,51,3,8,4,0,
+51,52,5,3,0,0,52,53,3,2,1,4,53,80,1,0,0,0,54,55,5,8,0,0,55,56,5,2,0,0,56,
+57,5,11,0,0,57,58,3,16,8,0,58,59,3,8,4,0,59,60,5,3,0,0,60,61,3,2,1,3,61,
+80,1,0,0,0,62,63,3,10,5,0,63,64,5,2,0,0,64,70,3,4,2,0,65,66,3,16,8,0,66,
+67,3,4,2,0,67,69,1,0,0,0,68,65,1,0,0,0,69,72,1,0,0,0,70,68,1,0,0,0,70,71,
+1,0,0,0,71,73,1,0,0,0,72,70,1,0,0,0,73,74,5,3,0,0,74,80,1,0,0,0,75,76,3,
+4,2,0,76,77,5,4,0,0,77,78,3,4,2,0,78,80,1,0,0,0,79,34,1,0,0,0,79,40,1,0,
+0,0,79,42,1,0,0,0,79,48,1,0,0,0,79,54,1,0,0,0,79,62,1,0,0,0,79,75,1,0,0,
+0,80,87,1,0,0,0,81,82,10,8,0,0,82,83,3,6,3,0,83,84,3,2,1,9,84,86,1,0,0,0,
+85,81,1,0,0,0,86,89,1,0,0,0,87,85,1,0,0,0,87,88,1,0,0,0,88,3,1,0,0,0,89,
+87,1,0,0,0,90,106,3,12,6,0,91,106,3,8,4,0,92,93,3,14,7,0,93,94,5,2,0,0,94,
+100,3,4,2,0,95,96,3,16,8,0,96,97,3,4,2,0,97,99,1,0,0,0,98,95,1,0,0,0,99,
+102,1,0,0,0,100,98,1,0,0,0,100,101,1,0,0,0,101,103,1,0,0,0,102,100,1,0,0,
+0,103,104,5,3,0,0,104,106,1,0,0,0,105,90,1,0,0,0,105,91,1,0,0,0,105,92,1,
+0,0,0,106,5,1,0,0,0,107,108,7,0,0,0,108,7,1,0,0,0,109,110,5,10,0,0,110,9,
+1,0,0,0,111,112,5,9,0,0,112,11,1,0,0,0,113,114,5,9,0,0,114,13,1,0,0,0,115,
+116,5,10,0,0,116,15,1,0,0,0,117,118,5,1,0,0,118,17,1,0,0,0,7,23,29,70,79,
+87,100,105];
 
 
 const atn = new antlr4.atn.ATNDeserializer().deserialize(serializedATN);
@@ -47,12 +50,12 @@ export default class folParser extends antlr4.Parser {
 
     static grammarFileName = "fol.g4";
     static literalNames = [ null, "','", "'('", "')'", "'=='", "'!'", "'forall'", 
-                            "'exists'", null, null, "'&&'", "'||'", "'->'", 
-                            "'<->'" ];
+                            "'exists'", null, null, null, null, "'&&'", 
+                            "'||'", "'->'", "'<->'" ];
     static symbolicNames = [ null, null, "LPAREN", "RPAREN", "EQUAL", "NOT", 
-                             "FORALL", "EXISTS", "UPPER_CONSTANT", "LOWER_CONSTANT", 
-                             "CONJ", "DISJ", "IMPL", "BICOND", "ENDLINE", 
-                             "WHITESPACE" ];
+                             "FORALL", "EXISTS", "COUNTING", "UPPER_CONSTANT", 
+                             "LOWER_CONSTANT", "NUMBER", "CONJ", "DISJ", 
+                             "IMPL", "BICOND", "ENDLINE", "WHITESPACE" ];
     static ruleNames = [ "condition", "formula", "term", "bin_connective", 
                          "variable", "pred_constant", "ind_constant", "func_constant", 
                          "separator" ];
@@ -77,7 +80,7 @@ export default class folParser extends antlr4.Parser {
     formula_sempred(localctx, predIndex) {
     	switch(predIndex) {
     		case 0:
-    			return this.precpred(this._ctx, 7);
+    			return this.precpred(this._ctx, 8);
     		default:
     			throw "No predicate with index:" + predIndex;
     	}
@@ -112,7 +115,7 @@ export default class folParser extends antlr4.Parser {
 	        this.state = 29;
 	        this._errHandler.sync(this);
 	        _la = this._input.LA(1);
-	        while(_la===14) {
+	        while(_la===16) {
 	            this.state = 26;
 	            this.match(folParser.ENDLINE);
 	            this.state = 31;
@@ -149,7 +152,7 @@ export default class folParser extends antlr4.Parser {
 	    var _la = 0;
 	    try {
 	        this.enterOuterAlt(localctx, 1);
-	        this.state = 71;
+	        this.state = 79;
 	        this._errHandler.sync(this);
 	        var la_ = this._interp.adaptivePredict(this._input,3,this._ctx);
 	        switch(la_) {
@@ -161,14 +164,14 @@ export default class folParser extends antlr4.Parser {
 	            this.state = 37;
 	            this.bin_connective();
 	            this.state = 38;
-	            this.formula(6);
+	            this.formula(7);
 	            break;
 
 	        case 2:
 	            this.state = 40;
 	            this.match(folParser.NOT);
 	            this.state = 41;
-	            this.formula(5);
+	            this.formula(6);
 	            break;
 
 	        case 3:
@@ -181,7 +184,7 @@ export default class folParser extends antlr4.Parser {
 	            this.state = 45;
 	            this.match(folParser.RPAREN);
 	            this.state = 46;
-	            this.formula(4);
+	            this.formula(5);
 	            break;
 
 	        case 4:
@@ -194,44 +197,61 @@ export default class folParser extends antlr4.Parser {
 	            this.state = 51;
 	            this.match(folParser.RPAREN);
 	            this.state = 52;
-	            this.formula(3);
+	            this.formula(4);
 	            break;
 
 	        case 5:
 	            this.state = 54;
-	            this.pred_constant();
+	            this.match(folParser.COUNTING);
 	            this.state = 55;
 	            this.match(folParser.LPAREN);
 	            this.state = 56;
-	            this.term();
+	            this.match(folParser.NUMBER);
+	            this.state = 57;
+	            this.separator();
+	            this.state = 58;
+	            this.variable();
+	            this.state = 59;
+	            this.match(folParser.RPAREN);
+	            this.state = 60;
+	            this.formula(3);
+	            break;
+
+	        case 6:
 	            this.state = 62;
+	            this.pred_constant();
+	            this.state = 63;
+	            this.match(folParser.LPAREN);
+	            this.state = 64;
+	            this.term();
+	            this.state = 70;
 	            this._errHandler.sync(this);
 	            _la = this._input.LA(1);
 	            while(_la===1) {
-	                this.state = 57;
+	                this.state = 65;
 	                this.separator();
-	                this.state = 58;
+	                this.state = 66;
 	                this.term();
-	                this.state = 64;
+	                this.state = 72;
 	                this._errHandler.sync(this);
 	                _la = this._input.LA(1);
 	            }
-	            this.state = 65;
+	            this.state = 73;
 	            this.match(folParser.RPAREN);
 	            break;
 
-	        case 6:
-	            this.state = 67;
+	        case 7:
+	            this.state = 75;
 	            this.term();
-	            this.state = 68;
+	            this.state = 76;
 	            this.match(folParser.EQUAL);
-	            this.state = 69;
+	            this.state = 77;
 	            this.term();
 	            break;
 
 	        }
 	        this._ctx.stop = this._input.LT(-1);
-	        this.state = 79;
+	        this.state = 87;
 	        this._errHandler.sync(this);
 	        var _alt = this._interp.adaptivePredict(this._input,4,this._ctx)
 	        while(_alt!=2 && _alt!=antlr4.atn.ATN.INVALID_ALT_NUMBER) {
@@ -242,16 +262,16 @@ export default class folParser extends antlr4.Parser {
 	                _prevctx = localctx;
 	                localctx = new FormulaContext(this, _parentctx, _parentState);
 	                this.pushNewRecursionContext(localctx, _startState, folParser.RULE_formula);
-	                this.state = 73;
-	                if (!( this.precpred(this._ctx, 7))) {
-	                    throw new antlr4.error.FailedPredicateException(this, "this.precpred(this._ctx, 7)");
+	                this.state = 81;
+	                if (!( this.precpred(this._ctx, 8))) {
+	                    throw new antlr4.error.FailedPredicateException(this, "this.precpred(this._ctx, 8)");
 	                }
-	                this.state = 74;
+	                this.state = 82;
 	                this.bin_connective();
-	                this.state = 75;
-	                this.formula(8); 
+	                this.state = 83;
+	                this.formula(9); 
 	            }
-	            this.state = 81;
+	            this.state = 89;
 	            this._errHandler.sync(this);
 	            _alt = this._interp.adaptivePredict(this._input,4,this._ctx);
 	        }
@@ -277,43 +297,43 @@ export default class folParser extends antlr4.Parser {
 	    this.enterRule(localctx, 4, folParser.RULE_term);
 	    var _la = 0;
 	    try {
-	        this.state = 97;
+	        this.state = 105;
 	        this._errHandler.sync(this);
 	        var la_ = this._interp.adaptivePredict(this._input,6,this._ctx);
 	        switch(la_) {
 	        case 1:
 	            this.enterOuterAlt(localctx, 1);
-	            this.state = 82;
+	            this.state = 90;
 	            this.ind_constant();
 	            break;
 
 	        case 2:
 	            this.enterOuterAlt(localctx, 2);
-	            this.state = 83;
+	            this.state = 91;
 	            this.variable();
 	            break;
 
 	        case 3:
 	            this.enterOuterAlt(localctx, 3);
-	            this.state = 84;
+	            this.state = 92;
 	            this.func_constant();
-	            this.state = 85;
+	            this.state = 93;
 	            this.match(folParser.LPAREN);
-	            this.state = 86;
+	            this.state = 94;
 	            this.term();
-	            this.state = 92;
+	            this.state = 100;
 	            this._errHandler.sync(this);
 	            _la = this._input.LA(1);
 	            while(_la===1) {
-	                this.state = 87;
+	                this.state = 95;
 	                this.separator();
-	                this.state = 88;
+	                this.state = 96;
 	                this.term();
-	                this.state = 94;
+	                this.state = 102;
 	                this._errHandler.sync(this);
 	                _la = this._input.LA(1);
 	            }
-	            this.state = 95;
+	            this.state = 103;
 	            this.match(folParser.RPAREN);
 	            break;
 
@@ -340,9 +360,9 @@ export default class folParser extends antlr4.Parser {
 	    var _la = 0;
 	    try {
 	        this.enterOuterAlt(localctx, 1);
-	        this.state = 99;
+	        this.state = 107;
 	        _la = this._input.LA(1);
-	        if(!((((_la) & ~0x1f) === 0 && ((1 << _la) & 15360) !== 0))) {
+	        if(!((((_la) & ~0x1f) === 0 && ((1 << _la) & 61440) !== 0))) {
 	        this._errHandler.recoverInline(this);
 	        }
 	        else {
@@ -370,7 +390,7 @@ export default class folParser extends antlr4.Parser {
 	    this.enterRule(localctx, 8, folParser.RULE_variable);
 	    try {
 	        this.enterOuterAlt(localctx, 1);
-	        this.state = 101;
+	        this.state = 109;
 	        this.match(folParser.LOWER_CONSTANT);
 	    } catch (re) {
 	    	if(re instanceof antlr4.error.RecognitionException) {
@@ -393,7 +413,7 @@ export default class folParser extends antlr4.Parser {
 	    this.enterRule(localctx, 10, folParser.RULE_pred_constant);
 	    try {
 	        this.enterOuterAlt(localctx, 1);
-	        this.state = 103;
+	        this.state = 111;
 	        this.match(folParser.UPPER_CONSTANT);
 	    } catch (re) {
 	    	if(re instanceof antlr4.error.RecognitionException) {
@@ -416,7 +436,7 @@ export default class folParser extends antlr4.Parser {
 	    this.enterRule(localctx, 12, folParser.RULE_ind_constant);
 	    try {
 	        this.enterOuterAlt(localctx, 1);
-	        this.state = 105;
+	        this.state = 113;
 	        this.match(folParser.UPPER_CONSTANT);
 	    } catch (re) {
 	    	if(re instanceof antlr4.error.RecognitionException) {
@@ -439,7 +459,7 @@ export default class folParser extends antlr4.Parser {
 	    this.enterRule(localctx, 14, folParser.RULE_func_constant);
 	    try {
 	        this.enterOuterAlt(localctx, 1);
-	        this.state = 107;
+	        this.state = 115;
 	        this.match(folParser.LOWER_CONSTANT);
 	    } catch (re) {
 	    	if(re instanceof antlr4.error.RecognitionException) {
@@ -462,7 +482,7 @@ export default class folParser extends antlr4.Parser {
 	    this.enterRule(localctx, 16, folParser.RULE_separator);
 	    try {
 	        this.enterOuterAlt(localctx, 1);
-	        this.state = 109;
+	        this.state = 117;
 	        this.match(folParser.T__0);
 	    } catch (re) {
 	    	if(re instanceof antlr4.error.RecognitionException) {
@@ -489,14 +509,16 @@ folParser.EQUAL = 4;
 folParser.NOT = 5;
 folParser.FORALL = 6;
 folParser.EXISTS = 7;
-folParser.UPPER_CONSTANT = 8;
-folParser.LOWER_CONSTANT = 9;
-folParser.CONJ = 10;
-folParser.DISJ = 11;
-folParser.IMPL = 12;
-folParser.BICOND = 13;
-folParser.ENDLINE = 14;
-folParser.WHITESPACE = 15;
+folParser.COUNTING = 8;
+folParser.UPPER_CONSTANT = 9;
+folParser.LOWER_CONSTANT = 10;
+folParser.NUMBER = 11;
+folParser.CONJ = 12;
+folParser.DISJ = 13;
+folParser.IMPL = 14;
+folParser.BICOND = 15;
+folParser.ENDLINE = 16;
+folParser.WHITESPACE = 17;
 
 folParser.RULE_condition = 0;
 folParser.RULE_formula = 1;
@@ -627,29 +649,37 @@ class FormulaContext extends antlr4.ParserRuleContext {
 	    return this.getToken(folParser.EXISTS, 0);
 	};
 
-	pred_constant() {
-	    return this.getTypedRuleContext(Pred_constantContext,0);
+	COUNTING() {
+	    return this.getToken(folParser.COUNTING, 0);
 	};
 
-	term = function(i) {
+	NUMBER() {
+	    return this.getToken(folParser.NUMBER, 0);
+	};
+
+	separator = function(i) {
 	    if(i===undefined) {
 	        i = null;
 	    }
 	    if(i===null) {
-	        return this.getTypedRuleContexts(TermContext);
+	        return this.getTypedRuleContexts(SeparatorContext);
 	    } else {
-	        return this.getTypedRuleContext(TermContext,i);
+	        return this.getTypedRuleContext(SeparatorContext,i);
 	    }
 	};
 
-	separator = function(i) {
+	pred_constant() {
+	    return this.getTypedRuleContext(Pred_constantContext,0);
+	};
+
+	term = function(i) {
 	    if(i===undefined) {
 	        i = null;
 	    }
 	    if(i===null) {
-	        return this.getTypedRuleContexts(SeparatorContext);
+	        return this.getTypedRuleContexts(TermContext);
 	    } else {
-	        return this.getTypedRuleContext(SeparatorContext,i);
+	        return this.getTypedRuleContext(TermContext,i);
 	    }
 	};
 
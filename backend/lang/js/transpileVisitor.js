@@ -76,6 +76,15 @@ export default class TranspileVisitor extends folVisitor {
 
             return `any([${formula} for ${variable} in constants])`;
         }
+        else if (ctx.COUNTING()) {
+            const bound = ctx.NUMBER().getText();
+            const variable = ctx.variable().getText();
+            const formula = this.visit(ctx.formula(0));
+            const count = `sum([1 for ${variable} in constants if ${formula}])`;
+            const comparison = {atmost: '<=', atleast: '>=', exactly: '=='}[ctx.COUNTING().getText()];
+
+            return `(${count} ${comparison} ${bound})`;
+        }
         else if (ctx.pred_constant()) {
             const pred = ctx.pred_constant().getText();
             const terms = ctx.term().map(term => this.visit(term)).join(', ');
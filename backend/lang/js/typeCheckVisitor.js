@@ -97,7 +97,7 @@ export default class TypeCheckVisitor extends folVisitor {
             this.visit(ctx.formula(0));
             return 'Bool';
         }
-        if (ctx.FORALL() || ctx.EXISTS()) {
+        if (ctx.FORALL() || ctx.EXISTS() || ctx.COUNTING()) {
             // simply check body
             this.visit(ctx.formula(0));
             return 'Bool';
@@ -0,0 +1,138 @@
+import { createHash } from 'crypto';
+
+/**
+ * Memoizes worker results by a hash of the canonicalized request.
+ *
+ * Results are kept for `ttl` milliseconds and within `maxBytes` of
+ * serialized JSON, evicting the least recently used first. Identical
+ * requests arriving while the first one is still being computed share its
+ * computation instead of starting their own. Failed computations are not
+ * cached. Every caller gets its own copy of the result, so it can be
+ * modified freely.
+ */
+export class ResultCache {
+  constructor({ ttl = 5 * 60 * 1000, maxBytes = 64 * 1024 * 1024 } = {}) {
+    this.ttl = ttl;
+    this.maxBytes = maxBytes;
+    // key -> { json, bytes, expires }, least recently used first
+    this.entries = new Map();
+    // key -> promise of the serialized result
+    this.inFlight = new Map();
+    this.bytes = 0;
+    this.stats = { hits: 0, coalesced: 0, misses: 0 };
+  }
+
+  /**
+   * Return the result of a request, computing it only when needed.
+   *
+   * @param {string} method - Worker method, e.g. "generate"
+   * @param {object} params - Method parameters
+   * @param {function(): Promise<object>} compute - Computes the result
+   * @returns {Promise<object>} A copy of the result
+   */
+  async get(method, params, compute) {
+    const key = requestKey(method, params);
+    const entry = this.entries.get(key);
+    if (entry !== undefined) {
+      this.entries.delete(key);
+      if (entry.expires > Date.now()) {
+        this.entries.set(key, entry);
+        this.stats.hits += 1;
+        return JSON.parse(entry.json);
+      }
+      this.bytes -= entry.bytes;
+    }
+
+    let pending = this.inFlight.get(key);
+    if (pending === undefined) {
+      this.stats.misses += 1;
+      pending = compute()
+        .then((result) => {
+          const json = JSON.stringify(result);
+          this.store(key, json);
+          return json;
+        })
+        .finally(() => this.inFlight.delete(key));
+      this.inFlight.set(key, pending);
+    } else {
+      this.stats.coalesced += 1;
+    }
+    return JSON.parse(await pending);
+  }
+
+  store(key, json) {
+    if (this.ttl <= 0 || json.length > this.maxBytes) return;
+    const now = Date.now();
+    for (const [k, entry] of this.entries) {
+      if (entry.expires <= now) {
+        this.entries.delete(k);
+        this.bytes -= entry.bytes;
+      }
+    }
+    this.entries.set(key, { json, bytes: json.length, expires: now + this.ttl });
+    this.bytes += json.length;
+    for (const [k, entry] of this.entries) {
+      if (this.bytes <= this.maxBytes) break;
+      this.entries.delete(k);
+      this.bytes -= entry.bytes;
+    }
+  }
+
+  clear() {
+    this.entries.clear();
+    this.bytes = 0;
+  }
+}
+
+/**
+ * Hash a request into a cache key.
+ *
+ * Requests differing only in ways the workers ignore get the same key:
+ * object key order, disabled constraints, and whether flags and truth
+ * values are sent as strings.
+ */
+export function requestKey(method, params) {
+  const json = JSON.stringify([method, canonicalParams(params)]);
+  return createHash('sha256').update(json).digest('hex');
+}
+
+function canonicalParams(params) {
+  const { constraints = [], predicates = [], ...rest } = params;
+  return canonical({
+    ...rest,
+    constraints: constraints
+      .filter((rule) => isTrue(rule.enabled))
+      .map(({ code, number }) => ({ code, number })),
+    predicates: predicates.map((pred) => ({
+      ...pred,
+      negated: isTrue(pred.negated),
+      data: {
+        ...pred.data,
+        truthTable: Object.fromEntries(
+          Object.entries(pred.data?.truthTable ?? {}).map(([k, v]) => [k, isTrue(v)])
+        )
+      }
+    }))
+  });
+}
+
+function canonical(value) {
+  if (Array.isArray(value)) {
+    return value.map(canonical);
+  }
+  if (value !== null && typeof value === 'object') {
+    const sorted = {};
+    for (const key of Object.keys(value).sort()) {
+      if (value[key] !== undefined) {
+        sorted[key] = canonical(value[key]);
+      }
+    }
+    return sorted;
+  }
+  return value;
+}
+
+function isTrue(value) {
+  // Same as fol_evaluator._is_true on the Python side
+  return String(value).toLowerCase() === 'true';
+}
@@ -0,0 +1,122 @@
+import { spawn } from 'child_process';
+import { createInterface } from 'readline';
+import { fileURLToPath } from 'url';
+import { dirname, join } from 'path';
+
+const __dirname = dirname(fileURLToPath(import.meta.url));
+const WORKER_SCRIPT = join(__dirname, 'solver_worker.py');
+
+/**
+ * A pool of resident solver_worker.py processes.
+ *
+ * Each worker keeps OR-Tools loaded and answers JSON-line requests
+ * concurrently, so a request costs no interpreter start-up and never
+ * blocks the event loop. Requests go to the worker with the fewest
+ * outstanding requests; a worker that exits fails its outstanding
+ * requests and is replaced on the next request.
+ *
+ * A request unanswered after `timeout` milliseconds is rejected, and its
+ * worker, presumably stuck, is killed with every other request it holds;
+ * 0 disables the deadline.
+ */
+export class SolverPool {
+  constructor({ size = 2, python = 'python3', threads = 4, timeout = 10 * 60 * 1000 } = {}) {
+    this.size = size;
+    this.python = python;
+    this.threads = threads;
+    this.timeout = timeout;
+    this.workers = [];
+    this.nextId = 1;
+  }
+
+  spawnWorker() {
+    const child = spawn(this.python, [WORKER_SCRIPT, '--threads', String(this.threads)], {
+      cwd: __dirname,
+      stdio: ['pipe', 'pipe', 'pipe']
+    });
+    const worker = { child, pending: new Map(), alive: true };
+
+    createInterface({ input: child.stdout }).on('line', (line) => {
+      let response;
+      try {
+        response = JSON.parse(line);
+      } catch (error) {
+        console.error('Malformed solver worker output:', line);
+        return;
+      }
+      const request = worker.pending.get(response.id);
+      if (!request) {
+        console.error('Solver worker answered an unknown request:', line);
+        return;
+      }
+      worker.pending.delete(response.id);
+      clearTimeout(request.timer);
+      if (response.error !== undefined) {
+        request.reject(new Error(response.error));
+      } else {
+        request.resolve(response.result);
+      }
+    });
+    child.stderr.on('data', (data) => {
+      console.error(`Solver worker ${child.pid}: ${data.toString().trimEnd()}`);
+    });
+
+    const fail = (reason) => {
+      if (!worker.alive) return;
+      worker.alive = false;
+      this.workers = this.workers.filter((w) => w !== worker);
+      for (const request of worker.pending.values()) {
+        clearTimeout(request.timer);
+        request.reject(new Error(`Solver worker stopped: ${reason}`));
+      }
+      worker.pending.clear();
+    };
+    worker.fail = fail;
+    child.on('exit', (code, signal) => fail(signal || `exit code ${code}`));
+    child.on('error', (error) => fail(error.message));
+    child.stdin.on('error', (error) => fail(error.message));
+
+    this.workers.push(worker);
+    return worker;
+  }
+
+  pickWorker() {
+    if (this.workers.length < this.size) {
+      return this.spawnWorker();
+    }
+    return this.workers.reduce((best, w) => (w.pending.size < best.pending.size ? w : best));
+  }
+
+  /**
+   * Send a request to a worker.
+   *
+   * @param {string} method - Worker method, e.g. "generate"
+   * @param {object} params - Method parameters
+   * @returns {Promise<object>} The method's result
+   */
+  request(method, params) {
+    const worker = this.pickWorker();
+    const id = this.nextId++;
+    return new Promise((resolve, reject) => {
+      const request = { resolve, reject, timer: null };
+      if (this.timeout > 0) {
+        request.timer = setTimeout(() => {
+          worker.pending.delete(id);
+          reject(new Error(`Solver request timed out after ${this.timeout} ms`));
+          // The next request spawns a replacement
+          worker.fail(`request ${id} timed out`);
+          worker.child.kill('SIGKILL');
+        }, this.timeout);
+      }
+      worker.pending.set(id, request);
+      worker.child.stdin.write(JSON.stringify({ id, method, params }) + '\n');
+    });
+  }
+
+  close() {
+    for (const worker of this.workers) {
+      worker.child.stdin.end();
+    }
+    this.workers = [];
+  }
+}
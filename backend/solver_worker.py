@@ -0,0 +1,300 @@
+"""
+Resident worker solving, evaluating and explaining FOL rules.
+
+The worker speaks JSON lines: each request is one line
+
+    {"id": 1, "method": "generate", "params": {...}}
+
+and each response one line carrying the same id, either
+{"id": 1, "result": {...}} or {"id": 1, "error": "..."} when the request
+itself is malformed. Requests run concurrently on a thread pool, so
+responses can come back in a different order than the requests.
+
+By default the worker reads stdin and writes stdout; with --port it
+instead listens on 127.0.0.1 and serves every connection with the same
+protocol. Either way OR-Tools is imported once and stays loaded between
+requests, and so do the ASTs of the rules parsed so far (see
+fol_parser.parse_formula), so a rule is only parsed again once it is
+evicted from the parse cache. Evaluations and explanations are kept per
+rule as well, and an edit to the truth tables only recomputes the rules
+it reaches (see fol_dependencies).
+"""
+
+from concurrent.futures import ThreadPoolExecutor, wait
+import argparse
+import io
+import json
+import logging
+import os
+import socketserver
+import sys
+import threading
+
+from fol_csp_solver import SHARED_GROUNDING_CACHE, FOLCSPSolver
+from fol_evaluator import (
+    DEFAULT_TRACE_LIMIT,
+    _is_true,
+    evaluate_rules,
+    load_functions,
+)
+from fol_dependencies import RuleMemo
+from fol_explainer import DEFAULT_TIME_BUDGET, explain_rules
+from fol_parser import FOLSyntaxError, parse_formula
+
+logger = logging.getLogger(__name__)
+
+# Results of the rules evaluated and explained so far, by context
+RULE_MEMO = RuleMemo()
+
+
+def filter_syntax(constraints):
+    """
+    Split the enabled constraints by whether they parse.
+
+    Returns:
+        tuple: (passed, failed), where failed constraints carry the
+        syntax error under "error"
+    """
+    passed, failed = [], []
+    for constraint in constraints:
+        if not _is_true(constraint["enabled"]):
+            continue
+        try:
+            parse_formula(constraint["code"].strip())
+        except FOLSyntaxError as e:
+            failed.append({**constraint, "error": f"Syntax error: {e}"})
+            continue
+        passed.append(constraint)
+    return passed, failed
+
+
+def generate(params):
+    """
+    Solve a /generate request.
+
+    Args:
+        params: {constraints, constants, predicates, functions,
+            numConstants, assignments?, stats?}, as sent by the frontend
+
+    Returns:
+        dict: {success, solution} or {success, error, details}, plus
+        failedConstraints listing the constraints that do not parse
+    """
+    constraints, failed = filter_syntax(params["constraints"])
+    failed = [
+        {"number": c.get("number"), "code": c["code"], "error": c["error"]}
+        for c in failed
+    ]
+    num_constants = params["numConstants"]
+    declared = any(pred["data"].get("properties") for pred in params["predicates"])
+    if not constraints and num_constants > 0 and not declared:
+        # Nothing to satisfy: the new constants need no assignments, and
+        # no declared property can contradict the truth tables
+        return {
+            "success": True,
+            "solution": {
+                "new_constants": [f"NewConstant{i + 1}" for i in range(num_constants)],
+                "predicate_assignments": {},
+            },
+            "failedConstraints": failed,
+        }
+    solver = FOLCSPSolver(
+        params["constants"],
+        params["predicates"],
+        params.get("functions", []),
+        constraints,
+    )
+    try:
+        solution = solver.solve(
+            num_constants,
+            assignments=params.get("assignments", "all"),
+            stats=params.get("stats", False),
+        )
+    except Exception as e:
+        logger.exception("Solver request failed")
+        return {
+            "success": False,
+            "error": str(e),
+            "details": getattr(e, "details", None),
+            "failedConstraints": failed,
+        }
+    if solution is None:
+        return {
+            "success": False,
+            "error": "No solution found that satisfies all constraints",
+            "failedConstraints": failed,
+        }
+    return {"success": True, "solution": solution, "failedConstraints": failed}
+
+
+def evaluate(params):
+    """
+    Check an /evaluate request's rules against its context.
+
+    Args:
+        params: {constraints, constants, predicates, functions, engine?,
+            trace?, traceLimit?}
+
+    Returns:
+        dict: {"Rule N": result}, see fol_evaluator.evaluate_rules; rules
+        that do not parse get {satisfied: false, rule, error}
+    """
+    constraints, failed = filter_syntax(params["constraints"])
+    engine = params.get("engine", "scalar")
+    trace = params.get("trace", "witness")
+    trace_limit = params.get("traceLimit", DEFAULT_TRACE_LIMIT)
+    results = evaluate_rules(
+        params["constants"],
+        params["predicates"],
+        constraints,
+        load_functions(params.get("functions", [])),
+        engine=engine,
+        trace=trace,
+        trace_limit=trace_limit,
+        memo=_snapshot(params, ("evaluate", engine, trace, trace_limit)),
+    )
+    for rule in failed:
+        results[f"Rule {rule.get('number')}"] = {
+            "satisfied": False,
+            "rule": rule["code"],
+            "error": rule["error"],
+        }
+    return results
+
+
+def explain(params):
+    """
+    Explain why an /evaluate request's rules are violated.
+
+    Args:
+        params: {constraints, constants, predicates, functions,
+            timeBudget?}
+
+    Returns:
+        dict: {"Rule N": result}, see fol_explainer.explain_rules; rules
+        that do not parse are left out
+    """
+    return explain_rules(
+        params["constants"],
+        params["predicates"],
+        filter_syntax(params["constraints"])[0],
+        load_functions(params.get("functions", [])),
+        time_budget=params.get("timeBudget", DEFAULT_TIME_BUDGET),
+        memo=_snapshot(params, ("explain",)),
+    )
+
+
+def _snapshot(params, options):
+    # Rule results are kept across requests; see fol_dependencies
+    return RULE_MEMO.snapshot(
+        [c["name"] for c in params["constants"]],
+        params["predicates"],
+        json.dumps(params.get("functions", []), sort_keys=True),
+        options,
+    )
+
+
+def ping(params):
+    """Answer a health check."""
+    return {"pong": True}
+
+
+METHODS = {
+    "generate": generate,
+    "evaluate": evaluate,
+    "explain": explain,
+    "ping": ping,
+}
+
+
+def handle(line):
+    """Answer one request line with a response dict."""
+    try:
+        request = json.loads(line)
+        request_id = request.get("id")
+    except (ValueError, AttributeError) as e:
+        return {"id": None, "error": f"Invalid request: {e}"}
+    method = METHODS.get(request.get("method"))
+    if method is None:
+        return {"id": request_id, "error": f"Unknown method {request.get('method')!r}"}
+    try:
+        return {"id": request_id, "result": method(request.get("params") or {})}
+    except Exception as e:
+        logger.exception("Request %r failed", request_id)
+        return {"id": request_id, "error": f"{type(e).__name__}: {e}"}
+
+
+def serve(lines, output, executor):
+    """
+    Answer every request line read from `lines` on the `output` stream.
+
+    Returns once `lines` is exhausted and every response is written.
+    """
+    lock = threading.Lock()
+
+    def respond(line):
+        response = json.dumps(handle(line))
+        with lock:
+            output.write(response + "\n")
+            output.flush()
+
+    # Only unanswered requests are kept, however long the worker lives
+    pending = set()
+    for line in lines:
+        if line.strip():
+            future = executor.submit(respond, line)
+            pending.add(future)
+            future.add_done_callback(pending.discard)
+    wait(list(pending))
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        lines = io.TextIOWrapper(self.rfile, encoding="utf-8")
+        output = io.TextIOWrapper(self.wfile, encoding="utf-8")
+        serve(lines, output, self.server.executor)
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--threads", type=int, default=4, help="requests solved concurrently"
+    )
+    parser.add_argument("--port", type=int, help="serve on 127.0.0.1:PORT")
+    parser.add_argument(
+        "--grounding-cache-mb",
+        type=float,
+        default=float(os.environ.get("GROUNDING_CACHE_MB", 256)),
+        help="memory budget of the grounding cache (0 disables it)",
+    )
+    parser.add_argument(
+        "--grounding-cache-dir",
+        default=os.environ.get("GROUNDING_CACHE_DIR"),
+        help="directory keeping ground rules across workers and restarts",
+    )
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args(argv)
+
+    SHARED_GROUNDING_CACHE.max_bytes = int(args.grounding_cache_mb * 1024 * 1024)
+    SHARED_GROUNDING_CACHE.directory = args.grounding_cache_dir
+
+    # Logs go to stderr; stdout only carries responses
+    logging.basicConfig(level=args.log_level.upper(), stream=sys.stderr)
+    executor = ThreadPoolExecutor(max_workers=args.threads)
+    if args.port is None:
+        output, sys.stdout = sys.stdout, sys.stderr
+        serve(sys.stdin, output, executor)
+        return
+    with _Server(("127.0.0.1", args.port), _Handler) as server:
+        server.executor = executor
+        logger.info("Solver worker listening on port %d", args.port)
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,21 @@
-from fol_csp_solver import FOLCSPSolver
+from fol_csp_solver import (
+    AtomTable,
+    FOLCompileError,
+    FOLCSPSolver,
+    GroundingCache,
+    GroundingLimitError,
+    SolverStats,
+    property_axioms,
+)
+from fol_evaluator import Evaluator
+from fol_parser import parse_formula
+from ortools.sat.python import cp_model
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+import itertools
+import json
+import random
+import tempfile
+import tracemalloc
 import unittest
 
 
@@ -474,6 +491,734 @@ class TestFOLCSPSolver(unittest.TestCase):
             "CEO should have authority over Employee through Manager",
         )
 
+    def test_exists_constraint(self):
+        """Test that existential quantifiers are enforced."""
+        solver = FOLCSPSolver(
+            constants=self.test_context["constants"],
+            predicates=self.test_context["predicates"],
+            functions=self.test_context["functions"],
+            constraints=[{"code": "exists(x) Human(x)", "enabled": True, "number": 1}],
+        )
+
+        solution = solver.solve(num_new_constants=1)
+        self.assertIsNotNone(solution)
+        self.assertTrue(solution["predicate_assignments"]["Human(NewConstant1)"])
+
+    def test_exists_grounding(self):
+        """Test that required quantifiers ground to clauses over the atoms."""
+        predicates = [
+            {
+                "name": "Parent",
+                "data": {"paramCount": 2, "truthTable": {}},
+                "negated": False,
+            },
+            {
+                "name": "God",
+                "data": {"paramCount": 1, "truthTable": {}},
+                "negated": False,
+            },
+        ]
+        for code, clauses in [
+            ("forall(x) exists(y) Parent(y,x)", 4),
+            ("!exists(x) God(x)", 4),
+            ("forall(x) !(forall(y) !Parent(x,y))", 4),
+        ]:
+            solver = FOLCSPSolver(
+                [],
+                predicates,
+                [],
+                [{"code": code, "enabled": True}],
+                symmetry_breaking=False,
+                grounding_cache=None,
+            )
+            model, atoms, _, _ = solver.create_model(num_new_constants=4)
+            proto = model.Proto()
+            # No auxiliary variables, one clause per instance of x
+            self.assertEqual(len(proto.variables), len(atoms), code)
+            self.assertEqual(len(proto.constraints), clauses, code)
+            self.assertIsNotNone(solver.solve(num_new_constants=4))
+
+    def test_nested_connectives(self):
+        """Test rules mixing nested connectives and biconditionals."""
+        solver = FOLCSPSolver(
+            constants=self.test_context["constants"],
+            predicates=self.test_context["predicates"],
+            functions=self.test_context["functions"],
+            constraints=[
+                {
+                    "code": "forall(x) God(x) <-> !Human(x)",
+                    "enabled": True,
+                    "number": 1,
+                },
+                {
+                    "code": "!(God(NewConstant1) || Parent(Zeus,NewConstant1))",
+                    "enabled": True,
+                    "number": 2,
+                },
+            ],
+        )
+
+        solution = solver.solve(num_new_constants=1)
+        self.assertIsNotNone(solution)
+        assignments = solution["predicate_assignments"]
+        self.assertFalse(assignments["God(NewConstant1)"])
+        self.assertTrue(assignments["Human(NewConstant1)"])
+        self.assertFalse(assignments["Parent(Zeus,NewConstant1)"])
+
+    def test_equality_constraint(self):
+        """Test equality between quantified variables."""
+        solver = FOLCSPSolver(
+            constants=self.test_context["constants"],
+            predicates=self.test_context["predicates"],
+            functions=self.test_context["functions"],
+            constraints=[
+                {
+                    "code": "forall(x) forall(y) Parent(x,y) -> !(x == y)",
+                    "enabled": True,
+                    "number": 1,
+                },
+                {"code": "exists(x) Parent(x,x)", "enabled": True, "number": 2},
+            ],
+        )
+
+        self.assertIsNone(solver.solve(num_new_constants=1))
+
+    def test_function_terms(self):
+        """Test that function values left open are chosen by the solver."""
+        functions = [
+            {
+                "name": "spouse",
+                "data": "def spouse(x):\n    return {'Zeus': 'Hera', 'Hera': 'Zeus'}[x]",
+            },
+            {"name": "mentor", "data": {"Apollo": "Zeus"}},
+        ]
+        rules = [
+            "forall(x) spouse(spouse(x)) == x",
+            "forall(x) !(spouse(x) == x)",
+            "forall(x) Parent(mentor(x),x) -> God(mentor(spouse(x)))",
+            "Parent(mentor(NewConstant1),NewConstant1)",
+        ]
+        solver = FOLCSPSolver(
+            constants=self.test_context["constants"],
+            predicates=self.test_context["predicates"],
+            functions=functions,
+            constraints=[{"code": code, "enabled": True} for code in rules],
+        )
+        # Apollo is the only one left to pair the new constant with
+        self.assertIsNone(solver.solve(num_new_constants=2))
+        solution = solver.solve(num_new_constants=1)
+        self.assertIsNotNone(solution)
+        chosen = solution["function_assignments"]
+        self.assertEqual(chosen["spouse(Apollo)"], "NewConstant1")
+        self.assertEqual(chosen["spouse(NewConstant1)"], "Apollo")
+        self.assertNotIn("spouse(Zeus)", chosen)
+        self.assertNotIn("mentor(Apollo)", chosen)
+
+        # The generated data satisfies the rules
+        names = [c["name"] for c in self.test_context["constants"]]
+        names += solution["new_constants"]
+        tables = {"spouse": {"Zeus": "Hera", "Hera": "Zeus"}, "mentor": {}}
+        for key, value in chosen.items():
+            name, _, args = key.partition("(")
+            tables[name][args[:-1]] = value
+        tables["mentor"]["Apollo"] = "Zeus"
+        predicates = []
+        for pred in self.test_context["predicates"]:
+            table = dict(pred["data"]["truthTable"])
+            for key, value in solution["predicate_assignments"].items():
+                if key.startswith(pred["name"] + "("):
+                    table[key[len(pred["name"]) + 1 : -1]] = value
+            predicates.append({**pred, "data": {**pred["data"], "truthTable": table}})
+        evaluator = Evaluator(
+            names,
+            predicates,
+            [{"name": name, "data": table} for name, table in tables.items()],
+        )
+        for code in rules:
+            self.assertTrue(evaluator.evaluate(parse_formula(code)), code)
+
+        # A function needs a definition, if only an empty table
+        with self.assertRaises(FOLCompileError):
+            FOLCSPSolver(
+                self.test_context["constants"],
+                self.test_context["predicates"],
+                [],
+                [{"code": "God(spouse(Zeus))", "enabled": True}],
+            ).solve(0)
+
+    def test_counting_quantifiers(self):
+        """Test that each count is a single cardinality constraint."""
+        predicates = [
+            {
+                "name": "R",
+                "data": {"paramCount": 2, "truthTable": {}},
+                "negated": False,
+            }
+        ]
+
+        def proto(code, k):
+            solver = FOLCSPSolver(
+                [],
+                predicates,
+                [],
+                [{"code": code, "enabled": True}],
+                symmetry_breaking=False,
+            )
+            return solver.create_model(k)[0].Proto()
+
+        def kinds(model):
+            return [str(c).split()[0] for c in model.constraints]
+
+        # One at_most_one per x and no auxiliary variable
+        model = proto("forall(x) atmost(1,y) R(x,y)", 3)
+        self.assertEqual(len(model.variables), 9)
+        self.assertEqual(kinds(model), ["at_most_one"] * 3)
+        self.assertEqual(kinds(proto("exactly(1,x) R(x,x)", 3)), ["exactly_one"])
+        model = proto("forall(x) atleast(2,y) R(x,y) || R(y,x)", 3)
+        self.assertEqual(kinds(model).count("linear"), 3)
+
+        # Zeus and Hera are both parents of Apollo
+        rules = ["forall(x) atmost(2,y) Parent(y,x)", "exactly(1,x) Human(x)"]
+        solver = FOLCSPSolver(
+            self.test_context["constants"],
+            self.test_context["predicates"],
+            [],
+            [{"code": code, "enabled": True} for code in rules],
+        )
+        self.assertIsNone(solver.solve(num_new_constants=0))
+        solution = solver.solve(num_new_constants=1)
+        self.assertTrue(solution["predicate_assignments"]["Human(NewConstant1)"])
+        rules[0] = "forall(x) atmost(1,y) Parent(y,x)"
+        solver = FOLCSPSolver(
+            self.test_context["constants"],
+            self.test_context["predicates"],
+            [],
+            [{"code": code, "enabled": True} for code in rules],
+        )
+        self.assertIsNone(solver.solve(num_new_constants=1))
+
+    def test_predicate_properties(self):
+        """Test declared properties against the same axioms written as rules."""
+        rng = random.Random(7)
+        names = ["Zeus", "Hera", "Apollo"]
+        constants = [{"id": i, "name": n} for i, n in enumerate(names)]
+        combinations = [
+            ["symmetric"],
+            ["symmetric", "irreflexive"],
+            ["antisymmetric", "reflexive"],
+            ["transitive"],
+            ["transitive", "irreflexive"],
+            ["transitive", "antisymmetric", "reflexive"],
+            ["functional"],
+            ["symmetric", "transitive", "functional"],
+        ]
+        rules = [
+            "exists(x) exists(y) R(x,y) && !(x == y)",
+            "forall(x) exists(y) R(x,y) || R(y,x)",
+            "R(NewConstant1,Zeus) && !R(Zeus,NewConstant1)",
+            "!R(Hera,Hera) && exists(x) R(Hera,x) && R(x,Apollo)",
+        ]
+        solved = 0
+        for i in range(40):
+            pairs = [",".join(p) for p in itertools.product(names, repeat=2)]
+            table = {k: rng.choice([True, False]) for k in rng.sample(pairs, 3)}
+            properties = rng.choice(combinations)
+            declared = {
+                "name": "R",
+                "data": {
+                    "paramCount": 2,
+                    "truthTable": table,
+                    "properties": properties,
+                },
+                "negated": False,
+            }
+            plain = {**declared, "data": {"paramCount": 2, "truthTable": table}}
+            codes = rng.sample(rules, 2)
+            with_properties = FOLCSPSolver(
+                constants,
+                [declared],
+                [],
+                [{"code": code, "enabled": True} for code in codes],
+                order_ranks=i % 2 == 1,
+            )
+            with_axioms = FOLCSPSolver(
+                constants,
+                [plain],
+                [],
+                [
+                    {"code": code, "enabled": True}
+                    for code in codes + list(property_axioms(declared).values())
+                ],
+            )
+            for k in (1, 2):
+                solution = with_properties.solve(num_new_constants=k)
+                expected = with_axioms.solve(num_new_constants=k)
+                self.assertEqual(
+                    solution is None, expected is None, (properties, table, codes, k)
+                )
+                if solution is None:
+                    continue
+                solved += 1
+                # The solution satisfies the axioms
+                truth_table = dict(table)
+                for key, value in solution["predicate_assignments"].items():
+                    truth_table[key[2:-1]] = value
+                evaluator = Evaluator(
+                    names + solution["new_constants"],
+                    [{**plain, "data": {"paramCount": 2, "truthTable": truth_table}}],
+                    [],
+                )
+                for code in codes + list(property_axioms(declared).values()):
+                    self.assertTrue(evaluator.evaluate(parse_formula(code)), code)
+        self.assertGreater(solved, 10)
+
+    def test_symmetric_predicate(self):
+        """Test that both orders of a symmetric pair are one atom."""
+        predicates = [
+            {
+                "name": "Married",
+                "data": {
+                    "paramCount": 2,
+                    "truthTable": {"Zeus,Hera": True},
+                    "properties": ["symmetric", "irreflexive"],
+                },
+                "negated": False,
+            }
+        ]
+        solver = FOLCSPSolver(
+            self.test_context["constants"],
+            predicates,
+            [],
+            [{"code": "exists(x) Married(x,Apollo)", "enabled": True}],
+        )
+        atoms = AtomTable(cp_model.CpModel(), predicates, ["Zeus", "Hera", "Apollo"])
+        self.assertIs(atoms.atom(0, (1, 0)), True)
+        self.assertIs(atoms.atom(0, (0, 2)), atoms.atom(0, (2, 0)))
+
+        solution = solver.solve(num_new_constants=0)
+        assignments = solution["predicate_assignments"]
+        self.assertTrue(assignments["Married(Apollo,Zeus)"])
+        self.assertTrue(assignments["Married(Zeus,Apollo)"])
+        self.assertFalse(assignments["Married(Apollo,Apollo)"])
+
+        # Both orders given, with different values
+        predicates[0]["data"]["truthTable"]["Hera,Zeus"] = False
+        self.assertIsNone(solver.solve(num_new_constants=0))
+
+        # Properties are checked against the predicate's arity
+        predicates[0]["data"]["properties"] = ["reflexive", "commutative"]
+        with self.assertRaises(FOLCompileError):
+            solver.solve(num_new_constants=0)
+        predicates[0]["data"]["properties"] = ["functional"]
+        predicates.append(
+            {
+                "name": "Older",
+                "data": {
+                    "paramCount": 1,
+                    "truthTable": {},
+                    "properties": ["transitive"],
+                },
+                "negated": False,
+            }
+        )
+        with self.assertRaises(FOLCompileError):
+            solver.solve(num_new_constants=0)
+
+    def test_unknown_predicate(self):
+        """Test that rules over undeclared predicates are rejected."""
+        solver = FOLCSPSolver(
+            constants=self.test_context["constants"],
+            predicates=self.test_context["predicates"],
+            functions=self.test_context["functions"],
+            constraints=[{"code": "Titan(Zeus)", "enabled": True, "number": 1}],
+        )
+
+        with self.assertRaises(FOLCompileError):
+            solver.solve(num_new_constants=0)
+
+    def test_lazy_grounding(self):
+        """Test that only atoms reached by enabled rules become variables."""
+        solver = FOLCSPSolver(
+            constants=self.test_context["constants"],
+            predicates=self.test_context["predicates"],
+            functions=self.test_context["functions"],
+            constraints=[
+                {"code": "forall(x) Parent(Zeus,x) -> God(x)", "enabled": True},
+                {"code": "Human(Zeus)", "enabled": False},
+            ],
+        )
+
+        _, predicate_vars, _, _ = solver.create_model(num_new_constants=1)
+        self.assertEqual(
+            set(predicate_vars), {"Parent(Zeus,NewConstant1)", "God(NewConstant1)"}
+        )
+
+        solution = solver.solve(num_new_constants=1)
+        assignments = solution["predicate_assignments"]
+        self.assertTrue(assignments["Parent(Hera,Apollo)"])
+        self.assertFalse(assignments["Human(Zeus)"])
+        self.assertFalse(assignments["Parent(NewConstant1,Zeus)"])
+
+    def test_partial_evaluation(self):
+        """Test that ground clauses decided by the truth tables never reach the model."""
+        solver = FOLCSPSolver(
+            constants=self.test_context["constants"],
+            predicates=self.test_context["predicates"],
+            functions=self.test_context["functions"],
+            constraints=[
+                {"code": "forall(x) God(x) -> !Human(x)", "enabled": True},
+                {"code": "forall(x) Human(x) || God(x)", "enabled": True},
+            ],
+        )
+
+        model, predicate_vars, _, _ = solver.create_model(num_new_constants=0)
+        self.assertEqual(len(predicate_vars), 0)
+        self.assertEqual(len(model.Proto().constraints), 0)
+
+        model, predicate_vars, _, _ = solver.create_model(num_new_constants=1)
+        self.assertEqual(
+            set(predicate_vars), {"God(NewConstant1)", "Human(NewConstant1)"}
+        )
+        self.assertIsNotNone(solver.solve(num_new_constants=1))
+
+    def test_partial_evaluation_conflict(self):
+        """Test that a rule falsified by the truth tables is unsatisfiable."""
+        solver = FOLCSPSolver(
+            constants=self.test_context["constants"],
+            predicates=self.test_context["predicates"],
+            functions=self.test_context["functions"],
+            constraints=[
+                {"code": "forall(x) Human(x) -> God(x)", "enabled": True},
+                {"code": "exists(x) Parent(x,Zeus)", "enabled": True},
+                {"code": "forall(x) !Parent(x,Zeus) || Human(x)", "enabled": True},
+            ],
+        )
+
+        self.assertIsNone(solver.solve(num_new_constants=0))
+
+    def test_symmetry_breaking(self):
+        """Test that interchangeable new constants are ordered."""
+        constraints = [
+            {"code": "exists(x) Human(x)", "enabled": True},
+            {
+                "code": "forall(x) forall(y) Human(x) && Human(y) -> x == y",
+                "enabled": True,
+            },
+        ]
+        solver = FOLCSPSolver(
+            constants=self.test_context["constants"],
+            predicates=self.test_context["predicates"],
+            functions=self.test_context["functions"],
+            constraints=constraints,
+        )
+
+        solution = solver.solve(num_new_constants=3)
+        self.assertIsNotNone(solution)
+        assignments = solution["predicate_assignments"]
+        self.assertFalse(assignments["Human(NewConstant1)"])
+        self.assertFalse(assignments["Human(NewConstant2)"])
+        self.assertTrue(assignments["Human(NewConstant3)"])
+
+    def test_symmetry_breaking_skips_named_constants(self):
+        """Test that new constants named by a rule are not reordered."""
+        solver = FOLCSPSolver(
+            constants=self.test_context["constants"],
+            predicates=self.test_context["predicates"],
+            functions=self.test_context["functions"],
+            constraints=[{"code": "Human(NewConstant1)", "enabled": True}],
+        )
+
+        model, _, _, _ = solver.create_model(num_new_constants=2)
+        self.assertEqual(len(model.Proto().constraints), 1)
+
+        solution = solver.solve(num_new_constants=2)
+        self.assertTrue(solution["predicate_assignments"]["Human(NewConstant1)"])
+
+    def test_iter_solutions(self):
+        """Test streaming distinct solutions as deltas."""
+        constraints = [{"code": "exists(x) Human(x)", "enabled": True}]
+        solver = FOLCSPSolver(
+            constants=self.test_context["constants"],
+            predicates=self.test_context["predicates"],
+            functions=self.test_context["functions"],
+            constraints=constraints,
+            symmetry_breaking=False,
+        )
+
+        deltas = list(solver.iter_solutions(num_new_constants=2))
+        self.assertEqual(len(deltas), 3)
+        first = deltas[0]
+        self.assertIn("Parent(Zeus,NewConstant1)", first)
+        self.assertNotIn("Human(Zeus)", first)
+        self.assertTrue(first["Human(NewConstant1)"] or first["Human(NewConstant2)"])
+
+        # Replaying the deltas gives three different worlds
+        worlds = set()
+        state = {}
+        for delta in deltas:
+            self.assertTrue(delta)
+            state.update(delta)
+            worlds.add((state["Human(NewConstant1)"], state["Human(NewConstant2)"]))
+        self.assertEqual(worlds, {(True, False), (False, True), (True, True)})
+
+        solver.symmetry_breaking = True
+        self.assertEqual(len(list(solver.iter_solutions(num_new_constants=2))), 2)
+
+    def test_iter_solutions_projection_and_limit(self):
+        """Test projecting onto predicates and stopping a large enumeration early."""
+        constraints = [
+            {"code": "forall(x) God(x) || Human(x) || !Human(x)", "enabled": True}
+        ]
+        solver = FOLCSPSolver(
+            constants=self.test_context["constants"],
+            predicates=self.test_context["predicates"],
+            functions=self.test_context["functions"],
+            constraints=constraints,
+            symmetry_breaking=False,
+        )
+
+        projected = list(
+            solver.iter_solutions(num_new_constants=3, predicates=["Parent"])
+        )
+        self.assertEqual(len(projected), 1)
+        self.assertTrue(all(key.startswith("Parent(") for key in projected[0]))
+
+        # Worlds differing only in unreported atoms are yielded once, as
+        # long as the window remembers every distinct one
+        solver = FOLCSPSolver(
+            constants=self.test_context["constants"],
+            predicates=self.test_context["predicates"],
+            functions=self.test_context["functions"],
+            constraints=[
+                {"code": "exists(x) Human(x) || Parent(x,x)", "enabled": True}
+            ],
+            symmetry_breaking=False,
+        )
+        state, worlds = {}, []
+        for delta in solver.iter_solutions(
+            num_new_constants=2, predicates=["Human"], dedup_window=4
+        ):
+            state.update(delta)
+            worlds.append((state["Human(NewConstant1)"], state["Human(NewConstant2)"]))
+        self.assertEqual(len(worlds), 4)
+        self.assertEqual(len(set(worlds)), 4)
+
+        limited = list(
+            solver.iter_solutions(num_new_constants=8, limit=5, buffer_size=1)
+        )
+        self.assertEqual(len(limited), 5)
+
+    def test_atom_table(self):
+        """Test atom indexing, rendering and re-indexing when the domain grows."""
+        atoms = AtomTable(
+            cp_model.CpModel(),
+            self.test_context["predicates"],
+            ["Zeus", "Hera", "Apollo"],
+        )
+        self.assertIs(atoms.atom(2, (0, 2)), True)
+        self.assertIs(atoms.atom(1, (1,)), False)
+        self.assertEqual(len(atoms), 0)
+
+        atoms.add_constants(["NewConstant1", "NewConstant2"])
+        var = atoms.atom(2, (3, 0))
+        self.assertIs(atoms.atom(2, (3, 0)), var)
+        self.assertEqual(list(atoms), ["Parent(NewConstant1,Zeus)"])
+
+        # Outgrowing the radix keeps atoms, variables and known values
+        atoms.add_constants(["NewConstant3", "NewConstant4", "NewConstant5"])
+        self.assertIs(atoms["Parent(NewConstant1,Zeus)"], var)
+        self.assertIs(atoms.atom(2, (3, 0)), var)
+        self.assertIs(atoms.atom(2, (1, 2)), True)
+        self.assertNotIn("Parent(NewConstant5,Zeus)", atoms)
+        index = atoms.index(2, (7, 6))
+        self.assertEqual(atoms.decode(index), (2, (7, 6)))
+        self.assertEqual(atoms.render(index), "Parent(NewConstant5,NewConstant4)")
+
+    def test_sparse_assignments(self):
+        """Test reporting only new-constant atoms or atoms that changed."""
+        constraints = [
+            {"code": "exists(x) Human(x)", "enabled": True},
+            {"code": "forall(x) Human(x) -> Parent(Zeus,x)", "enabled": True},
+        ]
+        solver = FOLCSPSolver(
+            constants=self.test_context["constants"],
+            predicates=self.test_context["predicates"],
+            functions=self.test_context["functions"],
+            constraints=constraints,
+        )
+
+        model, atoms, new_constants, existing = solver.create_model(1)
+        cp_solver = cp_model.CpSolver()
+        self.assertEqual(cp_solver.Solve(model), cp_model.OPTIMAL)
+
+        def extract(assignments):
+            solution = solver.extract_solution(
+                cp_solver, atoms, existing, new_constants, assignments
+            )
+            return solution["predicate_assignments"]
+
+        full = extract("all")
+        self.assertEqual(len(full), 2 * 4 + 16)
+        self.assertTrue(full["Human(NewConstant1)"])
+        self.assertTrue(full["Parent(Zeus,NewConstant1)"])
+        self.assertTrue(full["Parent(Hera,Apollo)"])
+        self.assertFalse(full["Parent(Hera,Zeus)"])
+
+        self.assertEqual(
+            extract("new"), {k: v for k, v in full.items() if "NewConstant1" in k}
+        )
+
+        # Atoms missing from the truth tables count as False
+        input_true = {
+            "God(Zeus)",
+            "God(Hera)",
+            "God(Apollo)",
+            "Parent(Zeus,Apollo)",
+            "Parent(Hera,Apollo)",
+        }
+        changed = extract("changed")
+        self.assertEqual(
+            changed, {k: v for k, v in full.items() if v != (k in input_true)}
+        )
+        self.assertTrue(changed["Human(NewConstant1)"])
+
+        arrays = atoms.predicate_arrays(atoms.slot_values(cp_solver))
+        self.assertEqual(arrays["Parent"].shape, (4, 4))
+        self.assertTrue(arrays["Parent"][0, 3])
+
+        with self.assertRaises(ValueError):
+            solver.solve(1, assignments="some")
+
+    def test_stats(self):
+        """Test the optional stats block of a solution."""
+        constraints = [{"code": "exists(x) Human(x)", "enabled": True}]
+        solver = FOLCSPSolver(
+            constants=self.test_context["constants"],
+            predicates=self.test_context["predicates"],
+            functions=self.test_context["functions"],
+            constraints=constraints,
+        )
+        self.assertNotIn("stats", solver.solve(1))
+        self.assertIsNone(solver.last_stats)
+
+        stats = solver.solve(1, stats=True)["stats"]
+        json.dumps(stats)
+        self.assertEqual(
+            set(stats["phases"]), {"parse", "ground", "build", "solve", "extract"}
+        )
+        for phase in stats["phases"].values():
+            self.assertGreaterEqual(phase["seconds"], 0)
+            self.assertGreaterEqual(phase["peak_bytes"], 0)
+        self.assertEqual(stats["model"]["atom_variables"], 1)
+        self.assertGreater(stats["model"]["proto_bytes"], 0)
+        self.assertIn(stats["solver"]["status"], ("OPTIMAL", "FEASIBLE"))
+
+        solver.constraints.append({"code": "!exists(x) Human(x)", "enabled": True})
+        self.assertIsNone(solver.solve(1, stats=True))
+        self.assertEqual(solver.last_stats["solver"]["status"], "INFEASIBLE")
+        self.assertNotIn("extract", solver.last_stats["phases"])
+
+        # Collectors take turns with the process-wide tracing
+        solver.constraints.pop()
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            with SolverStats():
+                waiting = pool.submit(solver.solve, 1, stats=True)
+                self.assertRaises(TimeoutError, waiting.result, timeout=0.2)
+                self.assertIsNotNone(solver.solve(1))
+            self.assertIn("solve", waiting.result()["stats"]["phases"])
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_grounding_limits(self):
+        """Test rejecting and downgrading requests that would ground too large."""
+        constraints = [
+            {"code": "exists(x) Human(x)", "enabled": True, "number": 1},
+            {
+                "code": "forall(x) forall(y) forall(z)"
+                " Parent(x,y) && Parent(y,z) -> Parent(x,z)",
+                "enabled": True,
+                "number": 2,
+            },
+        ]
+        solver = FOLCSPSolver(
+            constants=self.test_context["constants"],
+            predicates=self.test_context["predicates"],
+            functions=self.test_context["functions"],
+            constraints=constraints,
+            limits={"max_constraints": 3000},
+        )
+        self.assertIsNotNone(solver.solve(5))
+
+        with self.assertRaises(GroundingLimitError) as raised:
+            solver.solve(20)
+        details = raised.exception.details
+        self.assertEqual(details["rule"], 2)
+        self.assertEqual(details["measure"], "constraints")
+        self.assertEqual(details["limit"], 3000)
+        self.assertGreater(details["estimate"], 3000)
+
+        solver.limits["on_exceed"] = "downgrade"
+        solution = solver.solve(20)
+        self.assertIsNotNone(solution)
+        count = len(solution["new_constants"])
+        self.assertTrue(5 <= count < 20)
+        formulas = {
+            c["number"]: solver.parse_constraint(c["code"]) for c in constraints
+        }
+        self.assertLessEqual(
+            solver.estimate_grounding(formulas, count)["total"]["constraints"], 3000
+        )
+        self.assertGreater(
+            solver.estimate_grounding(formulas, count + 1)["total"]["constraints"],
+            3000,
+        )
+
+    def test_grounding_cache(self):
+        """Test that cached ground rules build the same model on new data."""
+        constraints = [
+            {"code": "forall(x) God(x) -> exists(y) Parent(y,x)", "enabled": True},
+            {"code": "forall(x) Human(x) <-> !(x == Zeus)", "enabled": True},
+        ]
+        cache = GroundingCache(background=False)
+
+        def model(grounding_cache):
+            solver = FOLCSPSolver(
+                constants=self.test_context["constants"],
+                predicates=self.test_context["predicates"],
+                functions=self.test_context["functions"],
+                constraints=constraints,
+                grounding_cache=grounding_cache,
+            )
+            return str(solver.create_model(num_new_constants=2)[0].Proto())
+
+        self.assertEqual(model(cache), model(None))
+        self.assertEqual(cache.info()["misses"], 2)
+        # A data-only change replays the cached rules
+        self.test_context["predicates"][1]["data"]["truthTable"] = {"Hera": True}
+        self.assertEqual(model(cache), model(None))
+        self.assertEqual(cache.info()["hits"], 2)
+
+        # The least recently used rule is evicted past the memory budget
+        budget = cache.info()["bytes"] - 1
+        small = GroundingCache(max_bytes=budget, background=False)
+        model(small)
+        self.assertEqual(small.info()["entries"], 1)
+        self.assertLessEqual(small.info()["bytes"], budget)
+
+        # Misses compile in the background; the first solve grounds directly
+        background = GroundingCache()
+        self.assertEqual(model(background), model(None))
+        background.wait()
+        self.assertEqual(background.info()["entries"], 2)
+        self.assertEqual(model(background), model(None))
+        self.assertEqual(background.info()["hits"], 2)
+
+        with tempfile.TemporaryDirectory() as directory:
+            model(GroundingCache(directory=directory, background=False))
+            disk = GroundingCache(directory=directory, background=False)
+            self.assertEqual(model(disk), model(None))
+            self.assertEqual(disk.info()["disk_hits"], 2)
+            self.assertEqual(disk.info()["misses"], 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,116 @@
+from fol_dependencies import RuleMemo, atom_patterns
+from fol_evaluator import evaluate_rules
+from fol_explainer import explain_rules
+from fol_parser import parse_formula
+import copy
+import random
+import unittest
+
+
+class TestRuleMemo(unittest.TestCase):
+    def setUp(self):
+        self.constants = [{"id": i, "name": n} for i, n in enumerate(["Zeus", "Hera"])]
+        self.predicates = [
+            {
+                "name": "God",
+                "data": {"paramCount": 1, "truthTable": {"Zeus": True}},
+                "negated": False,
+            },
+            {
+                "name": "Human",
+                "data": {"paramCount": 1, "truthTable": {}},
+                "negated": False,
+            },
+            {
+                "name": "Parent",
+                "data": {"paramCount": 2, "truthTable": {"Zeus,Hera": True}},
+                "negated": False,
+            },
+        ]
+        self.rules = [
+            {"code": "Human(Hera)", "enabled": True, "number": 1},
+            {
+                "code": "forall(x) Parent(Zeus,x) -> God(x)",
+                "enabled": True,
+                "number": 2,
+            },
+            {"code": "forall(x) !Human(x)", "enabled": True, "number": 3},
+        ]
+
+    def evaluate(self, memo):
+        snapshot = memo.snapshot(["Zeus", "Hera"], self.predicates, "", ("evaluate",))
+        return evaluate_rules(
+            self.constants, self.predicates, self.rules, memo=snapshot
+        )
+
+    def test_patterns(self):
+        """Test indexing the atoms a rule can reach."""
+        formula = parse_formula("forall(x) Parent(Zeus,x) && Parent(x,f(Hera))")
+        self.assertEqual(
+            atom_patterns(formula),
+            {"Parent": frozenset([("Zeus", None), (None, None)])},
+        )
+
+    def test_only_reached_rules_are_recomputed(self):
+        """Test that an edit only recomputes the rules whose atoms it flips."""
+        memo = RuleMemo()
+        self.evaluate(memo)
+        self.assertEqual(memo.info()["misses"], 3)
+
+        # Parent(Hera,Zeus) is out of reach of Parent(Zeus,x)
+        self.predicates[2]["data"]["truthTable"]["Hera,Zeus"] = True
+        self.evaluate(memo)
+        self.assertEqual(memo.info()["hits"], 3)
+
+        # Human(Zeus) only reaches the quantified rule
+        self.predicates[1]["data"]["truthTable"] = {"Zeus": "True"}
+        results = self.evaluate(memo)
+        self.assertEqual(memo.info(), {"hits": 5, "misses": 4, "rules": 3})
+        self.assertFalse(results["Rule 3"]["satisfied"])
+
+        # God(Hera) decides rule 2; negating God flips every God atom
+        self.predicates[0]["data"]["truthTable"]["Hera"] = True
+        self.assertTrue(self.evaluate(memo)["Rule 2"]["satisfied"])
+        self.predicates[0]["negated"] = True
+        self.assertFalse(self.evaluate(memo)["Rule 2"]["satisfied"])
+        self.assertEqual(memo.info()["misses"], 6)
+
+    def test_matches_fresh_results(self):
+        """Test memoized results against recomputing every rule, over edits."""
+        rng = random.Random(5)
+        names = ["Zeus", "Hera", "Apollo"]
+        self.constants = [{"id": i, "name": n} for i, n in enumerate(names)]
+        self.rules = [
+            {"code": code, "enabled": True, "number": i + 1}
+            for i, code in enumerate(
+                [
+                    "forall(x) God(x) -> Human(x)",
+                    "exists(x) Parent(x,Apollo) && !God(x)",
+                    "Human(Zeus) || Parent(Hera,Zeus)",
+                    "forall(x) forall(y) Parent(x,y) -> !Parent(y,x)",
+                    "God(Apollo) <-> exists(y) Parent(Apollo,y)",
+                ]
+            )
+        ]
+        memo = RuleMemo()
+        for _ in range(60):
+            pred = rng.choice(self.predicates)
+            arity = pred["data"]["paramCount"]
+            key = ",".join(rng.choice(names) for _ in range(arity))
+            pred["data"]["truthTable"][key] = rng.choice([True, False, "True"])
+            predicates = copy.deepcopy(self.predicates)
+            evaluate = memo.snapshot(names, predicates, "", ("evaluate",))
+            explain = memo.snapshot(names, predicates, "", ("explain",))
+            self.assertEqual(
+                evaluate_rules(self.constants, predicates, self.rules, memo=evaluate),
+                evaluate_rules(self.constants, predicates, self.rules),
+            )
+            self.assertEqual(
+                explain_rules(self.constants, predicates, self.rules, memo=explain),
+                explain_rules(self.constants, predicates, self.rules),
+            )
+        self.assertGreater(memo.info()["hits"], memo.info()["misses"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+from fol_csp_solver import FOLCSPSolver
+import itertools
+import unittest
+
+
+class TestGroundingEstimator(unittest.TestCase):
+    def setUp(self):
+        self.predicates = [
+            {
+                "name": "Parent",
+                "data": {"paramCount": 2, "truthTable": {"Zeus,Hera": False}},
+                "negated": False,
+            },
+            {
+                "name": "God",
+                "data": {"paramCount": 1, "truthTable": {"Zeus": True}},
+                "negated": False,
+            },
+        ]
+
+    def model_size(
+        self, code, constants, num_new_constants, functions=(), symmetry=False
+    ):
+        solver = FOLCSPSolver(
+            constants,
+            self.predicates,
+            list(functions),
+            [{"code": code, "enabled": True}],
+            symmetry_breaking=symmetry,
+        )
+        formulas = {1: solver.parse_constraint(code)}
+        estimate = solver.estimate_grounding(formulas, num_new_constants)["total"]
+        actual = solver.solve(num_new_constants, stats=True)["stats"]["model"]
+        return estimate, actual
+
+    def test_exact_without_truth_tables(self):
+        """Test that the estimate is exact when no atom is known."""
+        codes = [
+            "forall(x) forall(y) Parent(x,y) -> God(x)",
+            "forall(x) exists(y) Parent(y,x) && !God(y)",
+            "!exists(x) God(x) && !(forall(y) Parent(x,y) -> God(y))",
+            "forall(x) forall(y) forall(z) Parent(x,y) && Parent(y,z) -> Parent(x,z)",
+            "forall(x) atmost(1,y) Parent(x,y)",
+            "!atleast(2,x) God(x)",
+            "exactly(2,x) God(x) && !exists(y) Parent(y,x)",
+            "forall(x) God(x) -> atleast(1,y) Parent(y,x) && !atmost(1,z) Parent(x,z)",
+        ]
+        for code in codes:
+            # A quantifier over a single constant needs no literal of its own
+            for k, symmetry in itertools.product((2, 4, 9), (False, True)):
+                estimate, actual = self.model_size(code, [], k, symmetry=symmetry)
+                for measure in ("variables", "constraints"):
+                    self.assertEqual(
+                        estimate[measure], actual[measure], (code, k, symmetry)
+                    )
+
+    def test_upper_bound_with_truth_tables(self):
+        """Test that partial evaluation only ever shrinks the estimate."""
+        constants = [{"id": 1, "name": "Zeus"}, {"id": 2, "name": "Hera"}]
+        code = "forall(x) forall(y) Parent(x,y) -> God(x) || God(y)"
+        for k, symmetry in itertools.product((0, 3, 6), (False, True)):
+            estimate, actual = self.model_size(code, constants, k, symmetry=symmetry)
+            for measure in ("variables", "constraints"):
+                self.assertGreaterEqual(estimate[measure], actual[measure])
+
+    def test_upper_bound_with_functions(self):
+        """Test that function values and their constraints are covered."""
+        constants = [{"id": 1, "name": "Zeus"}, {"id": 2, "name": "Hera"}]
+        functions = [{"name": "spouse", "data": {"Zeus": "Hera", "Hera": "Zeus"}}]
+        code = (
+            "forall(x) God(spouse(x)) && Parent(spouse(spouse(x)),x) || x == spouse(x)"
+        )
+        for k in (1, 4):
+            estimate, actual = self.model_size(code, constants, k, functions)
+            for measure in ("variables", "constraints"):
+                self.assertGreaterEqual(estimate[measure], actual[measure])
+
+    def test_upper_bound_with_properties(self):
+        """Test that the constraints of declared properties are covered."""
+        constants = [{"id": 1, "name": "Zeus"}, {"id": 2, "name": "Hera"}]
+        code = "forall(x) exists(y) Parent(y,x) || God(x)"
+        for properties in (
+            ["symmetric", "reflexive"],
+            ["transitive", "irreflexive"],
+            ["antisymmetric", "functional"],
+        ):
+            self.predicates[0]["data"]["properties"] = properties
+            for k in (1, 4):
+                estimate, actual = self.model_size(code, constants, k)
+                for measure in ("variables", "constraints"):
+                    self.assertGreaterEqual(
+                        estimate[measure], actual[measure], (properties, k)
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
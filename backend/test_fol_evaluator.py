@@ -0,0 +1,393 @@
+from fol_csp_solver import FOLCSPSolver
+from fol_evaluator import Evaluator, TensorEvaluator, evaluate_rules, load_functions
+from fol_parser import parse_formula
+import random
+import unittest
+
+
+class TestFOLEvaluator(unittest.TestCase):
+    def setUp(self):
+        self.constants = [
+            {"id": 1, "name": "Zeus"},
+            {"id": 2, "name": "Hera"},
+            {"id": 3, "name": "Apollo"},
+            {"id": 4, "name": "Athena"},
+        ]
+        self.predicates = [
+            {
+                "name": "God",
+                "data": {
+                    "paramCount": 1,
+                    "truthTable": {
+                        "Zeus": True,
+                        "Hera": True,
+                        "Apollo": True,
+                        "Athena": True,
+                    },
+                },
+                "negated": False,
+            },
+            {
+                "name": "Human",
+                "data": {"paramCount": 1, "truthTable": {"Zeus": False}},
+                "negated": False,
+            },
+            {
+                "name": "Parent",
+                "data": {
+                    "paramCount": 2,
+                    "truthTable": {
+                        "Zeus,Apollo": True,
+                        "Hera,Apollo": True,
+                        "Zeus,Athena": True,
+                    },
+                },
+                "negated": False,
+            },
+            {
+                "name": "Likes",
+                "data": {
+                    "paramCount": 2,
+                    "truthTable": {
+                        "Zeus,Zeus": True,
+                        "Apollo,Apollo": True,
+                        "Apollo,Athena": True,
+                        "Athena,Apollo": True,
+                        "Athena,Athena": True,
+                    },
+                },
+                "negated": False,
+            },
+        ]
+        self.functions = [
+            {
+                "name": "spouse",
+                "data": 'def spouse(x):\n    if x == "Zeus":\n        return "Hera"\n'
+                '    elif x == "Hera":\n        return "Zeus"\n    else:\n'
+                "        return None",
+            }
+        ]
+
+    def evaluate(self, codes, **options):
+        rules = [
+            {"code": code, "enabled": True, "number": i + 1}
+            for i, code in enumerate(codes)
+        ]
+        return evaluate_rules(
+            self.constants,
+            self.predicates,
+            rules,
+            load_functions(self.functions),
+            **options,
+        )
+
+    def test_frontend_example(self):
+        """Test the rules of the frontend's default context."""
+        results = self.evaluate(
+            [
+                "God(Zeus)",
+                "Parent(Apollo, Zeus)",
+                "Human(Hera)",
+                "Human(spouse(Zeus))",
+                "forall(x) God(x) -> Human(x)",
+                "forall(x) exists(y) Likes(x, y)",
+            ]
+        )
+        self.assertEqual(
+            [results[f"Rule {i}"]["satisfied"] for i in range(1, 7)],
+            [True, False, False, False, False, False],
+        )
+        self.assertEqual(results["Rule 1"]["rule"], "God(Zeus)")
+        self.assertEqual(
+            results["Rule 4"]["evaluations"],
+            [{"predicate": "Human", "args": ["Hera"], "value": False}],
+        )
+
+    def test_short_circuit(self):
+        """Test that quantifiers stop at the first counterexample or witness."""
+        results = self.evaluate(
+            ["forall(x) God(x) -> Human(x)", "exists(x) exists(y) Parent(x,y)"],
+            trace="full",
+        )
+        # Zeus is already a counterexample
+        self.assertEqual(
+            [e["args"] for e in results["Rule 1"]["evaluations"]], [["Zeus"], ["Zeus"]]
+        )
+        # Parent(Zeus,Apollo) is the third atom tried
+        self.assertTrue(results["Rule 2"]["satisfied"])
+        self.assertEqual(len(results["Rule 2"]["evaluations"]), 3)
+
+    def test_witness(self):
+        """Test that only the atoms deciding the verdict are reported."""
+        results = self.evaluate(
+            [
+                "forall(x) forall(y) Parent(x,y) -> Likes(x,y) || Human(y)",
+                "exists(x) Human(x) || Parent(x,Zeus)",
+                "forall(x) exists(y) Likes(x,y)",
+                "exists(x) God(x) && exists(y) Parent(y,x)",
+            ]
+        )
+        # Zeus and Apollo are the first counterexample
+        witness = results["Rule 1"]["witness"]
+        self.assertFalse(results["Rule 1"]["satisfied"])
+        self.assertEqual(
+            witness["bindings"],
+            [{"variable": "x", "value": "Zeus"}, {"variable": "y", "value": "Apollo"}],
+        )
+        self.assertEqual(
+            [(a["predicate"], a["value"]) for a in witness["atoms"]],
+            [("Parent", True), ("Likes", False), ("Human", False)],
+        )
+        self.assertEqual(witness["atoms"], results["Rule 1"]["evaluations"])
+
+        # Nothing is reported for the instances without a witness
+        self.assertEqual(
+            results["Rule 2"]["witness"],
+            {
+                "bindings": [],
+                "atoms": [],
+                "exhausted": [
+                    {"quantifier": "exists", "variable": "x", "bindings": {}}
+                ],
+            },
+        )
+        witness = results["Rule 3"]["witness"]
+        self.assertEqual(witness["bindings"], [{"variable": "x", "value": "Hera"}])
+        self.assertEqual(
+            witness["exhausted"],
+            [{"quantifier": "exists", "variable": "y", "bindings": {"x": "Hera"}}],
+        )
+
+        # Zeus has no parent, so the operands deciding Apollo are kept
+        witness = results["Rule 4"]["witness"]
+        self.assertTrue(results["Rule 4"]["satisfied"])
+        self.assertEqual([b["value"] for b in witness["bindings"]], ["Apollo", "Zeus"])
+        self.assertEqual(
+            witness["atoms"],
+            [
+                {"predicate": "God", "args": ["Apollo"], "value": True},
+                {"predicate": "Parent", "args": ["Zeus", "Apollo"], "value": True},
+            ],
+        )
+
+    def test_counting_quantifiers(self):
+        """Test counting quantifiers and the witnesses they report."""
+        evaluator = Evaluator(["Zeus", "Hera", "Apollo", "Athena"], self.predicates, [])
+        cases = {
+            "forall(x) atmost(2,y) Parent(y,x)": True,
+            "forall(x) atmost(1,y) Parent(y,x)": False,
+            "exactly(2,x) exists(y) Parent(x,y)": True,
+            "atleast(3,x) exists(y) Parent(x,y)": False,
+            "exists(x) exactly(2,y) Parent(x,y)": True,
+            "atmost(0,x) Parent(x,x)": True,
+            "exactly(4,x) God(x)": True,
+            "atleast(5,x) God(x)": False,
+        }
+        for code, expected in cases.items():
+            self.assertEqual(evaluator.evaluate(parse_formula(code)), expected, code)
+
+        results = self.evaluate(
+            [
+                "atleast(2,x) exists(y) Parent(x,y)",
+                "atmost(1,y) Parent(y,Apollo)",
+                "exactly(1,x) Human(x)",
+            ]
+        )
+        # The first two parents are enough for the bound
+        witness = results["Rule 1"]["witness"]
+        self.assertTrue(results["Rule 1"]["satisfied"])
+        self.assertEqual(
+            [b["value"] for b in witness["bindings"]],
+            ["Zeus", "Apollo", "Hera", "Apollo"],
+        )
+        # One parent too many breaks it
+        witness = results["Rule 2"]["witness"]
+        self.assertFalse(results["Rule 2"]["satisfied"])
+        self.assertEqual(
+            witness["bindings"],
+            [{"variable": "y", "value": "Zeus"}, {"variable": "y", "value": "Hera"}],
+        )
+        self.assertEqual(
+            results["Rule 3"]["witness"]["exhausted"],
+            [{"quantifier": "exactly", "variable": "x", "bindings": {}}],
+        )
+
+    def test_bounded_and_sampled_traces(self):
+        """Test traces keeping only some of the atoms looked up."""
+        codes = ["forall(x) forall(y) Parent(x,y) || Likes(x,y) || x == y"]
+        full = self.evaluate(codes, trace="full")["Rule 1"]["evaluations"]
+        bounded = self.evaluate(codes, trace="bounded", trace_limit=3)["Rule 1"]
+        self.assertEqual(bounded["evaluations"], full[:3])
+        self.assertEqual(bounded["evaluationCount"], len(full))
+
+        sampled = self.evaluate(codes, trace="sampled", trace_limit=3)["Rule 1"]
+        self.assertEqual(len(sampled["evaluations"]), 3)
+        positions = [full.index(e) for e in sampled["evaluations"]]
+        self.assertEqual(positions, sorted(positions))
+
+        with self.assertRaises(ValueError):
+            self.evaluate(codes, trace="everything")
+
+    def test_negated_predicate_and_connectives(self):
+        """Test negated predicates, equality and the binary connectives."""
+        self.predicates[1]["negated"] = True
+        evaluator = Evaluator(
+            ["Zeus", "Hera", "Apollo", "Athena"],
+            self.predicates,
+            load_functions(self.functions),
+        )
+        cases = {
+            "forall(x) Human(x)": True,
+            "exists(x) God(x) && !Human(x)": False,
+            "Parent(Zeus,Apollo) <-> Parent(Hera,Apollo)": True,
+            "Likes(Hera,Hera) -> Likes(Hera,Zeus)": True,
+            "spouse(spouse(Zeus)) == Zeus": True,
+            "forall(x) forall(y) Parent(x,y) -> !(x == y)": True,
+            "exists(x) Parent(x,x) || Likes(x,x) && !God(x)": False,
+        }
+        for code, expected in cases.items():
+            self.assertEqual(evaluator.evaluate(parse_formula(code)), expected, code)
+
+    def test_lowercase_string_flags(self):
+        """Test that "true"/"false" strings are read as the solver reads them."""
+        self.predicates[0]["data"]["truthTable"] = {
+            "Zeus": "true",
+            "Hera": "TRUE",
+            "Apollo": "false",
+            "Athena": "False",
+        }
+        self.predicates[1]["negated"] = "true"
+        codes = ["God(Zeus) && God(Hera) && !God(Apollo)", "Human(Apollo)"]
+        rules = [
+            {"code": code, "enabled": "true", "number": i + 1}
+            for i, code in enumerate(codes)
+        ]
+        results = evaluate_rules(self.constants, self.predicates, rules)
+        self.assertTrue(results["Rule 1"]["satisfied"])
+        self.assertTrue(results["Rule 2"]["satisfied"])
+
+        # The solver agrees on the same payload
+        solver = FOLCSPSolver(self.constants, self.predicates, [], rules)
+        self.assertIsNotNone(solver.solve(num_new_constants=0))
+        rules[0]["code"] = "God(Apollo)"
+        self.assertIsNone(solver.solve(num_new_constants=0))
+
+    def test_tensor_matches_scalar(self):
+        """Test the tensor engine against the scalar one on random rules."""
+        rng = random.Random(7)
+        names = [f"C{i}" for i in range(5)]
+        predicates = []
+        for name, arity in [("P", 1), ("Q", 1), ("R", 2), ("T", 3)]:
+            table = {}
+            for _ in range(3 * 5 ** (arity - 1)):
+                key = ",".join(rng.choice(names) for _ in range(arity))
+                table[key] = rng.random() < 0.6
+            predicates.append(
+                {
+                    "name": name,
+                    "data": {"paramCount": arity, "truthTable": table},
+                    "negated": name == "Q",
+                }
+            )
+        functions = [{"name": "f", "data": {n: rng.choice(names) for n in names}}]
+        arities = {"P": 1, "Q": 1, "R": 2, "T": 3}
+
+        def term(bound):
+            roll = rng.random()
+            if bound and roll < 0.7:
+                return rng.choice(bound)
+            if roll < 0.85:
+                return rng.choice(names)
+            return f"f({term(bound)})"
+
+        def formula(bound, depth):
+            roll = rng.random()
+            if depth == 0 or roll < 0.25:
+                if rng.random() < 0.15:
+                    return f"{term(bound)} == {term(bound)}"
+                name = rng.choice(sorted(arities))
+                args = ",".join(term(bound) for _ in range(arities[name]))
+                return f"{name}({args})"
+            if roll < 0.5:
+                variable = rng.choice("xyzw")
+                quantifier = rng.choice(["forall", "exists", "atmost", "exactly"])
+                if quantifier in ("atmost", "exactly"):
+                    quantifier = rng.choice([quantifier, "atleast"])
+                    variable = f"{rng.randint(0, 3)},{variable}"
+                body = formula(bound + [variable[-1]], depth - 1)
+                return f"{quantifier}({variable}) ({body})"
+            if roll < 0.6:
+                return f"!({formula(bound, depth - 1)})"
+            connective = rng.choice(["&&", "||", "->", "<->"])
+            return (
+                f"({formula(bound, depth - 1)}) {connective} "
+                f"({formula(bound, depth - 1)})"
+            )
+
+        scalar = Evaluator(names, predicates, functions)
+        dense = TensorEvaluator(names, predicates, functions)
+        sparse = TensorEvaluator(names, predicates, functions, dense_limit=5)
+        for _ in range(300):
+            code = formula([], 4)
+            rule = parse_formula(code)
+            expected = scalar.evaluate(rule)
+            self.assertEqual(dense.evaluate(rule), expected, code)
+            self.assertEqual(sparse.evaluate(rule), expected, code)
+
+    def test_tensor_engine_fallback(self):
+        """Test that the tensor engine defers to the scalar one when needed."""
+        rules = [
+            {"code": "forall(x) God(x) -> Human(x)", "enabled": True, "number": 1},
+            {"code": "Human(spouse(Apollo))", "enabled": True, "number": 2},
+            {"code": "exists(x) Human(spouse(x))", "enabled": True, "number": 3},
+        ]
+        results = evaluate_rules(
+            self.constants,
+            self.predicates,
+            rules,
+            load_functions(self.functions),
+            engine="tensor",
+        )
+        self.assertFalse(results["Rule 1"]["satisfied"])
+        self.assertEqual(results["Rule 1"]["evaluations"], [])
+        self.assertIn("undefined", results["Rule 2"]["error"])
+        # Falls back to the scalar path, which reports the same error
+        self.assertEqual(results["Rule 3"], self.evaluate([rules[2]["code"]])["Rule 1"])
+
+        # A partial function raising on the arguments no rule reaches
+        functions = load_functions(
+            [
+                {
+                    "name": "spouse",
+                    "data": "def spouse(x):\n"
+                    "    return {'Zeus': 'Hera', 'Hera': 'Zeus'}[x]",
+                }
+            ]
+        )
+        codes = ["spouse(Zeus) == Hera", "exists(x) spouse(x) == Zeus"]
+        rules = [
+            {"code": code, "enabled": True, "number": i + 1}
+            for i, code in enumerate(codes)
+        ]
+        results = evaluate_rules(
+            self.constants, self.predicates, rules, functions, engine="tensor"
+        )
+        self.assertTrue(results["Rule 1"]["satisfied"])
+        self.assertTrue(results["Rule 2"]["satisfied"])
+
+        tensor = TensorEvaluator(["Zeus", "Hera"], self.predicates, max_cells=1)
+        self.assertFalse(tensor.supports(parse_formula("forall(x) God(x)")))
+
+    def test_errors(self):
+        """Test that rules that cannot be evaluated report an error."""
+        results = self.evaluate(
+            ["Titan(Zeus)", "Human(spouse(Apollo))", "God(Zeus", "Parent(Zeus)"]
+        )
+        for i in range(1, 5):
+            self.assertIn("error", results[f"Rule {i}"])
+            self.assertNotIn("satisfied", results[f"Rule {i}"])
+        self.assertIn("undefined", results["Rule 2"]["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,217 @@
+from fol_evaluator import Evaluator, load_functions
+from fol_explainer import _Circuit, explain, explain_rules
+from fol_parser import parse_formula
+import itertools
+import random
+import unittest
+
+
+class TestFOLExplainer(unittest.TestCase):
+    def setUp(self):
+        self.constants = [
+            {"id": 1, "name": "Zeus"},
+            {"id": 2, "name": "Hera"},
+            {"id": 3, "name": "Apollo"},
+        ]
+        self.predicates = [
+            {
+                "name": "God",
+                "data": {
+                    "paramCount": 1,
+                    "truthTable": {"Zeus": True, "Hera": True, "Apollo": True},
+                },
+                "negated": False,
+            },
+            {
+                "name": "Human",
+                "data": {"paramCount": 1, "truthTable": {"Apollo": True}},
+                "negated": False,
+            },
+            {
+                "name": "Parent",
+                "data": {
+                    "paramCount": 2,
+                    "truthTable": {"Zeus,Apollo": True, "Hera,Apollo": True},
+                },
+                "negated": False,
+            },
+        ]
+        self.functions = [
+            {
+                "name": "spouse",
+                "data": 'def spouse(x):\n    return {"Zeus": "Hera", "Hera": "Zeus"}'
+                ".get(x)",
+            }
+        ]
+
+    def explain(self, codes, **options):
+        rules = [
+            {"code": code, "enabled": True, "number": i + 1}
+            for i, code in enumerate(codes)
+        ]
+        results = explain_rules(
+            self.constants,
+            self.predicates,
+            rules,
+            load_functions(self.functions),
+            **options,
+        )
+        return [results[f"Rule {i + 1}"] for i in range(len(codes))]
+
+    def test_complete_reasons(self):
+        """Test the DNF of every minimal reason for a violation."""
+        results = self.explain(
+            [
+                "God(Zeus)",
+                "Human(spouse(Zeus))",
+                "forall(x) God(x) -> Human(x)",
+                "exists(x) Human(x) && Parent(x,x)",
+                "Human(Zeus) <-> God(Zeus)",
+                "Human(Zeus) && (Human(Hera) || !Human(Hera))",
+                "God(Zeus) && !God(Zeus)",
+            ]
+        )
+        self.assertEqual(
+            [r["result"] for r in results],
+            [
+                "False",
+                "~Human(Hera)",
+                "(God(Zeus) & ~Human(Zeus)) | (God(Hera) & ~Human(Hera))",
+                # One false conjunct per constant, Apollo's is Parent
+                "(~Human(Zeus) & ~Human(Hera) & ~Parent(Apollo, Apollo)) | "
+                "(~Parent(Zeus, Zeus) & ~Human(Hera) & ~Parent(Apollo, Apollo)) | "
+                "(~Human(Zeus) & ~Parent(Hera, Hera) & ~Parent(Apollo, Apollo)) | "
+                "(~Parent(Zeus, Zeus) & ~Parent(Hera, Hera) & ~Parent(Apollo, Apollo))",
+                "~Human(Zeus) & God(Zeus)",
+                # Human(Hera) || !Human(Hera) holds whatever Hera is
+                "~Human(Zeus)",
+                "True",
+            ],
+        )
+        self.assertTrue(all(r["complete"] for r in results))
+        self.assertEqual(
+            results[1]["reasons"],
+            [[{"predicate": "Human", "args": ["Hera"], "value": False}]],
+        )
+
+    def test_counting_quantifiers(self):
+        """Test the reasons for violated counts."""
+        results = self.explain(
+            [
+                "atmost(1,x) Parent(x,Apollo)",
+                "atleast(2,x) Human(x)",
+                "exactly(1,x) God(x) && !Human(x)",
+            ]
+        )
+        self.assertTrue(all(r["complete"] for r in results))
+        self.assertEqual(
+            [r["result"] for r in results],
+            [
+                "Parent(Zeus, Apollo) & Parent(Hera, Apollo)",
+                "~Human(Zeus) & ~Human(Hera)",
+                # Apollo is human, which leaves two gods for one place
+                "God(Zeus) & ~Human(Zeus) & God(Hera) & ~Human(Hera)",
+            ],
+        )
+
+    def test_matches_brute_force(self):
+        """Test the reasons against all subsets of small instances."""
+        rng = random.Random(5)
+        names = ["A", "B"]
+        predicates = [
+            {
+                "name": "P",
+                "data": {"paramCount": 1, "truthTable": {"A": True}},
+                "negated": False,
+            },
+            {
+                "name": "R",
+                "data": {"paramCount": 2, "truthTable": {"A,B": True, "B,B": True}},
+                "negated": True,
+            },
+        ]
+        evaluator = Evaluator(names, predicates)
+
+        def formula(bound, depth):
+            roll = rng.random()
+            if depth == 0 or roll < 0.25:
+                args = [rng.choice(bound or names) for _ in range(rng.choice([1, 2]))]
+                return f"{'P' if len(args) == 1 else 'R'}({','.join(args)})"
+            if roll < 0.45:
+                variable = rng.choice("xy")
+                quantifier = rng.choice(["forall", "exists", "atmost", "exactly"])
+                if quantifier in ("atmost", "exactly"):
+                    quantifier = rng.choice([quantifier, "atleast"])
+                    variable = f"{rng.randint(0, 2)},{variable}"
+                body = formula(bound + [variable[-1]], depth - 1)
+                return f"{quantifier}({variable}) ({body})"
+            if roll < 0.55:
+                return f"!({formula(bound, depth - 1)})"
+            connective = rng.choice(["&&", "||", "->", "<->"])
+            return (
+                f"({formula(bound, depth - 1)}) {connective} "
+                f"({formula(bound, depth - 1)})"
+            )
+
+        def holds(node, values):
+            if type(node) is bool:
+                return node
+            if node[0] == "atom":
+                return values[node[1]]
+            if node[0] == "not":
+                return not holds(node[1], values)
+            if node[0] == "iff":
+                return holds(node[1], values) == holds(node[2], values)
+            if node[0] == "count":
+                count = sum(holds(operand, values) for operand in node[3])
+                return node[1] <= count and (node[2] is None or count <= node[2])
+            operands = [holds(operand, values) for operand in node[1]]
+            return all(operands) if node[0] == "and" else any(operands)
+
+        checked = 0
+        while checked < 40:
+            rule = parse_formula(formula([], 4))
+            ground = evaluator.ground(rule)
+            atoms = _Circuit(ground).atoms
+            instance = {atom: evaluator.atom_value(atom) for atom in atoms}
+            if len(atoms) > 6 or evaluator.evaluate(rule):
+                continue
+
+            def sufficient(subset):
+                free = [atom for atom in atoms if atom not in subset]
+                for values in itertools.product([False, True], repeat=len(free)):
+                    if holds(ground, {**instance, **dict(zip(free, values))}):
+                        return False
+                return True
+
+            subsets = [
+                frozenset(subset)
+                for size in range(len(atoms) + 1)
+                for subset in itertools.combinations(atoms, size)
+                if sufficient(subset)
+            ]
+            minimal = {s for s in subsets if not any(t < s for t in subsets)}
+            explanation = explain(evaluator, rule, time_budget=10, max_reasons=100)
+            self.assertTrue(explanation["complete"])
+            self.assertEqual({frozenset(r) for r in explanation["reasons"]}, minimal)
+            checked += 1
+
+    def test_time_budget(self):
+        """Test that an exhausted budget still yields a sufficient reason."""
+        self.constants = [{"id": i, "name": f"C{i}"} for i in range(30)]
+        self.predicates[1]["data"]["truthTable"] = {}
+        results = self.explain(
+            ["forall(x) forall(y) Human(x) || Human(y) || x == y"],
+            time_budget=0,
+        )
+        self.assertFalse(results[0]["complete"])
+        self.assertEqual(len(results[0]["reasons"]), 1)
+        self.assertEqual(results[0]["result"], "~Human(C0) & ~Human(C1)")
+
+        results = self.explain(["Titan(Zeus)", "Human(spouse(Apollo))"])
+        self.assertIn("Titan", results[0]["error"])
+        self.assertIn("undefined", results[1]["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
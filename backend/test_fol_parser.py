@@ -0,0 +1,131 @@
+from fol_parser import (
+    And,
+    Constant,
+    Count,
+    Equal,
+    Exists,
+    Forall,
+    FOLSyntaxError,
+    FunctionTerm,
+    Iff,
+    Implies,
+    Not,
+    Or,
+    Predicate,
+    Variable,
+    free_variables,
+    parse_formula,
+)
+import unittest
+
+
+class TestFOLParser(unittest.TestCase):
+    def test_predicate(self):
+        """Test parsing a ground predicate."""
+        self.assertEqual(
+            parse_formula("Parent(Zeus, Apollo)"),
+            Predicate("Parent", (Constant("Zeus"), Constant("Apollo"))),
+        )
+
+    def test_quantifier_scope(self):
+        """Test that a quantifier body extends over the whole implication."""
+        formula = parse_formula("forall(x) God(x) -> !Human(x)")
+        x = (Variable("x"),)
+        self.assertEqual(
+            formula,
+            Forall("x", Implies(Predicate("God", x), Not(Predicate("Human", x)))),
+        )
+
+    def test_precedence(self):
+        """Test that && binds tighter than || which binds tighter than ->."""
+        formula = parse_formula("A(X) || B(X) && C(X) -> D(X)")
+        a, b, c, d = (Predicate(n, (Constant("X"),)) for n in "ABCD")
+        self.assertEqual(formula, Implies(Or((a, And((b, c)))), d))
+
+    def test_implication_is_right_associative(self):
+        """Test that chained implications group to the right."""
+        formula = parse_formula("A(X) -> B(X) -> C(X)")
+        a, b, c = (Predicate(n, (Constant("X"),)) for n in "ABC")
+        self.assertEqual(formula, Implies(a, Implies(b, c)))
+
+    def test_parentheses_and_iff(self):
+        """Test parenthesised sub-formulas and biconditionals."""
+        formula = parse_formula("exists(y) (A(y) || B(y)) <-> C(y)")
+        y = (Variable("y"),)
+        self.assertEqual(
+            formula,
+            Exists(
+                "y",
+                Iff(Or((Predicate("A", y), Predicate("B", y))), Predicate("C", y)),
+            ),
+        )
+
+    def test_counting_quantifiers(self):
+        """Test counting quantifiers and the bounds they stand for."""
+        formula = parse_formula("forall(x) atmost(2, y) Parent(y,x)")
+        self.assertEqual(
+            formula,
+            Forall(
+                "x",
+                Count(
+                    "atmost",
+                    2,
+                    "y",
+                    Predicate("Parent", (Variable("y"), Variable("x"))),
+                ),
+            ),
+        )
+        self.assertEqual(formula.body.bounds(), (0, 2))
+        self.assertEqual(parse_formula("atleast(1,x) God(x)").bounds(), (1, None))
+        self.assertEqual(parse_formula("exactly(3,x) God(x)").bounds(), (3, 3))
+        self.assertEqual(parse_formula(str(formula)), formula)
+
+        """Test equality between function terms and constants."""
+        self.assertEqual(
+            parse_formula("spouse(Zeus) == Hera"),
+            Equal(FunctionTerm("spouse", (Constant("Zeus"),)), Constant("Hera")),
+        )
+
+    def test_multiple_lines_are_conjoined(self):
+        """Test that a multi-line rule is the conjunction of its lines."""
+        formula = parse_formula("God(Zeus)\nGod(Hera)\n")
+        self.assertIsInstance(formula, And)
+        self.assertEqual(len(formula.operands), 2)
+
+    def test_round_trip(self):
+        """Test that printing an AST gives text that parses to the same AST."""
+        text = "forall(x) forall(y) (Parent(x,y) && !God(y)) -> exists(z) Likes(z,x)"
+        formula = parse_formula(text)
+        self.assertEqual(parse_formula(str(formula)), formula)
+
+    def test_free_variables(self):
+        """Test computing free variables."""
+        formula = parse_formula("forall(x) Parent(x,y)")
+        self.assertEqual(free_variables(formula), frozenset(["y"]))
+
+    def test_parse_cache(self):
+        """Test that the same rule text is parsed once and shares one AST."""
+        text = "forall(x) God(x) -> exists(y) Parent(y,x)"
+        formula = parse_formula(text)
+        hits = parse_formula.cache_info().hits
+        self.assertIs(parse_formula(text), formula)
+        self.assertEqual(hits + 1, parse_formula.cache_info().hits)
+        self.assertEqual(hash(formula), hash(parse_formula(str(formula))))
+
+    def test_syntax_errors(self):
+        """Test that malformed rules raise FOLSyntaxError."""
+        for text in [
+            "God(Zeus",
+            "God(Zeus) &&",
+            "forall(X) God(X)",
+            "God(Zeus) $",
+            "atmost(x) God(x)",
+            "exactly(-1,x) God(x)",
+            "atleast(2,X) God(X)",
+        ]:
+            with self.assertRaises(FOLSyntaxError, msg=text):
+                parse_formula(text)
+
+
+if __name__ == "__main__":
+    unittest.main()
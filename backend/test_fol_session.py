@@ -0,0 +1,194 @@
+from fol_csp_solver import FOLCompileError, FOLCSPSolver
+import unittest
+
+
+class TestFOLSolverSession(unittest.TestCase):
+    def setUp(self):
+        self.constants = [
+            {"id": 1, "name": "Zeus"},
+            {"id": 2, "name": "Hera"},
+        ]
+        self.predicates = [
+            {
+                "name": "God",
+                "data": {"paramCount": 1, "truthTable": {"Zeus": True, "Hera": True}},
+                "negated": False,
+            },
+            {
+                "name": "Human",
+                "data": {
+                    "paramCount": 1,
+                    "truthTable": {"Zeus": False, "Hera": False},
+                },
+                "negated": False,
+            },
+            {
+                "name": "Parent",
+                "data": {"paramCount": 2, "truthTable": {"Zeus,Hera": False}},
+                "negated": False,
+            },
+        ]
+
+    def make_solver(self, codes):
+        constraints = [{"code": code, "enabled": True} for code in codes]
+        return FOLCSPSolver(self.constants, self.predicates, [], constraints)
+
+    def test_find_min_constants(self):
+        """Test growing the domain until three distinct humans exist."""
+        solver = self.make_solver(
+            [
+                "exists(x) exists(y) exists(z) Human(x) && Human(y) && Human(z)"
+                " && !(x == y) && !(y == z) && !(x == z)"
+            ]
+        )
+        self.assertIsNone(solver.solve(2))
+        self.assertIsNotNone(solver.solve(3))
+
+        session = solver.session()
+        solution = session.find_min_constants(5)
+        self.assertIsNotNone(solution)
+        self.assertEqual(
+            solution["new_constants"], ["NewConstant1", "NewConstant2", "NewConstant3"]
+        )
+        humans = [
+            c
+            for c in solution["new_constants"]
+            if solution["predicate_assignments"][f"Human({c})"]
+        ]
+        self.assertEqual(len(humans), 3)
+
+    def test_forall_covers_extended_constants(self):
+        """Test that universal rules apply to constants added later."""
+        session = self.make_solver(
+            [
+                "forall(x) God(x) || Human(x)",
+                "forall(x) forall(y) Parent(x,y) -> God(x)",
+                "forall(x) exists(y) Human(x) -> Parent(y,x)",
+            ]
+        ).session(1)
+        self.assertIsNotNone(session.solve())
+
+        self.assertEqual(session.extend(2), ["NewConstant2", "NewConstant3"])
+        solution = session.solve()
+        self.assertIsNotNone(solution)
+        assignments = solution["predicate_assignments"]
+        constants = ["Zeus", "Hera"] + solution["new_constants"]
+        for x in constants:
+            self.assertTrue(assignments[f"God({x})"] or assignments[f"Human({x})"])
+            if assignments[f"Human({x})"]:
+                self.assertTrue(any(assignments[f"Parent({y},{x})"] for y in constants))
+            for y in constants:
+                if assignments[f"Parent({x},{y})"]:
+                    self.assertTrue(assignments[f"God({x})"])
+
+    def test_extension_matches_fresh_model(self):
+        """Test that an extended session agrees with a model built from scratch."""
+        codes = [
+            "forall(x) Human(x) -> exists(y) Parent(y,x) && !Human(y)",
+            "forall(x) forall(y) Parent(x,y) -> !Parent(y,x)",
+            "exists(x) exists(y) Human(x) && Human(y) && !(x == y)",
+            "!exists(x) God(x) && Human(x)",
+        ]
+        solver = self.make_solver(codes)
+        session = solver.session()
+        for k in range(4):
+            if k:
+                session.extend(1)
+            self.assertEqual(session.solve() is None, solver.solve(k) is None, f"k={k}")
+
+    def test_counts_cover_extended_constants(self):
+        """Test that counting rules stay open to constants added later."""
+        codes = [
+            "atleast(3,x) Human(x)",
+            "atmost(3,x) God(x)",
+            "forall(x) God(x) || (exactly(1,y) Parent(y,x))",
+        ]
+        solver = self.make_solver(codes)
+        session = solver.session()
+        self.assertIsNone(session.solve())
+        for k in range(1, 5):
+            session.extend(1)
+            solution = session.solve()
+            self.assertEqual(solution is None, solver.solve(k) is None, f"k={k}")
+        assignments = solution["predicate_assignments"]
+        constants = ["Zeus", "Hera"] + solution["new_constants"]
+        self.assertGreaterEqual(sum(assignments[f"Human({x})"] for x in constants), 3)
+        self.assertLessEqual(sum(assignments[f"God({x})"] for x in constants), 3)
+        for x in constants:
+            parents = sum(assignments[f"Parent({y},{x})"] for y in constants)
+            self.assertTrue(parents == 1 or assignments[f"God({x})"])
+
+    def test_named_new_constants(self):
+        """Test that a session starts with every new constant a rule names."""
+        session = self.make_solver(["Human(NewConstant2)"]).session()
+        self.assertEqual(session.new_constants, ["NewConstant1", "NewConstant2"])
+        self.assertTrue(session.solve()["predicate_assignments"]["Human(NewConstant2)"])
+
+    def test_toggle_constraints_and_unsat_core(self):
+        """Test toggling rules without rebuilding and reporting unsat cores."""
+        constraints = [
+            {"code": "Human(Zeus)", "enabled": True, "number": 1},
+            {"code": "forall(x) God(x)", "enabled": True, "number": 2},
+            {"code": "exists(x) !God(x)", "enabled": True, "number": 3},
+            {"code": "exists(x) Human(x)", "enabled": False, "number": 4},
+        ]
+        solver = FOLCSPSolver(self.constants, self.predicates, [], constraints)
+        session = solver.session(1)
+        model = session.model
+
+        self.assertIsNone(session.solve())
+        self.assertIn(1, session.unsat_core)
+        self.assertNotIn(4, session.unsat_core)
+
+        session.set_enabled(1, False)
+        self.assertIsNone(session.solve())
+        self.assertTrue({2, 3} <= set(session.unsat_core))
+        self.assertNotIn(1, session.unsat_core)
+
+        session.set_enabled(3, False)
+        session.set_enabled(4, True)
+        solution = session.solve()
+        self.assertIsNotNone(solution)
+        self.assertEqual(session.unsat_core, [])
+        self.assertTrue(solution["predicate_assignments"]["God(NewConstant1)"])
+        self.assertTrue(solution["predicate_assignments"]["Human(NewConstant1)"])
+        self.assertIs(session.model, model)
+
+    def test_enabling_invalid_rule(self):
+        """Test that a disabled rule with a syntax error only fails once enabled."""
+        constraints = [{"code": "God(Zeus", "enabled": False, "number": 7}]
+        solver = FOLCSPSolver(self.constants, self.predicates, [], constraints)
+        session = solver.session()
+        self.assertIsNotNone(session.solve())
+        with self.assertRaises(FOLCompileError):
+            session.set_enabled(7)
+
+    def test_function_terms_rejected(self):
+        """Test that sessions refuse function terms, whose domain is fixed."""
+        functions = [{"name": "spouse", "data": {"Zeus": "Hera"}}]
+        constraints = [{"code": "God(spouse(Zeus))", "enabled": True, "number": 1}]
+        solver = FOLCSPSolver(self.constants, self.predicates, functions, constraints)
+        with self.assertRaises(FOLCompileError):
+            solver.session()
+
+    def test_predicate_properties(self):
+        """Test that declared properties cover constants added later."""
+        self.predicates[2]["data"]["properties"] = ["transitive", "irreflexive"]
+        session = self.make_solver(
+            ["exists(x) Parent(Hera,x) && Parent(x,Zeus)"]
+        ).session()
+        # Neither Zeus nor Hera can be their own parent
+        self.assertIsNone(session.solve())
+
+        session.extend(1)
+        solution = session.solve()
+        self.assertIsNotNone(solution)
+        assignments = solution["predicate_assignments"]
+        self.assertTrue(assignments["Parent(Hera,NewConstant1)"])
+        self.assertTrue(assignments["Parent(NewConstant1,Zeus)"])
+        self.assertTrue(assignments["Parent(Hera,Zeus)"])
+        self.assertFalse(assignments["Parent(NewConstant1,NewConstant1)"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+from concurrent.futures import ThreadPoolExecutor
+import io
+import json
+import unittest
+
+from solver_worker import handle, serve
+
+
+class TestSolverWorker(unittest.TestCase):
+    def setUp(self):
+        self.params = {
+            "constants": [{"id": 1, "name": "Zeus"}],
+            "predicates": [
+                {
+                    "name": "God",
+                    "data": {"paramCount": 1, "truthTable": {"Zeus": True}},
+                    "negated": False,
+                }
+            ],
+            "functions": [],
+            "constraints": [{"code": "exists(x) !God(x)", "enabled": True}],
+            "numConstants": 1,
+        }
+
+    def test_generate(self):
+        """Test answering a generate request."""
+        response = handle(
+            json.dumps({"id": 7, "method": "generate", "params": self.params})
+        )
+        self.assertEqual(response["id"], 7)
+        result = response["result"]
+        self.assertTrue(result["success"])
+        self.assertFalse(
+            result["solution"]["predicate_assignments"]["God(NewConstant1)"]
+        )
+
+        self.params["numConstants"] = 0
+        result = handle(
+            json.dumps({"id": 8, "method": "generate", "params": self.params})
+        )
+        self.assertFalse(result["result"]["success"])
+
+    def test_generate_checks_properties_without_rules(self):
+        """Test that declared properties are checked when no rule is enabled."""
+        self.params["predicates"].append(
+            {
+                "name": "R",
+                "data": {
+                    "paramCount": 2,
+                    "truthTable": {"Zeus,Zeus": True},
+                    "properties": ["irreflexive"],
+                },
+                "negated": False,
+            }
+        )
+        self.params["constraints"] = []
+        result = handle(
+            json.dumps({"id": 9, "method": "generate", "params": self.params})
+        )
+        self.assertFalse(result["result"]["success"])
+
+        self.params["predicates"][1]["data"]["truthTable"] = {"Zeus,Zeus": False}
+        result = handle(
+            json.dumps({"id": 10, "method": "generate", "params": self.params})
+        )
+        self.assertTrue(result["result"]["success"])
+        assignments = result["result"]["solution"]["predicate_assignments"]
+        self.assertFalse(assignments["R(NewConstant1,NewConstant1)"])
+
+    def test_evaluate(self):
+        """Test answering an evaluate request."""
+        self.params["constraints"].append(
+            {"code": "forall(x) God(x)", "enabled": True, "number": 5}
+        )
+        response = handle(
+            json.dumps({"id": 3, "method": "evaluate", "params": self.params})
+        )
+        results = response["result"]
+        self.assertFalse(results["Rule 1"]["satisfied"])
+        self.assertTrue(results["Rule 5"]["satisfied"])
+
+        self.params["engine"] = "tensor"
+        response = handle(
+            json.dumps({"id": 4, "method": "evaluate", "params": self.params})
+        )
+        self.assertEqual(
+            {rule: result["satisfied"] for rule, result in response["result"].items()},
+            {"Rule 1": False, "Rule 5": True},
+        )
+
+    def test_explain(self):
+        """Test answering an explain request."""
+        response = handle(
+            json.dumps({"id": 5, "method": "explain", "params": self.params})
+        )
+        self.assertEqual(response["result"]["Rule 1"]["result"], "God(Zeus)")
+
+    def test_errors(self):
+        """Test that bad requests and failing rules get error responses."""
+        self.assertIsNone(handle("not json")["id"])
+        self.assertIn("error", handle(json.dumps({"id": 1, "method": "nope"})))
+
+        self.params["constraints"] = [{"code": "Titan(Zeus)", "enabled": True}]
+        response = handle(
+            json.dumps({"id": 2, "method": "generate", "params": self.params})
+        )
+        self.assertFalse(response["result"]["success"])
+        self.assertIn("Titan", response["result"]["error"])
+
+    def test_syntax_errors(self):
+        """Test that rules that do not parse are reported, not solved."""
+        self.params["constraints"].append(
+            {"code": "God(Zeus", "enabled": True, "number": 2}
+        )
+        result = handle(
+            json.dumps({"id": 1, "method": "generate", "params": self.params})
+        )["result"]
+        self.assertTrue(result["success"])
+        self.assertEqual(
+            [(c["number"], c["code"]) for c in result["failedConstraints"]],
+            [(2, "God(Zeus")],
+        )
+        self.assertIn("Syntax error", result["failedConstraints"][0]["error"])
+
+        results = handle(
+            json.dumps({"id": 2, "method": "evaluate", "params": self.params})
+        )["result"]
+        self.assertFalse(results["Rule 2"]["satisfied"])
+        self.assertIn("Syntax error", results["Rule 2"]["error"])
+
+        self.params["constraints"] = self.params["constraints"][1:]
+        result = handle(
+            json.dumps({"id": 3, "method": "generate", "params": self.params})
+        )["result"]
+        self.assertEqual(result["solution"]["new_constants"], ["NewConstant1"])
+        self.assertEqual(len(result["failedConstraints"]), 1)
+
+    def test_serve_concurrently(self):
+        """Test serving a stream of requests, matching responses by id."""
+        requests = [
+            json.dumps({"id": i, "method": "generate", "params": self.params})
+            for i in range(8)
+        ]
+        requests.insert(3, "")
+        output = io.StringIO()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            serve(iter(line + "\n" for line in requests), output, executor)
+
+        responses = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(sorted(r["id"] for r in responses), list(range(8)))
+        self.assertTrue(all(r["result"]["success"] for r in responses))
+
+
+if __name__ == "__main__":
+    unittest.main()
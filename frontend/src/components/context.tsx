@@ -24,6 +24,9 @@ type Predicate = {
   data: {
     paramCount: number;
     truthTable: Record<string, boolean>;
+    // Declared properties, e.g. "symmetric" or "transitive"; see
+    // fol_csp_solver.PREDICATE_PROPERTIES
+    properties?: string[];
   };
   negated: boolean;
 };